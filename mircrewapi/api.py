@@ -1,11 +1,22 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-import uvicorn
+from fastapi.middleware.gzip import GZipMiddleware
 from starlette.responses import RedirectResponse
 
 from mircrewapi.container.default_container import DefaultContainer
+from mircrewapi.controller.admin_controller import AdminController
 from mircrewapi.controller.example_controller import ExampleController
+from mircrewapi.controller.metrics_controller import MetricsController
 from mircrewapi.controller.search_controller import SearchController
+from mircrewapi.controller.suggest_controller import SuggestController
+from mircrewapi.controller.torznab_controller import TorznabController
+from mircrewapi.controller.watchlist_controller import WatchlistController
+from mircrewapi.manager.metrics_manager import MetricsManager
+from mircrewapi.manager.profile_manager import ProfileManager
+from mircrewapi.middleware.profiling_middleware import ProfilingMiddleware
+from mircrewapi.middleware.request_id_middleware import RequestIdMiddleware
+from mircrewapi.middleware.server_timing_middleware import ServerTimingMiddleware
+from mircrewapi.service.admin_service import AdminService
 
 
 app = FastAPI(
@@ -17,9 +28,19 @@ app = FastAPI(
 default_container: DefaultContainer = DefaultContainer.getInstance()
 example_controller: ExampleController = default_container.get(ExampleController)
 search_controller: SearchController = default_container.get(SearchController)
+metrics_controller: MetricsController = default_container.get(MetricsController)
+watchlist_controller: WatchlistController = default_container.get(WatchlistController)
+suggest_controller: SuggestController = default_container.get(SuggestController)
+admin_controller: AdminController = default_container.get(AdminController)
+torznab_controller: TorznabController = default_container.get(TorznabController)
 
 app.include_router(example_controller.router)
 app.include_router(search_controller.router)
+app.include_router(metrics_controller.router)
+app.include_router(watchlist_controller.router)
+app.include_router(suggest_controller.router)
+app.include_router(admin_controller.router)
+app.include_router(torznab_controller.router)
 
 app.add_middleware(
     CORSMiddleware,
@@ -27,7 +48,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "ETag", "Age", RequestIdMiddleware.HEADER],
 )
+if default_container.get_var("gzip_minimum_size") > 0:
+    app.add_middleware(GZipMiddleware, minimum_size=default_container.get_var("gzip_minimum_size"))
+app.add_middleware(
+    ProfilingMiddleware,
+    profile_manager=default_container.get(ProfileManager),
+    authorize=default_container.get(AdminService).authorize,
+    metrics_manager=default_container.get(MetricsManager),
+)
+app.add_middleware(
+    ServerTimingMiddleware,
+    metrics_manager=default_container.get(MetricsManager),
+)
+app.add_middleware(RequestIdMiddleware)
 
 
 @app.get("/", include_in_schema=False)
@@ -41,6 +76,8 @@ async def health_check():
 
 
 if __name__ == "__main__":
+    import uvicorn
+
     uvicorn.run(
         "mircrewapi.api:app",
         host=default_container.get_var("api_host"),
@@ -1,21 +1,25 @@
 import click
 
-from mircrewapi.command.example_command import ExampleCommand
-from mircrewapi.container.default_container import DefaultContainer
-
-
-@click.group()
+from mircrewapi.command.lazy_command_group import LazyCommandGroup
+
+# Commands are resolved through the container only when invoked, so `--help`
+# and unrelated commands do not pay for building every dependency.
+COMMANDS = {
+    "example": "mircrewapi.command.example_command:ExampleCommand",
+    "loadtest": "mircrewapi.command.load_test_command:LoadTestCommand",
+    "mock-upstream": "mircrewapi.command.mock_upstream_command:MockUpstreamCommand",
+    "reparse": "mircrewapi.command.reparse_command:ReparseCommand",
+    "snapshot-export": "mircrewapi.command.snapshot_export_command:SnapshotExportCommand",
+    "snapshot-import": "mircrewapi.command.snapshot_import_command:SnapshotImportCommand",
+    "warm": "mircrewapi.command.warm_command:WarmCommand",
+}
+
+
+@click.group(cls=LazyCommandGroup, lazy_commands=COMMANDS)
 def cli():
     """Command line entrypoint for the boilerplate."""
     pass
 
 
-# Resolve dependencies via container, similar to API setup
-default_container = DefaultContainer.getInstance()
-
-example_command: ExampleCommand = default_container.get(ExampleCommand)
-cli.add_command(example_command.to_click_command())
-
-
 if __name__ == '__main__':
     cli()
@@ -1,20 +1,37 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import json
 import logging
 from pathlib import Path
-from typing import Iterable
-from urllib.parse import parse_qs, urljoin, urlparse
-
-import requests
-from bs4 import BeautifulSoup
-from camoufox.async_api import AsyncCamoufox
+import threading
+from typing import TYPE_CHECKING, Iterable
+from urllib.parse import parse_qs, quote_plus, urljoin, urlparse
 
 from mircrewapi.manager.cache_manager import CacheManager
+from mircrewapi.manager.circuit_breaker import CircuitBreaker, UpstreamUnavailableError
+from mircrewapi.manager.memory_watchdog import MemoryWatchdog
+from mircrewapi.manager.metrics_manager import MetricsManager
+from mircrewapi.manager.profile_manager import ProfileManager
+from mircrewapi.manager.page_archive_manager import PageArchiveManager
+from mircrewapi.manager.upstream_budget import UpstreamBudget
 from mircrewapi.model.client.post_result import PostResult
 from mircrewapi.model.client.search_result import SearchResult
+from mircrewapi.parser.magnet_parser import MagnetParser
+from mircrewapi.parser.release_title_parser import ReleaseTitleParser
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+    import requests
+
+
+def _soup(html: str) -> BeautifulSoup:
+    # bs4 is imported on first parse so that importing the client stays cheap.
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(html, "html.parser")
 
 
 @dataclass(frozen=True)
@@ -26,62 +43,241 @@ class _LoginTokens:
 class MircrewClient:
     """Client for Mircrew interactions."""
 
-    _BASE_URL = "https://mircrew-releases.org"
-    _INDEX_URL = f"{_BASE_URL}/index.php"
-    _LOGIN_URL = f"{_BASE_URL}/ucp.php?mode=login"
-    _SEARCH_URL = f"{_BASE_URL}/search.php"
+    DEFAULT_BASE_URL = "https://mircrew-releases.org"
     _COOKIE_TTL = timedelta(hours=12)
-    _QUALITY_KEYWORDS = (
-        "2160p",
-        "1080p",
-        "720p",
-        "480p",
-        "4k",
-        "x265",
-        "x264",
-    )
     _STATE_FILENAME = "mircrew_state.json"
+    _CHALLENGE_STATUSES = (403, 429, 503)
+    _NO_RESULTS_MARKERS = ("no suitable matches", "nessun risultato", "nessun argomento")
+    _CHALLENGE_SCRIPT_MARKERS = (
+        "/cdn-cgi/challenge-platform/",
+        "cf_chl_opt",
+        "cf-chl-",
+    )
+    _CHALLENGE_TITLE_MARKERS = (
+        "<title>just a moment...</title>",
+        "attention required! | cloudflare",
+        "ddos-guard",
+    )
 
-    def __init__(self, username: str, password: str, cache_manager: CacheManager | None = None):
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        cache_manager: CacheManager | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        metrics_manager: MetricsManager | None = None,
+        base_url: str = DEFAULT_BASE_URL,
+        upstream_budget: UpstreamBudget | None = None,
+        page_archive_manager: PageArchiveManager | None = None,
+        memory_watchdog: MemoryWatchdog | None = None,
+    ):
         self.username = username
         self.password = password
+        self._base_url = base_url.rstrip("/")
+        self._index_url = f"{self._base_url}/index.php"
+        self._login_url = f"{self._base_url}/ucp.php?mode=login"
+        self._search_url = f"{self._base_url}/search.php"
         self._cache_manager = cache_manager
-        self._session = requests.Session()
+        self._circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._metrics = metrics_manager or MetricsManager(enabled=False)
+        self._upstream_budget = upstream_budget or UpstreamBudget(rate_per_minute=0, max_concurrency=4)
+        self._login_lock = threading.Lock()
+        self._archive = page_archive_manager
+        self._memory_watchdog = memory_watchdog
+        self._title_parser = ReleaseTitleParser()
+        self._magnet_parser = MagnetParser()
+        self._http_session: requests.Session | None = None
+        self._session_lock = threading.Lock()
         self._cookie: str | None = None
         self._cookie_time: datetime | None = None
-        self._restore_cached_cookie()
+        self._open_browsers: list = []
+        self._launching_browsers = 0
+        self._browsers_lock = threading.Lock()
         self._logger = logging.getLogger(self.__class__.__name__)
-        self._session.cookies.set("cookieconsent_status", "dismiss")
 
     def search_posts(self, query: str) -> list[PostResult]:
-        self._ensure_login()
+        search_html = self._guarded(lambda: self._fetch_search_html(query))
+        with self._metrics.span("html_parse"):
+            return self._parse_search_results(search_html)
 
-        search_html = self._perform_browser_search(query)
-        soup = BeautifulSoup(search_html, "html.parser")
+    def get_magnets(self, post_id: str) -> list[SearchResult]:
+        post_url = self._build_post_url(post_id)
+        return self._guarded(lambda: self._fetch_magnets(post_url))
+
+    def build_post_url(self, post_id: str) -> str:
+        return self._build_post_url(post_id)
+
+    def session_age(self) -> timedelta | None:
+        """Age of the login cookie currently in use, or None before the first login."""
+        if not self._cookie_time:
+            return None
+        return datetime.utcnow() - self._cookie_time
+
+    def state_file_age(self) -> timedelta | None:
+        path = self._state_path()
+        if not path.exists():
+            return None
+        return datetime.now() - datetime.fromtimestamp(path.stat().st_mtime)
+
+    def browser_counts(self) -> tuple[int, int]:
+        """Return the number of open browsers and of their open contexts."""
+        browsers = list(self._open_browsers)
+        return len(browsers), sum(len(getattr(browser, "contexts", ())) for browser in browsers)
+
+    def browsers_active(self) -> int:
+        """Return open browsers plus launches in flight, whose processes already exist."""
+        with self._browsers_lock:
+            return len(self._open_browsers) + self._launching_browsers
+
+    def refresh_session(self) -> None:
+        """Drop the cookie, the cached cookie and the browser state, then log in again."""
+        with self._login_lock:
+            self._cookie = None
+            self._cookie_time = None
+            with self._session_lock:
+                self._http_session = None
+            if self._cache_manager:
+                self._cache_manager.delete("mircrew_cookie")
+            self._state_path().unlink(missing_ok=True)
+        self._guarded(self._ensure_login)
+
+    def parse_search_page(self, html: str) -> list[PostResult]:
+        """Parse a search results page, e.g. one read back from the page archive."""
+        return self._parse_search_results(html)
+
+    def parse_topic_page(self, html: str) -> list[SearchResult]:
+        """Parse the magnets of a topic page, e.g. one read back from the page archive."""
+        return self._parse_topic_html(html)
+
+    @property
+    def _session(self) -> requests.Session:
+        return self._http_session or self._ensure_session()
+
+    def _ensure_session(self) -> requests.Session:
+        """Create the HTTP session and restore the cached cookie on first upstream use."""
+        with self._session_lock:
+            if self._http_session is None:
+                import requests
+
+                session = requests.Session()
+                session.cookies.set("cookieconsent_status", "dismiss")
+                self._http_session = session
+                self._restore_cached_cookie()
+        return self._http_session
+
+    def _parse_search_results(self, html: str) -> list[PostResult]:
+        soup = _soup(html)
         results: list[PostResult] = []
         for row in soup.select("li.row"):
             link = row.select_one("a.topictitle")
             if not link or not link.get("href"):
                 continue
-            post_url = urljoin(self._BASE_URL, link["href"])
+            post_url = urljoin(self._base_url, link["href"])
             post_id = self._extract_post_id(post_url)
             if not post_id:
                 continue
             title = link.get_text(" ", strip=True)
-            if not self._has_quality_keyword(title):
+            release = self._title_parser.parse(title)
+            if not self._title_parser.is_quality(release, title):
                 continue
-            results.append(PostResult(id=post_id, title=title, url=post_url))
+            results.append(PostResult(id=post_id, title=title, url=post_url, release=release))
         return results
 
-    def get_magnets(self, post_id: str) -> list[SearchResult]:
+    def _guarded(self, operation):
+        """Run an upstream operation through the circuit breaker and the upstream budget."""
+        self._circuit_breaker.before_request()
+        try:
+            with self._upstream_budget.acquire() as waited:
+                self._metrics.observe("budget_wait", waited)
+                result = operation()
+        except UpstreamUnavailableError:
+            raise
+        except Exception:
+            self._circuit_breaker.release()
+            raise
+        self._circuit_breaker.record_success()
+        return result
+
+    def _fetch_search_html(self, query: str) -> str:
         self._ensure_login()
-        post_url = self._build_post_url(post_id)
+        search_html = self._perform_browser_search(query)
+        self._metrics.increment("upstream_bytes_total", len(search_html))
+        self._check_challenge(None, search_html)
+        self._archive_page(self._search_page_url(query), search_html, "search", query)
+        return search_html
+
+    def _fetch_magnets(self, post_url: str) -> list[SearchResult]:
+        self._ensure_login()
+        archived_html = self._revalidate_archived_page(post_url)
+        if archived_html is not None:
+            magnets = self._parse_topic_html(archived_html)
+            if magnets:
+                return magnets
         return self._extract_magnets(None, post_url)
 
-    def build_post_url(self, post_id: str) -> str:
-        return self._build_post_url(post_id)
+    def _archive_page(self, url: str, html: str, kind: str, ref: str, headers=None) -> None:
+        if self._archive is None:
+            return
+        try:
+            self._archive.store(
+                url,
+                html,
+                kind,
+                ref,
+                etag=headers.get("etag") if headers else None,
+                last_modified=headers.get("last-modified") if headers else None,
+            )
+        except Exception as exc:
+            self._logger.warning("Unable to archive %s: %s", url, exc)
+
+    def _revalidate_archived_page(self, url: str) -> str | None:
+        """Refresh an archived page with a conditional GET over the HTTP session.
+
+        Topics are only archived after the browser flow has thanked the post,
+        so a plain session request normally shows the magnets again without
+        launching a browser. Returns None when the caller must use the browser.
+        """
+        if self._archive is None:
+            return None
+        record = self._archive.get(url)
+        if record is None:
+            return None
+        headers = self._default_headers(referer=self._index_url)
+        headers.pop("cache-control", None)
+        if record.etag:
+            headers["if-none-match"] = record.etag
+        if record.last_modified:
+            headers["if-modified-since"] = record.last_modified
+        try:
+            with self._metrics.span("page_revalidate"):
+                response = self._session.get(url, headers=headers, timeout=30)
+        except Exception as exc:
+            self._logger.warning("Revalidating %s failed: %s", url, exc)
+            return None
+        self._metrics.increment("upstream_bytes_total", len(response.content))
+        if response.status_code == 304:
+            self._metrics.increment("archive_revalidations_total", result="not_modified")
+            self._archive.touch(url)
+            return self._archive.read(record)
+        if response.status_code != 200 or self._is_challenge_response(
+            response.status_code,
+            response.text,
+            response.headers,
+        ):
+            # A challenge on the plain session is not fatal: the browser may still pass.
+            self._metrics.increment("archive_revalidations_total", result="fallback")
+            return None
+        self._metrics.increment("archive_revalidations_total", result="modified")
+        self._archive_page(url, response.text, record.kind, record.ref, response.headers)
+        return response.text
 
     def _ensure_login(self) -> None:
+        # Parallel callers (e.g. the warm command) must not log in concurrently.
+        with self._login_lock:
+            self._ensure_login_locked()
+
+    def _ensure_login_locked(self) -> None:
+        self._ensure_session()
         if self._cookie and self._cookie_time:
             if datetime.utcnow() - self._cookie_time < self._COOKIE_TTL:
                 if self._is_logged_in():
@@ -99,18 +295,66 @@ class MircrewClient:
         # Headless flow already validated login and stored cookies.
         return
 
+    @asynccontextmanager
+    async def _browser(self):
+        """Launch a headless Camoufox browser, timing the launch."""
+        if self._memory_watchdog and self._memory_watchdog.enabled:
+            # Let running browsers finish and release memory before adding another.
+            waited = await asyncio.to_thread(self._memory_watchdog.wait_for_headroom)
+            self._metrics.observe("browser_memory_gate", waited)
+        self._metrics.increment("browser_launches_total")
+        from camoufox.async_api import AsyncCamoufox
+
+        manager = AsyncCamoufox(headless=True)
+        with self._browsers_lock:
+            self._launching_browsers += 1
+        try:
+            with self._metrics.span("browser_launch"):
+                browser = await manager.__aenter__()
+        except BaseException:
+            with self._browsers_lock:
+                self._launching_browsers -= 1
+            raise
+        with self._browsers_lock:
+            # Counted as launching until now so the watchdog never takes it for a leak.
+            self._launching_browsers -= 1
+            self._open_browsers.append(browser)
+        try:
+            yield browser
+        except BaseException as exc:
+            if not await manager.__aexit__(type(exc), exc, exc.__traceback__):
+                raise
+        else:
+            await manager.__aexit__(None, None, None)
+        finally:
+            with self._browsers_lock:
+                self._open_browsers.remove(browser)
+
+    async def _timed(self, name: str, awaitable):
+        with self._metrics.span(name):
+            return await awaitable
+
+    async def _goto(self, page, url: str):
+        response = await self._timed("page_goto", page.goto(url, wait_until="domcontentloaded"))
+        if response is not None:
+            length = response.headers.get("content-length")
+            if length and length.isdigit():
+                self._metrics.increment("upstream_bytes_total", int(length))
+        return response
+
     def _perform_browser_login(self) -> bool:
         self._logger.info("Starting headless login via Camoufox.")
+        self._metrics.increment("logins_total")
         screenshot_dir = self._ensure_screenshot_dir()
 
         async def _login() -> dict:
-            async with AsyncCamoufox(headless=True) as browser:
+            async with self._browser() as browser:
                 context = await browser.new_context()
                 page = await context.new_page()
-                await page.goto(self._LOGIN_URL, wait_until="domcontentloaded")
+                await self._goto(page, self._login_url)
                 await page.screenshot(path=str(screenshot_dir / "login_page.png"), full_page=True)
                 try:
-                    await page.wait_for_selector("form#login", timeout=10000)
+                    await self._timed("page_wait", page.wait_for_selector("form#login", timeout=10000))
                 except Exception:
                     html = await page.content()
                     self._logger.warning("Login form not found. Page length=%s", len(html))
@@ -124,7 +368,7 @@ class MircrewClient:
                 await page.check("form#login input[name='autologin']")
                 await page.check("form#login input[name='viewonline']")
                 await page.click("form#login input[type='submit']")
-                await page.wait_for_load_state("networkidle")
+                await self._timed("page_wait", page.wait_for_load_state("networkidle"))
                 await page.screenshot(path=str(screenshot_dir / "after_submit.png"), full_page=True)
 
                 error_text = None
@@ -137,7 +381,7 @@ class MircrewClient:
                 if error_text:
                     self._logger.warning("Login error text: %s", error_text.strip())
 
-                await page.goto(self._INDEX_URL, wait_until="domcontentloaded")
+                await self._goto(page, self._index_url)
                 await page.screenshot(path=str(screenshot_dir / "index_after_login.png"), full_page=True)
                 logout_el = page.locator('a[href^="./ucp.php?mode=logout&sid="]')
                 logged_in = await logout_el.count() > 0
@@ -148,7 +392,8 @@ class MircrewClient:
                 await browser.close()
                 return {"storage": storage, "logged_in": logged_in}
 
-        result = _run_async(_login())
+        with self._metrics.span("login"):
+            result = _run_async(_login())
         if not result or not isinstance(result, dict):
             return False
         storage_state = result.get("storage")
@@ -163,44 +408,64 @@ class MircrewClient:
 
     def _perform_browser_search(self, query: str) -> str:
         self._logger.info("Starting headless search via Camoufox.")
-        screenshot_dir = self._ensure_screenshot_dir()
 
         async def _search() -> str:
-            async with AsyncCamoufox(headless=True) as browser:
+            async with self._browser() as browser:
                 context = await browser.new_context(storage_state=str(self._state_path()))
                 page = await context.new_page()
-                await page.goto(self._INDEX_URL, wait_until="domcontentloaded")
-                await page.screenshot(path=str(screenshot_dir / "search_page.png"), full_page=True)
-
-                try:
-                    await page.wait_for_selector("#keywords", timeout=10000)
-                    await page.fill("#keywords", query)
-                    await page.click(".button-search")
-                    await page.wait_for_load_state("networkidle")
-                except Exception:
-                    html = await page.content()
-                    await page.screenshot(path=str(screenshot_dir / "search_failed.png"), full_page=True)
-                    await context.close()
-                    await browser.close()
-                    return html
-
-                await page.screenshot(path=str(screenshot_dir / "search_results.png"), full_page=True)
-                html = await page.content()
+                html = await self._search_in_page(page, query)
                 await context.close()
-                await browser.close()
                 return html
 
         return _run_async(_search())
 
+    async def _search_in_page(self, page, query: str) -> str:
+        """Open the results URL directly; drive the index form only if that fails."""
+        html = await self._search_direct(page, query)
+        if html is not None:
+            self._metrics.increment("browser_searches_total", flow="direct")
+            return html
+        self._logger.info("Direct search URL did not render results, falling back to the search form.")
+        self._metrics.increment("browser_searches_total", flow="form")
+        return await self._search_via_form(page, query)
+
+    async def _search_direct(self, page, query: str) -> str | None:
+        response = await self._goto(page, self._search_page_url(query))
+        if response is not None and response.status in self._CHALLENGE_STATUSES:
+            self._check_challenge(response.status, await page.content())
+        if await page.locator("h2.searchresults-title").count():
+            return await page.content()
+        # A search without hits renders phpBB's message panel instead of the results heading.
+        if await page.locator("#message").count():
+            html = await page.content()
+            lowered = html.lower()
+            if any(marker in lowered for marker in self._NO_RESULTS_MARKERS):
+                return html
+        return None
+
+    async def _search_via_form(self, page, query: str) -> str:
+        await self._goto(page, self._index_url)
+        try:
+            await self._timed("page_wait", page.wait_for_selector("#keywords", timeout=10000))
+            await page.fill("#keywords", query)
+            await page.click(".button-search")
+            await self._timed("page_wait", page.wait_for_load_state("networkidle"))
+        except Exception:
+            screenshot_dir = self._ensure_screenshot_dir()
+            await page.screenshot(path=str(screenshot_dir / "search_failed.png"), full_page=True)
+        return await page.content()
+
     def _extract_magnets(self, title: str | None, post_url: str) -> list[SearchResult]:
         screenshot_dir = self._ensure_screenshot_dir()
 
-        async def _extract() -> list[SearchResult]:
-            async with AsyncCamoufox(headless=True) as browser:
+        async def _extract():
+            async with self._browser() as browser:
                 context = await browser.new_context(storage_state=str(self._state_path()))
                 page = await context.new_page()
-                await page.goto(post_url, wait_until="domcontentloaded")
+                response = await self._goto(page, post_url)
                 await page.screenshot(path=str(screenshot_dir / "post_page.png"), full_page=True)
+                if response is not None and response.status in self._CHALLENGE_STATUSES:
+                    self._check_challenge(response.status, await page.content())
 
                 thank_selector = (
                     ".post a:has(i.fa-thumbs-o-up),"
@@ -212,39 +477,39 @@ class MircrewClient:
                     try:
                         if await thank_button.first.is_visible():
                             await thank_button.first.click(timeout=1000)
-                            await page.wait_for_load_state("networkidle")
+                            await self._timed("page_wait", page.wait_for_load_state("networkidle"))
                             await page.screenshot(
                                 path=str(screenshot_dir / "post_after_thanks.png"),
                                 full_page=True,
                             )
-                            await page.goto(post_url, wait_until="domcontentloaded")
-                            await page.wait_for_load_state("networkidle")
+                            response = await self._goto(page, post_url)
+                            await self._timed("page_wait", page.wait_for_load_state("networkidle"))
                     except Exception as exc:
                         self._logger.warning("Unable to click thanks button: %s", exc)
 
-                results: list[SearchResult] = []
-                boxes = page.locator(".hidebox.unhide dd")
-                count = await boxes.count()
-                for idx in range(count):
-                    box = boxes.nth(idx)
-                    magnet_el = box.locator('a[href^="magnet:"]')
-                    if await magnet_el.count() == 0:
-                        continue
-                    href = await magnet_el.first.get_attribute("href")
-                    if not href:
-                        continue
-                    title_el = box.locator("p").first
-                    item_title = None
-                    if await title_el.count() > 0:
-                        item_title = (await title_el.text_content()) or ""
-                    item_title = (item_title or "").strip() or title or "Magnet"
-                    results.append(SearchResult(title=item_title, url=href))
-
+                html = await page.content()
                 await context.close()
                 await browser.close()
-                return results
+                return html, response.headers if response is not None else None
+
+        html, headers = _run_async(_extract())
+        self._archive_page(post_url, html, "topic", self._extract_post_id(post_url) or post_url, headers)
+        return self._parse_topic_html(html, title)
+
+    def _parse_topic_html(self, html: str, title: str | None = None) -> list[SearchResult]:
+        soup = _soup(html)
+        results: list[SearchResult] = []
+        for box in soup.select(".hidebox.unhide dd"):
+            magnet_el = box.select_one('a[href^="magnet:"]')
+            if magnet_el is None or not magnet_el.get("href"):
+                continue
+            title_el = box.find("p")
+            item_title = title_el.get_text().strip() if title_el else ""
+            results.append(self._magnet_parser.parse(magnet_el["href"], item_title or title or "Magnet"))
+        return results
 
-        return _run_async(_extract())
+    def _search_page_url(self, query: str) -> str:
+        return f"{self._search_url}?keywords={quote_plus(query)}&sr=topics"
 
     def _default_headers(self, referer: str | None = None) -> dict:
         headers = {
@@ -259,7 +524,7 @@ class MircrewClient:
         return headers
 
     def _parse_login_tokens(self, html: str) -> _LoginTokens:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = _soup(html)
         creation = soup.find("input", {"name": "creation_time"})
         form = soup.find("input", {"name": "form_token"})
         if not creation or not form:
@@ -267,20 +532,55 @@ class MircrewClient:
         return _LoginTokens(creation_time=creation["value"], form_token=form["value"])
 
     def _is_logged_in(self) -> bool:
-        response = self._session.get(
-            self._INDEX_URL,
-            headers=self._default_headers(referer=self._INDEX_URL),
-            timeout=30,
-        )
+        with self._metrics.span("login_check"):
+            response = self._session.get(
+                self._index_url,
+                headers=self._default_headers(referer=self._index_url),
+                timeout=30,
+            )
+        self._metrics.increment("upstream_bytes_total", len(response.content))
+        self._check_challenge(response.status_code, response.text, response.headers)
         if response.status_code == 403:
-            self._logger.warning("Login check blocked (403). Treating as not logged in.")
+            self._logger.warning("Login check forbidden (403). Treating as not logged in.")
             return False
         response.raise_for_status()
         return self._is_logged_in_html(response.text)
 
+    def _check_challenge(self, status_code: int | None, html: str, headers: dict | None = None) -> None:
+        if not self._is_challenge_response(status_code, html, headers):
+            return
+        self._logger.warning("Upstream challenge detected (status=%s).", status_code)
+        self._circuit_breaker.record_failure()
+        raise UpstreamUnavailableError(
+            "Upstream is serving a challenge page",
+            retry_after=self._circuit_breaker.retry_after(),
+        )
+
+    @classmethod
+    def _is_challenge_response(
+        cls,
+        status_code: int | None,
+        html: str,
+        headers: dict | None = None,
+    ) -> bool:
+        if headers and str(headers.get("cf-mitigated", "")).lower() == "challenge":
+            return True
+        if status_code is not None and status_code not in cls._CHALLENGE_STATUSES:
+            return False
+        if status_code == 429:
+            return True
+        lowered = (html or "")[:20000].lower()
+        if any(marker in lowered for marker in cls._CHALLENGE_SCRIPT_MARKERS):
+            return True
+        # Title markers are only trusted on error statuses: a post may be titled
+        # "Just a moment..." on a perfectly valid results page.
+        return status_code is not None and any(
+            marker in lowered for marker in cls._CHALLENGE_TITLE_MARKERS
+        )
+
     @staticmethod
     def _is_logged_in_html(html: str) -> bool:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = _soup(html)
         return soup.select_one('a[href*="ucp.php?mode=logout"]') is not None
 
     def _merge_set_cookies(self, response: requests.Response) -> str:
@@ -330,11 +630,10 @@ class MircrewClient:
         link = soup.select_one("ul.post-buttons li:nth-last-child(1) a")
         if not link or not link.get("href"):
             return None
-        return urljoin(self._BASE_URL, link["href"])
+        return urljoin(self._base_url, link["href"])
 
     def _has_quality_keyword(self, text: str) -> bool:
-        lowered = text.lower()
-        return any(keyword in lowered for keyword in self._QUALITY_KEYWORDS)
+        return self._title_parser.is_quality(self._title_parser.parse(text), text)
 
     def _extract_post_id(self, post_url: str) -> str | None:
         try:
@@ -348,7 +647,7 @@ class MircrewClient:
         return ids[0]
 
     def _build_post_url(self, post_id: str) -> str:
-        return f"{self._BASE_URL}/viewtopic.php?t={post_id}"
+        return f"{self._base_url}/viewtopic.php?t={post_id}"
 
     def _state_path(self) -> Path:
         if not self._cache_manager:
@@ -392,6 +691,7 @@ class MircrewClient:
 
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
+import contextvars
 
 
 def _run_async(coro):
@@ -399,5 +699,7 @@ def _run_async(coro):
         asyncio.get_running_loop()
     except RuntimeError:
         return asyncio.run(coro)
+    # Carry the caller's context (request spans, profiling) into the worker thread.
+    context = contextvars.copy_context()
     with ThreadPoolExecutor(max_workers=1) as executor:
-        return executor.submit(lambda: asyncio.run(coro)).result()
+        return executor.submit(context.run, ProfileManager.bind(asyncio.run), coro).result()
@@ -0,0 +1,44 @@
+from importlib import import_module
+
+import click
+
+
+class LazyCommandGroup(click.Group):
+    """Click group that imports a command and builds the container only when it is invoked.
+
+    ``lazy_commands`` maps a command name to ``"module:Class"`` of an
+    AbstractCommand subclass; `--help` only imports the command modules.
+    """
+
+    def __init__(self, *args, lazy_commands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.lazy_commands:
+            return super().get_command(ctx, cmd_name)
+        from mircrewapi.container.default_container import DefaultContainer
+
+        command = DefaultContainer.getInstance().get(self._command_class(cmd_name))
+        return command.to_click_command()
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in self.lazy_commands:
+                doc = self._command_class(name).__doc__ or ""
+                rows.append((name, doc.strip().splitlines()[0] if doc.strip() else ""))
+            else:
+                command = super().get_command(ctx, name)
+                if command is not None and not command.hidden:
+                    rows.append((name, command.get_short_help_str()))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def _command_class(self, cmd_name: str) -> type:
+        module_name, class_name = self.lazy_commands[cmd_name].split(":")
+        return getattr(import_module(module_name), class_name)
@@ -0,0 +1,76 @@
+from urllib.parse import quote
+
+import click
+from injector import inject
+
+from mircrewapi.command.abstract_command import AbstractCommand
+from mircrewapi.service.load_test_service import LoadTestService
+
+
+class LoadTestCommand(AbstractCommand):
+    """Drive the API in-process at several concurrency levels."""
+
+    command_name = "loadtest"
+
+    @inject
+    def __init__(self, load_test_service: LoadTestService):
+        self.load_test_service = load_test_service
+
+    def run(
+        self,
+        query: tuple[str, ...] = (),
+        post_id: tuple[str, ...] = (),
+        concurrency: tuple[int, ...] = (),
+        requests: int = 50,
+        clients: int = 0,
+        api_key: str | None = None,
+    ):
+        from mircrewapi.api import app
+
+        paths = [f"/search?q={quote(item)}" for item in query]
+        paths += [f"/post/{quote(item)}/magnets" for item in post_id]
+        if not paths:
+            raise click.UsageError("Pass at least one --query or --post-id.")
+
+        click.echo("concurrency requests failures    rps    p50ms    p95ms    p99ms  launches/req")
+        for level in concurrency or (1, 4, 16):
+            report = self.load_test_service.run(
+                app,
+                paths,
+                concurrency=level,
+                total_requests=requests,
+                clients=clients,
+                api_key=api_key,
+            )
+            click.echo(
+                f"{report.concurrency:>11} {report.requests:>8} {report.failures:>8} "
+                f"{report.throughput_rps:>6.1f} {report.p50_ms:>8.1f} {report.p95_ms:>8.1f} "
+                f"{report.p99_ms:>8.1f} {report.browser_launches_per_request:>13.3f}"
+            )
+
+    def register_options(self, fn):
+        fn = click.option("--query", "-q", multiple=True, help="Search query to request.")(fn)
+        fn = click.option("--post-id", "-p", multiple=True, help="Post id whose magnets to request.")(fn)
+        fn = click.option(
+            "--concurrency",
+            "-c",
+            multiple=True,
+            type=int,
+            help="Concurrency level (repeatable). Defaults to 1, 4 and 16.",
+        )(fn)
+        fn = click.option(
+            "--requests",
+            "-n",
+            type=int,
+            default=50,
+            show_default=True,
+            help="Requests per concurrency level.",
+        )(fn)
+        fn = click.option(
+            "--clients",
+            type=int,
+            default=0,
+            help="Distinct X-Client-Id values to spread requests over. Defaults to one per worker.",
+        )(fn)
+        fn = click.option("--api-key", default=None, help="Send requests as the API_CLIENTS client with this key.")(fn)
+        return fn
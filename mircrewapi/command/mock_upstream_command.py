@@ -0,0 +1,52 @@
+import click
+
+from mircrewapi.command.abstract_command import AbstractCommand
+
+
+class MockUpstreamCommand(AbstractCommand):
+    """Serve a local stand-in for the Mircrew forum."""
+
+    command_name = "mock-upstream"
+
+    def run(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8134,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        results: int = 60,
+        page_size: int = 25,
+    ):
+        import uvicorn
+
+        from mircrewapi.mock.mock_upstream_server import MockUpstreamServer
+
+        server = MockUpstreamServer(
+            latency=latency,
+            jitter=jitter,
+            results_per_query=results,
+            page_size=page_size,
+        )
+        click.echo(f"Mock upstream on http://{host}:{port} (set MIRCREW_BASE_URL to use it)")
+        uvicorn.run(server.app, host=host, port=port, log_level="warning")
+
+    def register_options(self, fn):
+        fn = click.option("--host", default="127.0.0.1", show_default=True)(fn)
+        fn = click.option("--port", type=int, default=8134, show_default=True)(fn)
+        fn = click.option(
+            "--latency",
+            type=float,
+            default=0.0,
+            show_default=True,
+            help="Seconds added to every response.",
+        )(fn)
+        fn = click.option(
+            "--jitter",
+            type=float,
+            default=0.0,
+            show_default=True,
+            help="Random extra seconds (uniform) added to every response.",
+        )(fn)
+        fn = click.option("--results", type=int, default=60, show_default=True, help="Results per query.")(fn)
+        fn = click.option("--page-size", type=int, default=25, show_default=True, help="Results per page.")(fn)
+        return fn
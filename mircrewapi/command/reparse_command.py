@@ -0,0 +1,31 @@
+import click
+from injector import inject
+
+from mircrewapi.command.abstract_command import AbstractCommand
+from mircrewapi.service.reparse_service import ReparseService
+
+
+class ReparseCommand(AbstractCommand):
+    """Rebuild the local index from the page archive, offline."""
+
+    command_name = "reparse"
+
+    @inject
+    def __init__(self, reparse_service: ReparseService):
+        self.reparse_service = reparse_service
+
+    def run(self, kind: str | None = None):
+        report = self.reparse_service.run(kind)
+        click.echo(
+            f"search_pages={report.search_pages} topic_pages={report.topic_pages} "
+            f"missing={report.missing_pages} posts={report.posts} magnets={report.magnets}"
+        )
+
+    def register_options(self, fn):
+        fn = click.option(
+            "--kind",
+            type=click.Choice(["search", "topic"]),
+            default=None,
+            help="Only reparse one kind of page.",
+        )(fn)
+        return fn
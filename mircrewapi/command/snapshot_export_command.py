@@ -0,0 +1,27 @@
+import click
+from injector import inject
+
+from mircrewapi.command.abstract_command import AbstractCommand
+from mircrewapi.service.snapshot_service import SnapshotService
+
+
+class SnapshotExportCommand(AbstractCommand):
+    """Write the cache and the post/magnet index to a snapshot file."""
+
+    command_name = "snapshot-export"
+
+    @inject
+    def __init__(self, snapshot_service: SnapshotService):
+        self.snapshot_service = snapshot_service
+
+    def run(self, path: str):
+        report = self.snapshot_service.export_snapshot(path)
+        counts = " ".join(f"{name}={count}" for name, count in report.records.items())
+        click.echo(
+            f"{counts} codec={report.codec} size={report.size_bytes / 1024:.1f}KiB "
+            f"duration={report.duration_seconds:.2f}s"
+        )
+
+    def register_options(self, fn):
+        fn = click.argument("path", type=click.Path(dir_okay=False))(fn)
+        return fn
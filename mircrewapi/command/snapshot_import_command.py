@@ -0,0 +1,29 @@
+import click
+from injector import inject
+
+from mircrewapi.command.abstract_command import AbstractCommand
+from mircrewapi.service.snapshot_service import SnapshotService
+
+
+class SnapshotImportCommand(AbstractCommand):
+    """Bootstrap the cache and the index from a snapshot file."""
+
+    command_name = "snapshot-import"
+
+    @inject
+    def __init__(self, snapshot_service: SnapshotService):
+        self.snapshot_service = snapshot_service
+
+    def run(self, path: str):
+        try:
+            report = self.snapshot_service.import_snapshot(path)
+        except ValueError as exc:
+            raise click.ClickException(str(exc)) from exc
+        counts = " ".join(
+            f"{name}={report.imported.get(name, 0)}/{count}" for name, count in report.records.items()
+        )
+        click.echo(f"{counts} duration={report.duration_seconds:.2f}s")
+
+    def register_options(self, fn):
+        fn = click.argument("path", type=click.Path(exists=True, dir_okay=False))(fn)
+        return fn
@@ -0,0 +1,47 @@
+import click
+from injector import inject
+
+from mircrewapi.command.abstract_command import AbstractCommand
+from mircrewapi.service.warm_service import WarmService
+
+
+class WarmCommand(AbstractCommand):
+    """Warm the cache and index from a list of queries and post ids."""
+
+    command_name = "warm"
+
+    @inject
+    def __init__(self, warm_service: WarmService):
+        self.warm_service = warm_service
+
+    def run(self, source=None, workers: int = 2, progress: str | None = None):
+        entries = source.read().splitlines()
+        report = self.warm_service.run(entries, workers=workers, progress_path=progress)
+
+        click.echo(
+            f"total={report.total} skipped={report.skipped} succeeded={report.succeeded} "
+            f"failed={report.failed} duration={report.duration_seconds:.1f}s "
+            f"throughput={report.throughput_per_minute:.1f}/min"
+        )
+        for entry, error in report.failures.items():
+            click.echo(f"failed: {entry}: {error}", err=True)
+        if report.failed:
+            raise SystemExit(1)
+
+    def register_options(self, fn):
+        fn = click.argument("source", type=click.File("r", encoding="utf-8"), default="-")(fn)
+        fn = click.option(
+            "--workers",
+            "-w",
+            type=int,
+            default=2,
+            show_default=True,
+            help="Parallel workers; upstream calls are still bounded by the upstream budget.",
+        )(fn)
+        fn = click.option(
+            "--progress",
+            type=click.Path(dir_okay=False),
+            default=None,
+            help="Progress file; completed entries are skipped when re-running with the same file.",
+        )(fn)
+        return fn
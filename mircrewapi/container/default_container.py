@@ -1,11 +1,32 @@
+import atexit
+from datetime import timedelta
 import os
 
 from dotenv import load_dotenv
-from injector import Injector
+from injector import CallableProvider, Injector, singleton
 
 from mircrewapi.client.mircrew_client import MircrewClient
 from mircrewapi.logger.app_logger import AppLogger
+from mircrewapi.manager.admission_manager import AdmissionManager
+from mircrewapi.manager.allocation_snapshot_manager import AllocationSnapshotManager
 from mircrewapi.manager.cache_manager import CacheManager
+from mircrewapi.manager.circuit_breaker import CircuitBreaker
+from mircrewapi.manager.index_manager import IndexManager
+from mircrewapi.manager.memory_watchdog import MemoryWatchdog
+from mircrewapi.manager.metrics_manager import MetricsManager
+from mircrewapi.manager.page_archive_manager import PageArchiveManager
+from mircrewapi.manager.prefetch_manager import PrefetchManager
+from mircrewapi.manager.profile_manager import ProfileManager
+from mircrewapi.manager.refresh_manager import RefreshManager
+from mircrewapi.manager.suggest_manager import SuggestManager
+from mircrewapi.manager.upstream_budget import UpstreamBudget
+from mircrewapi.manager.watchlist_manager import WatchlistManager
+from mircrewapi.service.admin_service import AdminService
+from mircrewapi.parser.release_filter_parser import ReleaseFilterParser
+from mircrewapi.parser.release_title_parser import ReleaseTitleParser
+from mircrewapi.service.search_service import SearchService
+from mircrewapi.service.torznab_service import TorznabService
+from mircrewapi.service.watchlist_service import WatchlistService
 
 
 class DefaultContainer:
@@ -40,7 +61,7 @@ class DefaultContainer:
         self.root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         self.var_dir = os.path.join(self.root_dir, 'var')
         os.makedirs(self.var_dir, exist_ok=True)
-        self.log_dir = os.path.join(self.var_dir, 'log')
+        self.log_dir = os.path.join(self.root_dir, self.log_dir_env)
         os.makedirs(self.log_dir, exist_ok=True)
         self.app_log_path = os.path.join(self.log_dir, 'app.log')
         self.session_dir = os.path.join(self.root_dir, self.session_dir_env)
@@ -48,23 +69,226 @@ class DefaultContainer:
 
     def _init_environment_variables(self):
         self.debug = os.environ.get('DEBUG', 'false').lower() == 'true'
+        self.log_json = os.environ.get('LOG_JSON', 'false').lower() == 'true'
+        self.log_queue_size = int(os.environ.get('LOG_QUEUE_SIZE', '10000'))
         self.api_host = os.environ.get('API_HOST', '0.0.0.0')
         self.api_port = int(os.environ.get('API_PORT', '8000'))
         self.session_dir_env = os.environ.get('SESSION_DIR', 'var/session')
+        self.log_dir_env = os.environ.get('LOG_DIR', 'var/log')
         self.cache_dir = os.environ.get('CACHE_DIR', 'var/cache')
+        self.index_path = os.environ.get('INDEX_PATH', 'var/index/index.sqlite3')
+        self.archive_dir = os.environ.get('ARCHIVE_DIR', 'var/archive')
+        self.archive_enabled = os.environ.get('ARCHIVE_ENABLED', 'true').lower() == 'true'
+        self.archive_max_age_days = float(os.environ.get('ARCHIVE_MAX_AGE_DAYS', '30'))
+        self.archive_max_mb = int(os.environ.get('ARCHIVE_MAX_MB', '1024'))
         self.mircrew_username = os.environ.get('MIRCREW_USERNAME', '')
         self.mircrew_password = os.environ.get('MIRCREW_PASSWORD', '')
+        self.mircrew_base_url = os.environ.get('MIRCREW_BASE_URL', MircrewClient.DEFAULT_BASE_URL)
+        self.circuit_failure_threshold = int(os.environ.get('CIRCUIT_FAILURE_THRESHOLD', '3'))
+        self.circuit_base_backoff = float(os.environ.get('CIRCUIT_BASE_BACKOFF', '30'))
+        self.circuit_max_backoff = float(os.environ.get('CIRCUIT_MAX_BACKOFF', '900'))
+        self.metrics_enabled = os.environ.get('METRICS_ENABLED', 'true').lower() == 'true'
+        self.gzip_minimum_size = int(os.environ.get('GZIP_MINIMUM_SIZE', '0'))
+        self.suggest_snapshot_path = os.environ.get('SUGGEST_SNAPSHOT_PATH', 'var/index/suggest.json.gz')
+        self.suggest_max_titles = int(os.environ.get('SUGGEST_MAX_TITLES', '50000'))
+        self.upstream_rate_per_minute = float(os.environ.get('UPSTREAM_RATE_PER_MINUTE', '30'))
+        self.upstream_burst = int(os.environ.get('UPSTREAM_BURST', '5'))
+        self.upstream_max_concurrency = int(os.environ.get('UPSTREAM_MAX_CONCURRENCY', '2'))
+        self.prefetch_top_k = int(os.environ.get('PREFETCH_TOP_K', '0'))
+        self.prefetch_claim_timeout = float(os.environ.get('PREFETCH_CLAIM_TIMEOUT', '2'))
+        self.search_ttl_floor = float(os.environ.get('SEARCH_TTL_FLOOR', '900'))
+        self.search_ttl_ceiling = float(os.environ.get('SEARCH_TTL_CEILING', '7200'))
+        self.magnets_ttl_floor = float(os.environ.get('MAGNETS_TTL_FLOOR', '3600'))
+        self.magnets_ttl_ceiling = float(os.environ.get('MAGNETS_TTL_CEILING', '604800'))
+        self.admin_token = os.environ.get('ADMIN_TOKEN', '')
+        self.browser_memory_budget_mb = int(os.environ.get('BROWSER_MEMORY_BUDGET_MB', '0'))
+        self.memory_check_interval = float(os.environ.get('MEMORY_CHECK_INTERVAL', '30'))
+        self.browser_memory_gate_timeout = float(os.environ.get('BROWSER_MEMORY_GATE_TIMEOUT', '60'))
+        self.torznab_api_key = os.environ.get('TORZNAB_API_KEY', '')
+        self.torznab_fetch_concurrency = int(os.environ.get('TORZNAB_FETCH_CONCURRENCY', '2'))
+        self.torznab_max_fetches = int(os.environ.get('TORZNAB_MAX_FETCHES', '10'))
+        self.api_clients = os.environ.get('API_CLIENTS', '')
+        self.webhook_allowed_hosts = os.environ.get('WEBHOOK_ALLOWED_HOSTS', '')
+        self.cache_stale_retention_hours = float(os.environ.get('CACHE_STALE_RETENTION_HOURS', '168'))
+        self.cache_prune_interval = float(os.environ.get('CACHE_PRUNE_INTERVAL', '3600'))
+        self.admission_slots = int(os.environ.get('ADMISSION_SLOTS', '2'))
+        self.admission_max_wait = float(os.environ.get('ADMISSION_MAX_WAIT', '30'))
+        self.client_max_concurrency = int(os.environ.get('CLIENT_MAX_CONCURRENCY', '2'))
+        self.client_rate_per_minute = float(os.environ.get('CLIENT_RATE_PER_MINUTE', '60'))
+        self.client_burst = int(os.environ.get('CLIENT_BURST', '10'))
+        self.client_max_queue = int(os.environ.get('CLIENT_MAX_QUEUE', '10'))
+        self.profile_dir = os.environ.get('PROFILE_DIR', 'var/profiles')
+        self.profile_threshold = float(os.environ.get('PROFILE_THRESHOLD_SECONDS', '0'))
+        self.profile_interval_ms = float(os.environ.get('PROFILE_INTERVAL_MS', '10'))
+        self.profile_max_count = int(os.environ.get('PROFILE_MAX_COUNT', '50'))
 
     def _init_logging(self):
-        AppLogger(self.log_dir, debug=self.debug).configure_root()
+        AppLogger(
+            self.log_dir,
+            debug=self.debug,
+            json_format=self.log_json,
+            queue_size=self.log_queue_size,
+        ).configure_root()
 
     def _init_bindings(self):
-        cache_manager = CacheManager(cache_dir=os.path.join(self.root_dir, self.cache_dir))
-        self.injector.binder.bind(CacheManager, to=cache_manager)
+        # Databases, snapshots and background threads are built on first use, so
+        # commands that do not need them (mock-upstream, --help) never open them.
+        self._bind_lazy(CacheManager, self._build_cache_manager)
+        self._bind_lazy(IndexManager, lambda: IndexManager(db_path=os.path.join(self.root_dir, self.index_path)))
+        self._bind_lazy(
+            WatchlistManager,
+            lambda: WatchlistManager(db_path=os.path.join(self.root_dir, self.index_path)),
+        )
+        self._bind_lazy(
+            RefreshManager,
+            lambda: RefreshManager(
+                db_path=os.path.join(self.root_dir, self.index_path),
+                bounds={
+                    "search": (timedelta(seconds=self.search_ttl_floor), timedelta(seconds=self.search_ttl_ceiling)),
+                    "magnets": (timedelta(seconds=self.magnets_ttl_floor), timedelta(seconds=self.magnets_ttl_ceiling)),
+                },
+            ),
+        )
+        self._bind_lazy(PageArchiveManager, self._build_page_archive_manager)
+        self._bind_lazy(SuggestManager, self._build_suggest_manager)
+
+        metrics_manager = MetricsManager(enabled=self.metrics_enabled)
+        self.injector.binder.bind(MetricsManager, to=metrics_manager)
+
+        circuit_breaker = CircuitBreaker(
+            failure_threshold=self.circuit_failure_threshold,
+            base_backoff=self.circuit_base_backoff,
+            max_backoff=self.circuit_max_backoff,
+        )
+        self.injector.binder.bind(CircuitBreaker, to=circuit_breaker)
+
+        upstream_budget = UpstreamBudget(
+            rate_per_minute=self.upstream_rate_per_minute,
+            burst=self.upstream_burst,
+            max_concurrency=self.upstream_max_concurrency,
+        )
+        self.injector.binder.bind(UpstreamBudget, to=upstream_budget)
+        prefetch_manager = PrefetchManager(
+            top_k=self.prefetch_top_k,
+            upstream_budget=upstream_budget,
+            metrics_manager=metrics_manager,
+            claim_timeout=self.prefetch_claim_timeout,
+        )
+        self.injector.binder.bind(PrefetchManager, to=prefetch_manager)
+
+        memory_watchdog = MemoryWatchdog(
+            budget_bytes=self.browser_memory_budget_mb * 1024 * 1024,
+            interval=self.memory_check_interval,
+            gate_timeout=self.browser_memory_gate_timeout,
+            metrics_manager=metrics_manager,
+        )
+        self.injector.binder.bind(MemoryWatchdog, to=memory_watchdog)
+
+        self._bind_lazy(MircrewClient, self._build_mircrew_client)
+        self._bind_lazy(
+            AdmissionManager,
+            lambda: AdmissionManager(
+                clients=AdmissionManager.parse_clients(self.api_clients),
+                slots=self.admission_slots,
+                client_concurrency=self.client_max_concurrency,
+                rate_per_minute=self.client_rate_per_minute,
+                burst=self.client_burst,
+                max_queue=self.client_max_queue,
+                max_wait=self.admission_max_wait,
+                metrics_manager=metrics_manager,
+            ),
+        )
+        self._bind_lazy(
+            ProfileManager,
+            lambda: ProfileManager(
+                store_dir=os.path.join(self.root_dir, self.profile_dir),
+                threshold=self.profile_threshold,
+                interval=self.profile_interval_ms / 1000,
+                max_profiles=self.profile_max_count,
+                metrics_manager=metrics_manager,
+            ),
+        )
+        self._bind_lazy(
+            AdminService,
+            lambda: AdminService(
+                cache_manager=self.injector.get(CacheManager),
+                mircrew_client=self.injector.get(MircrewClient),
+                metrics_manager=metrics_manager,
+                prefetch_manager=prefetch_manager,
+                admin_token=self.admin_token,
+                memory_watchdog=memory_watchdog,
+                allocation_snapshot_manager=AllocationSnapshotManager(),
+                admission_manager=self.injector.get(AdmissionManager),
+                profile_manager=self.injector.get(ProfileManager),
+            ),
+        )
+
+        # Services holding in-memory state are shared by controllers and commands.
+        self._bind_lazy(
+            WatchlistService,
+            lambda: WatchlistService(
+                watchlist_manager=self.injector.get(WatchlistManager),
+                release_title_parser=ReleaseTitleParser(),
+                release_filter_parser=ReleaseFilterParser(),
+                webhook_allowed_hosts=frozenset(
+                    host.strip() for host in self.webhook_allowed_hosts.split(",") if host.strip()
+                ),
+            ),
+        )
+        self.injector.binder.bind(SearchService, scope=singleton)
+        self._bind_lazy(
+            TorznabService,
+            lambda: TorznabService(
+                search_service=self.injector.get(SearchService),
+                release_title_parser=ReleaseTitleParser(),
+                metrics_manager=metrics_manager,
+                api_key=self.torznab_api_key,
+                fetch_concurrency=self.torznab_fetch_concurrency,
+                max_fetches=self.torznab_max_fetches,
+            ),
+        )
+
+    def _bind_lazy(self, interface, build):
+        self.injector.binder.bind(interface, to=CallableProvider(build), scope=singleton)
+
+    def _build_cache_manager(self) -> CacheManager:
+        cache_manager = CacheManager(
+            cache_dir=os.path.join(self.root_dir, self.cache_dir),
+            stale_retention=timedelta(hours=self.cache_stale_retention_hours),
+        )
+        cache_manager.start_pruning(self.cache_prune_interval)
+        return cache_manager
+
+    def _build_page_archive_manager(self) -> PageArchiveManager:
+        page_archive_manager = PageArchiveManager(
+            archive_dir=os.path.join(self.root_dir, self.archive_dir),
+            max_age=timedelta(days=self.archive_max_age_days) if self.archive_max_age_days > 0 else None,
+            max_bytes=self.archive_max_mb * 1024 * 1024 if self.archive_max_mb > 0 else None,
+        )
+        page_archive_manager.start_pruning(self.cache_prune_interval)
+        return page_archive_manager
+
+    def _build_suggest_manager(self) -> SuggestManager:
+        suggest_manager = SuggestManager(
+            snapshot_path=os.path.join(self.root_dir, self.suggest_snapshot_path),
+            max_titles=self.suggest_max_titles,
+        )
+        atexit.register(suggest_manager.save)
+        return suggest_manager
 
+    def _build_mircrew_client(self) -> MircrewClient:
+        memory_watchdog = self.injector.get(MemoryWatchdog)
         mircrew_client = MircrewClient(
             username=self.mircrew_username,
             password=self.mircrew_password,
-            cache_manager=cache_manager,
+            cache_manager=self.injector.get(CacheManager),
+            circuit_breaker=self.injector.get(CircuitBreaker),
+            metrics_manager=self.injector.get(MetricsManager),
+            base_url=self.mircrew_base_url,
+            upstream_budget=self.injector.get(UpstreamBudget),
+            page_archive_manager=self.injector.get(PageArchiveManager) if self.archive_enabled else None,
+            memory_watchdog=memory_watchdog,
         )
-        self.injector.binder.bind(MircrewClient, to=mircrew_client)
+        if memory_watchdog.enabled:
+            memory_watchdog.start(browsers_open=mircrew_client.browsers_active)
+        return mircrew_client
@@ -0,0 +1,218 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import PlainTextResponse
+from injector import inject
+from starlette.concurrency import run_in_threadpool
+
+from mircrewapi.model.controller.cache_invalidation_request import CacheInvalidationRequest
+from mircrewapi.model.service.allocation_snapshot import AllocationDiff, AllocationSnapshotInfo
+from mircrewapi.model.service.cache_stats import CacheStats
+from mircrewapi.model.service.client_usage import ClientUsage
+from mircrewapi.model.service.invalidation_report import InvalidationReport
+from mircrewapi.model.service.memory_sample import MemorySample
+from mircrewapi.model.service.request_profile import RequestProfile, RequestProfileInfo
+from mircrewapi.model.service.session_stats import SessionStats
+from mircrewapi.service.admin_service import AdminService
+
+
+class AdminController:
+    """Operational endpoints guarded by the ``X-Admin-Token`` header.
+
+    Handlers that scan the cache, log in upstream or walk ``/proc`` and the
+    heap run in the threadpool so they do not stall the event loop.
+    """
+
+    @inject
+    def __init__(self, admin_service: AdminService):
+        self.admin_service = admin_service
+        self.router = APIRouter(
+            prefix="/admin",
+            tags=["Admin"],
+            dependencies=[Depends(self._require_token)],
+        )
+        self._register_routes()
+
+    def _register_routes(self) -> None:
+        self.router.add_api_route(
+            "/cache",
+            self.get_cache_stats,
+            methods=["GET"],
+            summary="Cache sizes, hit rates and expiry distribution",
+            response_model=CacheStats,
+        )
+        self.router.add_api_route(
+            "/cache/invalidate",
+            self.invalidate_cache,
+            methods=["POST"],
+            summary="Delete cache entries by key prefix, key pattern or post id",
+            response_model=InvalidationReport,
+        )
+        self.router.add_api_route(
+            "/session",
+            self.get_session,
+            methods=["GET"],
+            summary="Upstream session age and browser counts",
+            response_model=SessionStats,
+        )
+        self.router.add_api_route(
+            "/session/refresh",
+            self.refresh_session,
+            methods=["POST"],
+            summary="Drop the upstream session and log in again",
+            response_model=SessionStats,
+        )
+        self.router.add_api_route(
+            "/clients",
+            self.get_clients,
+            methods=["GET"],
+            summary="Per-client admission counters, queue depth and rate-limit tokens",
+            response_model=list[ClientUsage],
+        )
+        self.router.add_api_route(
+            "/memory",
+            self.get_memory,
+            methods=["GET"],
+            summary="RSS of the API process and of its browser processes",
+            response_model=MemorySample,
+        )
+        self.router.add_api_route(
+            "/memory/snapshots",
+            self.list_snapshots,
+            methods=["GET"],
+            summary="List allocation snapshots",
+            response_model=list[AllocationSnapshotInfo],
+        )
+        self.router.add_api_route(
+            "/memory/snapshots",
+            self.take_snapshot,
+            methods=["POST"],
+            summary="Take a tracemalloc snapshot, starting tracing if needed",
+            response_model=AllocationSnapshotInfo,
+            status_code=201,
+        )
+        self.router.add_api_route(
+            "/memory/snapshots",
+            self.clear_snapshots,
+            methods=["DELETE"],
+            summary="Drop snapshots and stop tracing",
+            status_code=204,
+        )
+        self.router.add_api_route(
+            "/memory/snapshots/{first_id}/diff/{second_id}",
+            self.diff_snapshots,
+            methods=["GET"],
+            summary="Allocation growth between two snapshots",
+            response_model=AllocationDiff,
+        )
+        self.router.add_api_route(
+            "/profiles",
+            self.list_profiles,
+            methods=["GET"],
+            summary="Captured request profiles, newest first",
+            response_model=list[RequestProfileInfo],
+        )
+        self.router.add_api_route(
+            "/profiles",
+            self.clear_profiles,
+            methods=["DELETE"],
+            summary="Delete every captured profile",
+            status_code=204,
+        )
+        self.router.add_api_route(
+            "/profiles/{profile_id}",
+            self.get_profile,
+            methods=["GET"],
+            summary="Stage spans and hottest stacks of one profile",
+            response_model=RequestProfile,
+        )
+        self.router.add_api_route(
+            "/profiles/{profile_id}/folded",
+            self.download_profile,
+            methods=["GET"],
+            summary="Download a profile as folded stacks for flamegraph tools",
+            response_class=PlainTextResponse,
+        )
+
+    async def _require_token(self, x_admin_token: str | None = Header(None)) -> None:
+        if not self.admin_service.enabled:
+            raise HTTPException(status_code=404, detail="Admin API is disabled")
+        if not self.admin_service.authorize(x_admin_token):
+            raise HTTPException(status_code=401, detail="Invalid admin token")
+
+    async def get_cache_stats(
+        self,
+        near_expiry_seconds: float = Query(300, ge=0, description="Window for the near-expiry listing"),
+        limit: int = Query(50, ge=0, le=1000),
+    ) -> CacheStats:
+        return await run_in_threadpool(self.admin_service.cache_stats, near_expiry_seconds, limit)
+
+    async def invalidate_cache(self, request: CacheInvalidationRequest) -> InvalidationReport:
+        try:
+            return await run_in_threadpool(
+                self.admin_service.invalidate, request.prefix, request.pattern, request.post_id
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    async def get_session(self) -> SessionStats:
+        return self.admin_service.session_stats()
+
+    async def get_clients(self) -> list[ClientUsage]:
+        return self.admin_service.client_usage()
+
+    async def get_memory(self) -> MemorySample:
+        return await run_in_threadpool(self.admin_service.memory_sample)
+
+    async def list_snapshots(self) -> list[AllocationSnapshotInfo]:
+        return self.admin_service.allocation_snapshots()
+
+    async def take_snapshot(self, label: str = "") -> AllocationSnapshotInfo:
+        return await run_in_threadpool(self.admin_service.take_allocation_snapshot, label)
+
+    async def clear_snapshots(self) -> Response:
+        self.admin_service.clear_allocation_snapshots()
+        return Response(status_code=204)
+
+    async def diff_snapshots(
+        self,
+        first_id: int,
+        second_id: int,
+        group_by: str = Query("lineno", description="lineno, filename or traceback"),
+        limit: int = Query(25, ge=1, le=500),
+    ) -> AllocationDiff:
+        try:
+            return await run_in_threadpool(
+                self.admin_service.diff_allocation_snapshots, first_id, second_id, group_by, limit
+            )
+        except KeyError as exc:
+            raise HTTPException(status_code=404, detail="Snapshot not found") from exc
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    async def list_profiles(self) -> list[RequestProfileInfo]:
+        return await run_in_threadpool(self.admin_service.profiles)
+
+    async def clear_profiles(self) -> Response:
+        await run_in_threadpool(self.admin_service.clear_profiles)
+        return Response(status_code=204)
+
+    async def get_profile(self, profile_id: str, top: int = Query(20, ge=1, le=500)) -> RequestProfile:
+        try:
+            return await run_in_threadpool(self.admin_service.profile, profile_id, top)
+        except KeyError as exc:
+            raise HTTPException(status_code=404, detail="Profile not found") from exc
+
+    async def download_profile(self, profile_id: str) -> PlainTextResponse:
+        try:
+            folded = await run_in_threadpool(self.admin_service.folded_profile, profile_id)
+        except KeyError as exc:
+            raise HTTPException(status_code=404, detail="Profile not found") from exc
+        return PlainTextResponse(
+            folded,
+            headers={"Content-Disposition": f'attachment; filename="{profile_id}.folded"'},
+        )
+
+    async def refresh_session(self) -> SessionStats:
+        try:
+            return await run_in_threadpool(self.admin_service.refresh_session)
+        except Exception as exc:
+            raise HTTPException(status_code=502, detail=f"Session refresh failed: {exc}") from exc
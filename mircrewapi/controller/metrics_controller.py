@@ -0,0 +1,30 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from injector import inject
+
+from mircrewapi.manager.metrics_manager import MetricsManager
+
+
+class MetricsController:
+    """Expose stage histograms and counters in Prometheus text format."""
+
+    @inject
+    def __init__(self, metrics_manager: MetricsManager):
+        self.metrics_manager = metrics_manager
+        self.router = APIRouter(tags=["Metrics"])
+        self._register_routes()
+
+    def _register_routes(self) -> None:
+        self.router.add_api_route(
+            "/metrics",
+            self.get_metrics,
+            methods=["GET"],
+            summary="Prometheus metrics",
+            response_class=PlainTextResponse,
+        )
+
+    async def get_metrics(self) -> PlainTextResponse:
+        return PlainTextResponse(
+            self.metrics_manager.render_prometheus(),
+            media_type="text/plain; version=0.0.4",
+        )
@@ -1,15 +1,36 @@
-from fastapi import APIRouter
+import math
+from typing import Callable
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from injector import inject
+from starlette.concurrency import run_in_threadpool
 
+from mircrewapi.manager.admission_manager import AdmissionManager, AdmissionRejectedError
+from mircrewapi.manager.circuit_breaker import UpstreamUnavailableError
+from mircrewapi.manager.metrics_manager import MetricsManager
+from mircrewapi.manager.profile_manager import ProfileManager
+from mircrewapi.mapper.controller.json_response_mapper import JsonResponseMapper
 from mircrewapi.mapper.controller.magnet_mapper import MagnetMapper
 from mircrewapi.mapper.controller.post_mapper import PostMapper
+from mircrewapi.model.controller.magnet_item import MagnetItem as ControllerMagnetItem
+from mircrewapi.model.controller.magnet_lookup_response import MagnetLookupResponse
 from mircrewapi.model.controller.magnets_response import MagnetsResponse
+from mircrewapi.model.controller.post_item import PostItem as ControllerPostItem
 from mircrewapi.model.controller.post_search_response import PostSearchResponse
+from mircrewapi.model.service.cached_result import CachedResult
 from mircrewapi.service.search_service import SearchService
 
 
 class SearchController:
-    """Expose search endpoints."""
+    """Expose search endpoints.
+
+    List routes page, project and compact the cached result set, so later
+    pages never go upstream again. With an admission manager, routes that
+    would go upstream are admitted per client and run off the event loop,
+    while cache hits are answered straight away.
+    """
+
+    _MAX_LIMIT = 1000
 
     @inject
     def __init__(
@@ -17,34 +38,238 @@ class SearchController:
         search_service: SearchService,
         post_mapper: PostMapper,
         magnet_mapper: MagnetMapper,
+        metrics_manager: MetricsManager | None = None,
+        json_response_mapper: JsonResponseMapper | None = None,
+        admission_manager: AdmissionManager | None = None,
     ):
         self.search_service = search_service
         self.post_mapper = post_mapper
         self.magnet_mapper = magnet_mapper
+        self.metrics_manager = metrics_manager or MetricsManager(enabled=False)
+        self.json_response_mapper = json_response_mapper or JsonResponseMapper()
+        self.admission_manager = admission_manager
         self.router = APIRouter(tags=["Search"])
         self._register_routes()
 
     def _register_routes(self) -> None:
         self.router.add_api_route(
             "/search",
-            self.search_posts,
+            self.search_posts_route,
             methods=["GET"],
             summary="Search Mircrew posts",
             response_model=PostSearchResponse,
         )
         self.router.add_api_route(
             "/post/{post_id}/magnets",
-            self.get_magnets,
+            self.get_magnets_route,
             methods=["GET"],
             summary="Get magnets for a post",
             response_model=MagnetsResponse,
         )
+        self.router.add_api_route(
+            "/magnet/{infohash}",
+            self.get_magnet,
+            methods=["GET"],
+            summary="Find the posts that contain a magnet",
+            response_model=MagnetLookupResponse,
+        )
 
-    async def search_posts(self, q: str) -> PostSearchResponse:
-        items = self.search_service.search_posts(q)
-        return self.post_mapper.to_response(query=q, items=items)
+    async def search_posts(
+        self,
+        q: str,
+        filters: list[str] | None = None,
+        sort: str | None = None,
+        since: int | None = None,
+    ) -> PostSearchResponse:
+        return self._search_response(q, self._search_result(q, filters, sort, since))
 
     async def get_magnets(self, post_id: str) -> MagnetsResponse:
-        items = self.search_service.get_magnets(post_id)
+        return self._magnets_response(post_id, self._magnets_result(post_id))
+
+    async def get_magnet(self, infohash: str) -> MagnetLookupResponse:
+        found = self.search_service.find_magnet(infohash)
+        if found is None:
+            raise HTTPException(status_code=404, detail="Magnet not indexed")
+        magnet, posts = found
+        return self.magnet_mapper.to_lookup_response(magnet, posts)
+
+    async def search_posts_route(
+        self,
+        request: Request,
+        q: str,
+        filters: list[str] = Query(
+            default=[],
+            alias="filter",
+            description="Release filter such as resolution>=1080p, season=2 or language=ita (repeatable).",
+        ),
+        sort: str | None = Query(
+            default=None,
+            description="Comma separated sort fields, prefix with - for descending (e.g. -resolution,year).",
+        ),
+        since: int | None = Query(
+            default=None,
+            ge=0,
+            description="Cursor from a previous response; only posts first seen after it are returned.",
+        ),
+        offset: int = Query(0, ge=0, description="Skip this many results."),
+        limit: int | None = Query(None, ge=1, le=_MAX_LIMIT, description="Return at most this many results."),
+        fields: str | None = Query(None, description="Comma separated result fields to return, e.g. id,title."),
+        response_format: str = Query(
+            "full",
+            alias="format",
+            pattern="^(full|compact)$",
+            description="`compact` returns results as value rows under `columns`.",
+        ),
+    ) -> Response:
+        projection = self._projection(fields, response_format, ControllerPostItem)
+        result = await self._admitted(
+            request,
+            lambda: self.search_service.has_fresh_search(q),
+            lambda: self._search_result(q, filters, sort, since),
+        )
+        page, total = self._page(result, offset, limit)
+        response = self._search_response(q, page, total, offset)
+        return self.json_response_mapper.to_response(
+            request, response, page, projection, response_format == "compact"
+        )
+
+    async def get_magnets_route(
+        self,
+        request: Request,
+        post_id: str,
+        offset: int = Query(0, ge=0, description="Skip this many magnets."),
+        limit: int | None = Query(None, ge=1, le=_MAX_LIMIT, description="Return at most this many magnets."),
+        fields: str | None = Query(None, description="Comma separated magnet fields to return, e.g. infohash."),
+        response_format: str = Query(
+            "full",
+            alias="format",
+            pattern="^(full|compact)$",
+            description="`compact` returns magnets as value rows under `columns`.",
+        ),
+    ) -> Response:
+        projection = self._projection(fields, response_format, ControllerMagnetItem)
+        result = await self._admitted(
+            request,
+            lambda: self.search_service.has_fresh_magnets(post_id),
+            lambda: self._magnets_result(post_id),
+        )
+        page, total = self._page(result, offset, limit)
+        response = self._magnets_response(post_id, page, total, offset)
+        return self.json_response_mapper.to_response(
+            request, response, page, projection, response_format == "compact"
+        )
+
+    async def _admitted(
+        self,
+        request: Request,
+        cached: Callable[[], bool],
+        operation: Callable[[], CachedResult],
+    ) -> CachedResult:
+        if not self.admission_manager:
+            return operation()
+        try:
+            identity = self.admission_manager.identify(
+                request.headers.get("x-api-key"),
+                request.headers.get("x-client-id"),
+                request.client.host if request.client else None,
+            )
+        except PermissionError as exc:
+            raise HTTPException(status_code=401, detail=str(exc)) from exc
+        try:
+            return await self.admission_manager.run(identity, cached(), lambda: run_in_threadpool(ProfileManager.bind(operation)))
+        except AdmissionRejectedError as exc:
+            raise HTTPException(
+                status_code=429,
+                detail=str(exc),
+                headers={"Retry-After": str(int(exc.retry_after))},
+            ) from exc
+
+    def _search_result(
+        self,
+        q: str,
+        filters: list[str] | None,
+        sort: str | None,
+        since: int | None = None,
+    ) -> CachedResult:
+        try:
+            result = self.search_service.search_posts_result(q)
+        except UpstreamUnavailableError as exc:
+            raise self._unavailable(exc) from exc
+        result = self.search_service.posts_since(result, since)
+        if not filters and not sort:
+            return result
+        try:
+            items = self.search_service.filter_posts(result.items, filters, sort)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        return result.model_copy(update={"items": items})
+
+    def _magnets_result(self, post_id: str) -> CachedResult:
+        try:
+            return self.search_service.get_magnets_result(post_id)
+        except UpstreamUnavailableError as exc:
+            raise self._unavailable(exc) from exc
+
+    def _search_response(
+        self,
+        q: str,
+        result: CachedResult,
+        total: int | None = None,
+        offset: int = 0,
+    ) -> PostSearchResponse:
+        with self.metrics_manager.span("controller_mapper"):
+            return self.post_mapper.to_response(
+                query=q,
+                items=result.items,
+                cursor=result.cursor,
+                total=total,
+                offset=offset,
+            )
+
+    def _magnets_response(
+        self,
+        post_id: str,
+        result: CachedResult,
+        total: int | None = None,
+        offset: int = 0,
+    ) -> MagnetsResponse:
         post_url = self.search_service.mircrew_client.build_post_url(post_id)
-        return self.magnet_mapper.to_response(post_id=post_id, post_url=post_url, items=items)
+        with self.metrics_manager.span("controller_mapper"):
+            return self.magnet_mapper.to_response(
+                post_id=post_id,
+                post_url=post_url,
+                items=result.items,
+                total=total,
+                offset=offset,
+            )
+
+    @staticmethod
+    def _page(result: CachedResult, offset: int, limit: int | None) -> tuple[CachedResult, int]:
+        """Slice before mapping, so only the returned page is converted and serialized."""
+        total = len(result.items)
+        if offset == 0 and (limit is None or limit >= total):
+            return result, total
+        end = total if limit is None else offset + limit
+        return result.model_copy(update={"items": result.items[offset:end]}), total
+
+    @staticmethod
+    def _projection(fields: str | None, response_format: str, item_type: type) -> list[str] | None:
+        available = list(item_type.model_fields)
+        if not fields:
+            return available if response_format == "compact" else None
+        selected = list(dict.fromkeys(field.strip() for field in fields.split(",") if field.strip()))
+        unknown = [field for field in selected if field not in available]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown field(s): {', '.join(unknown)}. Available: {', '.join(available)}",
+            )
+        return selected or None
+
+    @staticmethod
+    def _unavailable(exc: UpstreamUnavailableError) -> HTTPException:
+        return HTTPException(
+            status_code=503,
+            detail=str(exc),
+            headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))},
+        )
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Query
+from injector import inject
+
+from mircrewapi.model.controller.suggest_response import SuggestResponse
+from mircrewapi.service.suggest_service import SuggestService
+
+
+class SuggestController:
+    """Expose title typeahead."""
+
+    @inject
+    def __init__(self, suggest_service: SuggestService):
+        self.suggest_service = suggest_service
+        self.router = APIRouter(tags=["Search"])
+        self._register_routes()
+
+    def _register_routes(self) -> None:
+        self.router.add_api_route(
+            "/suggest",
+            self.suggest,
+            methods=["GET"],
+            summary="Suggest known post titles for a prefix",
+            response_model=SuggestResponse,
+        )
+
+    async def suggest(
+        self,
+        prefix: str = Query(..., min_length=1),
+        limit: int = Query(10, ge=1, le=50),
+    ) -> SuggestResponse:
+        return SuggestResponse(prefix=prefix, suggestions=self.suggest_service.suggest(prefix, limit))
@@ -0,0 +1,118 @@
+from functools import partial
+
+from fastapi import APIRouter, Query, Request, Response
+from injector import inject
+from starlette.concurrency import run_in_threadpool
+
+from mircrewapi.manager.admission_manager import AdmissionManager, AdmissionRejectedError
+from mircrewapi.manager.circuit_breaker import UpstreamUnavailableError
+from mircrewapi.manager.profile_manager import ProfileManager
+from mircrewapi.mapper.controller.torznab_mapper import TorznabMapper
+from mircrewapi.service.torznab_service import TorznabService
+
+
+class TorznabController:
+    """Torznab indexer API for Prowlarr, Sonarr and Radarr.
+
+    With an admission manager, searches that go upstream are admitted per
+    client like the JSON search routes; rejections answer 429 with Retry-After.
+    """
+
+    _XML = "application/xml; charset=utf-8"
+    _RSS = "application/rss+xml; charset=utf-8"
+
+    @inject
+    def __init__(
+        self,
+        torznab_service: TorznabService,
+        torznab_mapper: TorznabMapper,
+        admission_manager: AdmissionManager | None = None,
+    ):
+        self.torznab_service = torznab_service
+        self.torznab_mapper = torznab_mapper
+        self.admission_manager = admission_manager
+        self.router = APIRouter(prefix="/torznab", tags=["Torznab"])
+        self._register_routes()
+
+    def _register_routes(self) -> None:
+        self.router.add_api_route(
+            "/api",
+            self.api,
+            methods=["GET"],
+            summary="Torznab API (t=caps, search, tvsearch, movie)",
+            response_class=Response,
+        )
+
+    async def api(
+        self,
+        request: Request,
+        t: str = Query(..., description="caps, search, tvsearch or movie"),
+        q: str | None = None,
+        season: int | None = None,
+        ep: int | None = None,
+        cat: str | None = Query(None, description="Comma separated category ids"),
+        offset: int = Query(0, ge=0),
+        limit: int = Query(TorznabService.DEFAULT_LIMIT, ge=1),
+        apikey: str | None = None,
+    ) -> Response:
+        if not self.torznab_service.authorize(apikey):
+            return self._error(100, "Incorrect user credentials")
+        if t == "caps":
+            return Response(
+                self.torznab_mapper.to_caps_xml(
+                    TorznabService.CATEGORIES,
+                    TorznabService.DEFAULT_LIMIT,
+                    TorznabService.MAX_LIMIT,
+                ),
+                media_type=self._XML,
+            )
+        if t not in TorznabService.MODES:
+            return self._error(202, f"No such function: {t}")
+        try:
+            categories = {int(value) for value in cat.split(",") if value.strip()} if cat else None
+        except ValueError:
+            return self._error(201, "Incorrect parameter: cat")
+        # Misses run a browser search and wait on magnet fetches; keep them off the event loop.
+        search = partial(
+            run_in_threadpool,
+            ProfileManager.bind(self.torznab_service.search),
+            t,
+            query=q,
+            season=season,
+            episode=ep,
+            categories=categories,
+            offset=offset,
+            limit=min(limit, TorznabService.MAX_LIMIT),
+        )
+        identity = None
+        if self.admission_manager:
+            try:
+                identity = self.admission_manager.identify(
+                    request.headers.get("x-api-key"),
+                    request.headers.get("x-client-id"),
+                    request.client.host if request.client else None,
+                )
+            except PermissionError:
+                return self._error(100, "Incorrect user credentials", status_code=401)
+        try:
+            if identity:
+                items = await self.admission_manager.run(identity, self.torznab_service.is_cached(q), search)
+            else:
+                items = await search()
+        except AdmissionRejectedError as exc:
+            response = self._error(500, f"Request limit reached: {exc}", status_code=429)
+            response.headers["Retry-After"] = str(int(exc.retry_after))
+            return response
+        except UpstreamUnavailableError as exc:
+            return self._error(900, f"Upstream unavailable, retry in {exc.retry_after:.0f}s")
+        return Response(
+            self.torznab_mapper.to_feed_xml(items, offset, str(request.url_for("api"))),
+            media_type=self._RSS,
+        )
+
+    def _error(self, code: int, description: str, status_code: int = 200) -> Response:
+        return Response(
+            self.torznab_mapper.to_error_xml(code, description),
+            status_code=status_code,
+            media_type=self._XML,
+        )
@@ -0,0 +1,105 @@
+from fastapi import APIRouter, HTTPException, Query, Response
+from injector import inject
+
+from mircrewapi.mapper.controller.watchlist_mapper import WatchlistMapper
+from mircrewapi.model.controller.watchlist_feed_response import WatchlistFeedResponse
+from mircrewapi.model.controller.watchlist_item import WatchlistItem
+from mircrewapi.model.controller.watchlist_request import WatchlistRequest
+from mircrewapi.service.watchlist_service import WatchlistService
+
+
+class WatchlistController:
+    """CRUD for saved searches plus the incremental match feed."""
+
+    @inject
+    def __init__(self, watchlist_service: WatchlistService, watchlist_mapper: WatchlistMapper):
+        self.watchlist_service = watchlist_service
+        self.watchlist_mapper = watchlist_mapper
+        self.router = APIRouter(prefix="/watchlists", tags=["Watchlists"])
+        self._register_routes()
+
+    def _register_routes(self) -> None:
+        self.router.add_api_route(
+            "/feed",
+            self.get_feed,
+            methods=["GET"],
+            summary="Matches newer than a cursor",
+            response_model=WatchlistFeedResponse,
+        )
+        self.router.add_api_route(
+            "",
+            self.list_watchlists,
+            methods=["GET"],
+            summary="List watchlists",
+            response_model=list[WatchlistItem],
+        )
+        self.router.add_api_route(
+            "",
+            self.create_watchlist,
+            methods=["POST"],
+            summary="Create a watchlist",
+            response_model=WatchlistItem,
+            status_code=201,
+        )
+        self.router.add_api_route(
+            "/{watchlist_id}",
+            self.get_watchlist,
+            methods=["GET"],
+            summary="Get a watchlist",
+            response_model=WatchlistItem,
+        )
+        self.router.add_api_route(
+            "/{watchlist_id}",
+            self.update_watchlist,
+            methods=["PUT"],
+            summary="Replace a watchlist",
+            response_model=WatchlistItem,
+        )
+        self.router.add_api_route(
+            "/{watchlist_id}",
+            self.delete_watchlist,
+            methods=["DELETE"],
+            summary="Delete a watchlist",
+            status_code=204,
+        )
+
+    async def list_watchlists(self) -> list[WatchlistItem]:
+        return [self.watchlist_mapper.to_item(record) for record in self.watchlist_service.list_watchlists()]
+
+    async def create_watchlist(self, request: WatchlistRequest) -> WatchlistItem:
+        return self._save(self.watchlist_mapper.to_record(request))
+
+    async def get_watchlist(self, watchlist_id: int) -> WatchlistItem:
+        record = self.watchlist_service.get_watchlist(watchlist_id)
+        if record is None:
+            raise HTTPException(status_code=404, detail="Watchlist not found")
+        return self.watchlist_mapper.to_item(record)
+
+    async def update_watchlist(self, watchlist_id: int, request: WatchlistRequest) -> WatchlistItem:
+        existing = self.watchlist_service.get_watchlist(watchlist_id)
+        if existing is None:
+            raise HTTPException(status_code=404, detail="Watchlist not found")
+        record = self.watchlist_mapper.to_record(request, watchlist_id=watchlist_id)
+        record.created_at = existing.created_at
+        return self._save(record)
+
+    async def delete_watchlist(self, watchlist_id: int) -> Response:
+        if not self.watchlist_service.delete_watchlist(watchlist_id):
+            raise HTTPException(status_code=404, detail="Watchlist not found")
+        return Response(status_code=204)
+
+    async def get_feed(
+        self,
+        since: int = Query(0, ge=0, description="Cursor returned by the previous call"),
+        watchlist_id: int | None = None,
+        limit: int = Query(100, ge=1, le=1000),
+    ) -> WatchlistFeedResponse:
+        matches = self.watchlist_service.matches_since(since, watchlist_id, limit)
+        return self.watchlist_mapper.to_feed_response(since, matches)
+
+    def _save(self, record) -> WatchlistItem:
+        try:
+            saved = self.watchlist_service.save_watchlist(record)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        return self.watchlist_mapper.to_item(saved)
@@ -6,8 +6,21 @@ from mircrewapi.logger.base_logger import BaseLogger
 
 
 class AppLogger(BaseLogger):
-    def __init__(self, log_dir: str, debug: bool = False) -> None:
-        super().__init__("mircrewapi.app", log_dir, "app.log", debug=debug)
+    def __init__(
+        self,
+        log_dir: str,
+        debug: bool = False,
+        json_format: bool = False,
+        queue_size: int = 10000,
+    ) -> None:
+        super().__init__(
+            "mircrewapi.app",
+            log_dir,
+            "app.log",
+            debug=debug,
+            json_format=json_format,
+            queue_size=queue_size,
+        )
 
     def configure_root(self) -> None:
         logger = self.get_logger()
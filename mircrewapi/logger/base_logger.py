@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueListener, RotatingFileHandler
+
+from mircrewapi.logger.bounded_queue_handler import BoundedQueueHandler
+from mircrewapi.logger.json_log_formatter import JsonLogFormatter
+from mircrewapi.logger.request_context import RequestContextFilter
 
 
 class BaseLogger:
+    """Logger whose file I/O runs on a background listener thread.
+
+    Callers only enqueue records on a bounded queue; a QueueListener writes
+    them to the rotating file, as plain text or as JSON lines.
+    """
+
     def __init__(
         self,
         name: str,
@@ -14,33 +25,55 @@ class BaseLogger:
         debug: bool = False,
         max_bytes: int = 5 * 1024 * 1024,
         backup_count: int = 5,
+        json_format: bool = False,
+        queue_size: int = 10000,
     ) -> None:
         self._name = name
         self._log_path = os.path.join(log_dir, filename)
         self._level = logging.DEBUG if debug else logging.INFO
         self._max_bytes = max_bytes
         self._backup_count = backup_count
+        self._json_format = json_format
+        self._queue_size = queue_size
         self._logger: logging.Logger | None = None
+        self._listener: QueueListener | None = None
 
     def get_logger(self) -> logging.Logger:
         if self._logger is not None:
             return self._logger
         logger = logging.getLogger(self._name)
         logger.setLevel(self._level)
-        if not any(isinstance(handler, RotatingFileHandler) for handler in logger.handlers):
-            handler = RotatingFileHandler(
+        if not any(isinstance(handler, BoundedQueueHandler) for handler in logger.handlers):
+            file_handler = RotatingFileHandler(
                 self._log_path,
                 maxBytes=self._max_bytes,
                 backupCount=self._backup_count,
             )
-            handler.setLevel(self._level)
-            handler.setFormatter(
-                logging.Formatter(
-                    fmt="%(asctime)s,%(msecs)d %(name)s %(levelname)s %(message)s",
-                    datefmt="%H:%M:%S",
-                )
-            )
-            logger.addHandler(handler)
+            file_handler.setLevel(self._level)
+            file_handler.setFormatter(self._formatter())
+
+            queue_handler = BoundedQueueHandler(maxsize=self._queue_size)
+            queue_handler.setLevel(self._level)
+            queue_handler.addFilter(RequestContextFilter())
+            logger.addHandler(queue_handler)
+
+            self._listener = QueueListener(queue_handler.queue, file_handler, respect_handler_level=True)
+            self._listener.start()
+            atexit.register(self.stop)
         logger.propagate = False
         self._logger = logger
         return logger
+
+    def stop(self) -> None:
+        """Flush queued records and stop the listener thread."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def _formatter(self) -> logging.Formatter:
+        if self._json_format:
+            return JsonLogFormatter()
+        return logging.Formatter(
+            fmt="%(asctime)s,%(msecs)d %(name)s %(levelname)s %(message)s",
+            datefmt="%H:%M:%S",
+        )
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import logging
+from logging.handlers import QueueHandler
+import queue
+import threading
+
+
+class BoundedQueueHandler(QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full.
+
+    A slow disk then costs log lines, never request latency. The number of
+    dropped records is reported with the next record that fits in the queue.
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        super().__init__(queue.Queue(maxsize=maxsize))
+        self.dropped = 0
+        self._pending_drops = 0
+        self._lock = threading.Lock()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+                self._pending_drops += 1
+            return
+        if self._pending_drops:
+            self._report_drops(record)
+
+    def _report_drops(self, record: logging.LogRecord) -> None:
+        with self._lock:
+            count, self._pending_drops = self._pending_drops, 0
+        notice = logging.LogRecord(
+            record.name,
+            logging.WARNING,
+            __file__,
+            0,
+            f"Dropped {count} log records: logging queue was full",
+            None,
+            None,
+        )
+        notice.request_id = None
+        notice.stages = []
+        try:
+            self.queue.put_nowait(notice)
+        except queue.Full:
+            with self._lock:
+                self._pending_drops += count
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import json
+import logging
+
+
+class JsonLogFormatter(logging.Formatter):
+    """One JSON object per line, with request id and stage timings when present."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id:
+            payload["request_id"] = request_id
+        stages = getattr(record, "stages", None)
+        if stages:
+            totals: dict[str, float] = {}
+            for name, seconds in stages:
+                totals[name] = totals.get(name, 0.0) + seconds
+            payload["stages_ms"] = {name: round(seconds * 1000, 1) for name, seconds in totals.items()}
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False)
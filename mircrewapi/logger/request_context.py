@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from contextvars import ContextVar
+import logging
+
+from mircrewapi.manager.metrics_manager import MetricsManager
+
+request_id_var: ContextVar[str | None] = ContextVar("mircrew_request_id", default=None)
+
+
+class RequestContextFilter(logging.Filter):
+    """Stamp records with the current request id and stage timings.
+
+    Runs on the logging thread, before the record is queued, because the
+    context variables are not visible from the listener thread.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        record.stages = MetricsManager.current_spans()
+        return True
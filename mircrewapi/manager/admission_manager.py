@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+import math
+import time
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
+
+from mircrewapi.manager.metrics_manager import MetricsManager
+from mircrewapi.model.record.client_identity_record import ClientIdentityRecord
+from mircrewapi.model.service.client_usage import ClientUsage
+
+T = TypeVar("T")
+
+
+class AdmissionRejectedError(RuntimeError):
+    """Raised when a client is over its rate, its queue is full or it waited too long."""
+
+    def __init__(self, message: str, retry_after: float = 1.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class _ClientState:
+    __slots__ = ("identity", "tokens", "updated", "in_flight", "queued", "last_finish", "admitted", "cached", "rejected")
+
+    def __init__(self, identity: ClientIdentityRecord, tokens: float, now: float):
+        self.identity = identity
+        self.tokens = tokens
+        self.updated = now
+        self.in_flight = 0
+        self.queued = 0
+        self.last_finish = 0.0
+        self.admitted = 0
+        self.cached = 0
+        self.rejected = 0
+
+
+class _Waiter:
+    __slots__ = ("start_tag", "seq", "state", "future")
+
+    def __init__(self, start_tag: float, seq: int, state: _ClientState, future: asyncio.Future):
+        self.start_tag = start_tag
+        self.seq = seq
+        self.state = state
+        self.future = future
+
+
+class AdmissionManager:
+    """Per-client admission control in front of upstream-bound API work.
+
+    Clients are identified by API key (configured with a name and a weight),
+    else by ``X-Client-Id``, else by address. Each client has a token-bucket
+    rate limit and a concurrency limit. At most ``slots`` admitted requests
+    run at once; waiting ones are dispatched by start-time fair queuing, so
+    busy clients share the slots in proportion to their weights. A request is
+    rejected with a retry hint when its client is over the rate, its client's
+    queue is full, or it waited longer than ``max_wait``.
+
+    State is only touched from the event loop, so it needs no lock.
+    """
+
+    _MAX_IDLE_CLIENTS = 4096
+
+    def __init__(
+        self,
+        clients: dict[str, ClientIdentityRecord] | None = None,
+        slots: int = 2,
+        client_concurrency: int = 2,
+        rate_per_minute: float = 60.0,
+        burst: int = 10,
+        max_queue: int = 10,
+        max_wait: float = 30.0,
+        metrics_manager: MetricsManager | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._clients = clients or {}
+        self._slots = max(1, slots)
+        self._client_concurrency = max(1, client_concurrency)
+        self._rate = rate_per_minute / 60.0
+        self._burst = max(1, burst)
+        self._max_queue = max_queue
+        self._max_wait = max_wait
+        self._metrics = metrics_manager or MetricsManager(enabled=False)
+        self._clock = clock
+        self._states: dict[str, _ClientState] = {}
+        self._waiting: list[_Waiter] = []
+        self._in_flight = 0
+        self._virtual_time = 0.0
+        self._seq = 0
+        self._hold_seconds = 1.0
+
+    @staticmethod
+    def parse_clients(spec: str) -> dict[str, ClientIdentityRecord]:
+        """Parse ``name:key[:weight]`` entries separated by commas into clients by key."""
+        clients: dict[str, ClientIdentityRecord] = {}
+        for entry in spec.split(","):
+            parts = [part.strip() for part in entry.split(":")]
+            if not parts[0]:
+                continue
+            if len(parts) not in (2, 3) or not parts[1]:
+                raise ValueError(f"Invalid client entry {entry!r}, expected name:key[:weight]")
+            weight = float(parts[2]) if len(parts) == 3 else 1.0
+            if weight <= 0:
+                raise ValueError(f"Client {parts[0]} needs a positive weight")
+            clients[parts[1]] = ClientIdentityRecord(name=parts[0], weight=weight, keyed=True)
+        return clients
+
+    def identify(self, api_key: str | None, client_id: str | None, address: str | None) -> ClientIdentityRecord:
+        """Resolve the caller; an API key that is not configured raises PermissionError."""
+        if api_key:
+            identity = self._clients.get(api_key)
+            if identity is None:
+                raise PermissionError("Unknown API key")
+            return identity
+        if client_id:
+            return ClientIdentityRecord(name=f"client:{client_id.strip()[:64]}")
+        return ClientIdentityRecord(name=f"ip:{address or 'unknown'}")
+
+    def record_cached(self, identity: ClientIdentityRecord) -> None:
+        """Count a request answered from the cache; it bypasses limits and the queue."""
+        self._state(identity).cached += 1
+        self._metrics.increment("client_requests_total", client=identity.metrics_label, result="cached")
+
+    @asynccontextmanager
+    async def admit(self, identity: ClientIdentityRecord) -> AsyncIterator[float]:
+        """Wait for a slot under the client's limits; yields the seconds waited."""
+        state = self._state(identity)
+        # A request refused for a full queue must not also spend a rate token.
+        if state.queued >= self._max_queue:
+            self._reject(state, "queue_full", "Too many queued requests for this client", self._retry_hint())
+        self._take_token(state)
+
+        start_tag = max(self._virtual_time, state.last_finish)
+        state.last_finish = start_tag + 1.0 / identity.weight
+        self._seq += 1
+        waiter = _Waiter(start_tag, self._seq, state, asyncio.get_running_loop().create_future())
+        state.queued += 1
+        self._waiting.append(waiter)
+        self._dispatch()
+
+        started = self._clock()
+        try:
+            await asyncio.wait({waiter.future}, timeout=self._max_wait)
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+        if not waiter.future.done():
+            self._abandon(waiter)
+            self._reject(state, "timeout", "Timed out waiting for an upstream slot", self._retry_hint())
+
+        waited = self._clock() - started
+        state.admitted += 1
+        self._metrics.increment("client_requests_total", client=identity.metrics_label, result="admitted")
+        self._metrics.observe("admission_wait", waited)
+        try:
+            yield waited
+        finally:
+            held = self._clock() - started - waited
+            self._hold_seconds = 0.8 * self._hold_seconds + 0.2 * held
+            state.in_flight -= 1
+            self._in_flight -= 1
+            self._dispatch()
+
+    async def run(self, identity: ClientIdentityRecord, cached: bool, operation: Callable[[], Awaitable[T]]) -> T:
+        """Await ``operation`` straight away for cache hits, otherwise once admitted."""
+        if cached:
+            self.record_cached(identity)
+            return await operation()
+        async with self.admit(identity):
+            return await operation()
+
+    def usage(self) -> list[ClientUsage]:
+        now = self._clock()
+        return [
+            ClientUsage(
+                name=state.identity.name,
+                weight=state.identity.weight,
+                keyed=state.identity.keyed,
+                in_flight=state.in_flight,
+                queued=state.queued,
+                admitted=state.admitted,
+                cached=state.cached,
+                rejected=state.rejected,
+                tokens=round(self._refill(state, now), 3) if self._rate > 0 else None,
+            )
+            for state in sorted(self._states.values(), key=lambda state: state.identity.name)
+        ]
+
+    def _dispatch(self) -> None:
+        while self._in_flight < self._slots:
+            eligible = [waiter for waiter in self._waiting if waiter.state.in_flight < self._client_concurrency]
+            if not eligible:
+                return
+            waiter = min(eligible, key=lambda candidate: (candidate.start_tag, candidate.seq))
+            self._waiting.remove(waiter)
+            self._virtual_time = waiter.start_tag
+            waiter.state.queued -= 1
+            waiter.state.in_flight += 1
+            self._in_flight += 1
+            waiter.future.set_result(None)
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        if waiter in self._waiting:
+            self._waiting.remove(waiter)
+            waiter.state.queued -= 1
+        elif waiter.future.done():
+            # Granted while we stopped waiting: hand the slot on.
+            waiter.state.in_flight -= 1
+            self._in_flight -= 1
+            self._dispatch()
+
+    def _take_token(self, state: _ClientState) -> None:
+        if self._rate <= 0:
+            return
+        tokens = self._refill(state, self._clock())
+        if tokens < 1:
+            self._reject(state, "rate_limited", "Rate limit exceeded", (1 - tokens) / self._rate)
+        state.tokens = tokens - 1
+
+    def _refill(self, state: _ClientState, now: float) -> float:
+        state.tokens = min(self._burst, state.tokens + (now - state.updated) * self._rate)
+        state.updated = now
+        return state.tokens
+
+    def _retry_hint(self) -> float:
+        return self._hold_seconds * (len(self._waiting) + 1) / self._slots
+
+    def _reject(self, state: _ClientState, reason: str, message: str, retry_after: float) -> None:
+        state.rejected += 1
+        self._metrics.increment("client_requests_total", client=state.identity.metrics_label, result=reason)
+        raise AdmissionRejectedError(message, retry_after=max(1.0, math.ceil(retry_after)))
+
+    def _state(self, identity: ClientIdentityRecord) -> _ClientState:
+        state = self._states.get(identity.name)
+        if state is None:
+            if len(self._states) >= self._MAX_IDLE_CLIENTS:
+                self._prune()
+            state = self._states[identity.name] = _ClientState(identity, float(self._burst), self._clock())
+        return state
+
+    def _prune(self) -> None:
+        now = self._clock()
+        for name, state in list(self._states.items()):
+            idle = not state.in_flight and not state.queued
+            if idle and not state.identity.keyed and self._refill(state, now) >= self._burst:
+                del self._states[name]
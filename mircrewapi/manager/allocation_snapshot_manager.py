@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from datetime import datetime
+import threading
+import tracemalloc
+
+from mircrewapi.model.service.allocation_snapshot import AllocationDiff, AllocationDiffEntry, AllocationSnapshotInfo
+
+
+class AllocationSnapshotManager:
+    """Take bounded sets of ``tracemalloc`` snapshots and diff any two of them.
+
+    Tracing starts with the first snapshot, since it slows allocation down,
+    and stops again on ``clear``.
+    """
+
+    GROUP_BY = ("lineno", "filename", "traceback")
+    _IGNORED = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    )
+
+    def __init__(self, max_snapshots: int = 8, frames: int = 10):
+        self._max_snapshots = max_snapshots
+        self._frames = frames
+        self._snapshots: OrderedDict[int, tuple[AllocationSnapshotInfo, tracemalloc.Snapshot]] = OrderedDict()
+        self._next_id = 1
+        self._started_tracing = False
+        self._lock = threading.Lock()
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def take(self, label: str = "") -> AllocationSnapshotInfo:
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self._frames)
+                self._started_tracing = True
+            snapshot = tracemalloc.take_snapshot().filter_traces(self._IGNORED)
+            traced, peak = tracemalloc.get_traced_memory()
+            info = AllocationSnapshotInfo(
+                id=self._next_id,
+                label=label or f"snapshot-{self._next_id}",
+                traced_bytes=traced,
+                peak_bytes=peak,
+                taken_at=datetime.utcnow(),
+            )
+            self._next_id += 1
+            self._snapshots[info.id] = (info, snapshot)
+            while len(self._snapshots) > self._max_snapshots:
+                self._snapshots.popitem(last=False)
+        return info
+
+    def snapshots(self) -> list[AllocationSnapshotInfo]:
+        with self._lock:
+            return [info for info, _ in self._snapshots.values()]
+
+    def diff(self, first_id: int, second_id: int, group_by: str = "lineno", limit: int = 25) -> AllocationDiff:
+        """Largest allocation changes from ``first_id`` to ``second_id``."""
+        if group_by not in self.GROUP_BY:
+            raise ValueError(f"group_by must be one of {', '.join(self.GROUP_BY)}")
+        with self._lock:
+            if first_id not in self._snapshots or second_id not in self._snapshots:
+                raise KeyError("Unknown snapshot id")
+            first_info, first = self._snapshots[first_id]
+            second_info, second = self._snapshots[second_id]
+        stats = second.compare_to(first, group_by)
+        entries = [
+            AllocationDiffEntry(
+                location=self._location(stat.traceback, group_by),
+                size_bytes=stat.size,
+                size_diff_bytes=stat.size_diff,
+                count=stat.count,
+                count_diff=stat.count_diff,
+            )
+            for stat in stats[:limit]
+        ]
+        return AllocationDiff(first=first_info, second=second_info, group_by=group_by, entries=entries)
+
+    def clear(self) -> None:
+        """Drop every snapshot and stop tracing if it was started here."""
+        with self._lock:
+            self._snapshots.clear()
+            if self._started_tracing and tracemalloc.is_tracing():
+                tracemalloc.stop()
+            self._started_tracing = False
+
+    @staticmethod
+    def _location(traceback: tracemalloc.Traceback, group_by: str) -> str:
+        if group_by == "filename":
+            return traceback[0].filename
+        if group_by == "lineno":
+            return f"{traceback[0].filename}:{traceback[0].lineno}"
+        # Frames are stored oldest first; show the allocating frame first.
+        return " <- ".join(f"{frame.filename}:{frame.lineno}" for frame in reversed(traceback))
@@ -1,20 +1,44 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+import hashlib
+import logging
 from pathlib import Path
-from typing import Optional
+import re
+import threading
+from typing import Iterator, Optional
 
 from mircrewapi.model.service.cache_item import CacheItem
 
 
 class CacheManager:
-    """Simple filesystem cache with TTL persistence."""
+    """Simple filesystem cache with TTL persistence.
 
-    def __init__(self, cache_dir: str):
+    Expired entries stay readable as stale copies for ``stale_retention``
+    past their expiry; after that they are deleted on read, by ``prune`` and
+    by the optional background pruning thread.
+    """
+
+    _UNSAFE_RE = re.compile(r"[^0-9A-Za-z_-]+")
+    _HASHED_NAME_RE = re.compile(r"-[0-9a-f]{64}\.json$")
+    _PREFIX_LENGTH = 48
+
+    def __init__(self, cache_dir: str, stale_retention: timedelta = timedelta(days=7)):
         self._cache_dir = Path(cache_dir)
         self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._stale_retention = stale_retention
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self._migrate_legacy_entries()
 
-    def get(self, key: str) -> Optional[CacheItem]:
+    def get(self, key: str, allow_stale: bool = False) -> Optional[CacheItem]:
+        """Return the cached item, or None when missing or expired.
+
+        Expired entries are kept on disk so that ``allow_stale`` callers can
+        still serve them while upstream is unavailable, until they outlive
+        the stale retention.
+        """
         path = self._path_for(key)
         if not path.exists():
             return None
@@ -22,8 +46,10 @@ class CacheManager:
             item = CacheItem.model_validate_json(path.read_text())
         except Exception:
             return None
-        if datetime.utcnow() >= item.expires_at:
-            self.delete(key)
+        if self._is_dead(item):
+            path.unlink(missing_ok=True)
+            return None
+        if not allow_stale and datetime.utcnow() >= item.expires_at:
             return None
         return item
 
@@ -35,8 +61,11 @@ class CacheManager:
             created_at=now,
             expires_at=now + ttl,
         )
-        path = self._path_for(key)
-        path.write_text(item.model_dump_json())
+        return self.put(item)
+
+    def put(self, item: CacheItem) -> CacheItem:
+        """Store an item as is, keeping its timestamps (e.g. one loaded from a snapshot)."""
+        self._path_for(item.key).write_text(item.model_dump_json())
         return item
 
     def delete(self, key: str) -> None:
@@ -44,6 +73,76 @@ class CacheManager:
         if path.exists():
             path.unlink()
 
+    def iter_items(self) -> Iterator[tuple[CacheItem, int]]:
+        """Yield every readable entry, stale ones included, with its size on disk."""
+        for item, size, _ in self._scan():
+            if not self._is_dead(item):
+                yield item, size
+
+    def prune(self) -> int:
+        """Delete entries past their stale retention and return how many went."""
+        pruned = 0
+        for item, _, path in self._scan():
+            if self._is_dead(item):
+                path.unlink(missing_ok=True)
+                pruned += 1
+        return pruned
+
+    def start_pruning(self, interval: float) -> None:
+        if self._thread is not None or interval <= 0:
+            return
+
+        def _run() -> None:
+            while not self._stop.wait(interval):
+                try:
+                    pruned = self.prune()
+                except Exception:
+                    self._logger.exception("Cache prune failed.")
+                    continue
+                if pruned:
+                    self._logger.info("Pruned %d stale cache entries.", pruned)
+
+        self._thread = threading.Thread(target=_run, name="cache-prune", daemon=True)
+        self._thread.start()
+
+    def stop_pruning(self) -> None:
+        self._stop.set()
+
+    def _scan(self) -> Iterator[tuple[CacheItem, int, Path]]:
+        for path in self._cache_dir.glob("*.json"):
+            try:
+                item = CacheItem.model_validate_json(path.read_text())
+                size = path.stat().st_size
+            except Exception:
+                # Not a cache entry (e.g. browser state) or deleted meanwhile.
+                continue
+            yield item, size, path
+
+    def _is_dead(self, item: CacheItem) -> bool:
+        return datetime.utcnow() >= item.expires_at + self._stale_retention
+
+    def _migrate_legacy_entries(self) -> None:
+        """Move entries written under the old ``<sanitized key>.json`` names to their hashed path."""
+        for path in self._cache_dir.glob("*.json"):
+            if self._HASHED_NAME_RE.search(path.name):
+                continue
+            try:
+                item = CacheItem.model_validate_json(path.read_text())
+            except Exception:
+                # Not a cache entry (e.g. browser state).
+                continue
+            target = self._path_for(item.key)
+            try:
+                if target.exists():
+                    path.unlink()
+                else:
+                    path.replace(target)
+            except FileNotFoundError:
+                continue
+
     def _path_for(self, key: str) -> Path:
-        safe_key = "".join(ch for ch in key if ch.isalnum() or ch in ("-", "_"))
-        return self._cache_dir / f"{safe_key}.json"
+        # The readable prefix is only for humans browsing the directory; the
+        # sha256 of the full key keeps distinct keys in distinct files.
+        prefix = self._UNSAFE_RE.sub("-", key)[:self._PREFIX_LENGTH].strip("-")
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self._cache_dir / f"{prefix}-{digest}.json"
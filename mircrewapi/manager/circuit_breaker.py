@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+
+class UpstreamUnavailableError(RuntimeError):
+    """Raised when upstream access is short-circuited by the breaker."""
+
+    def __init__(self, message: str, retry_after: float = 0.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker with exponential backoff between trips."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        base_backoff: float = 30.0,
+        max_backoff: float = 900.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._failure_threshold = max(1, failure_threshold)
+        self._base_backoff = base_backoff
+        self._max_backoff = max_backoff
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._trips = 0
+        self._opened_at = 0.0
+        self._open_for = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def retry_after(self) -> float:
+        with self._lock:
+            if self._current_state() != self.OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self._open_for - self._clock())
+
+    def before_request(self) -> None:
+        """Admit an upstream call or raise UpstreamUnavailableError."""
+        with self._lock:
+            state = self._current_state()
+            if state == self.OPEN:
+                remaining = max(0.0, self._opened_at + self._open_for - self._clock())
+                raise UpstreamUnavailableError("Upstream circuit is open", retry_after=remaining)
+            if state == self.HALF_OPEN:
+                if self._probe_in_flight:
+                    raise UpstreamUnavailableError(
+                        "Upstream circuit is probing",
+                        retry_after=self._base_backoff,
+                    )
+                self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trips = 0
+            self._probe_in_flight = False
+
+    def release(self) -> None:
+        """Free a half-open probe slot without judging upstream health."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            state = self._current_state()
+            self._probe_in_flight = False
+            if state == self.HALF_OPEN:
+                self._trip()
+                return
+            self._failures += 1
+            if self._failures >= self._failure_threshold:
+                self._trip()
+
+    def _trip(self) -> None:
+        self._open_for = min(self._max_backoff, self._base_backoff * (2 ** self._trips))
+        self._trips += 1
+        self._failures = 0
+        self._opened_at = self._clock()
+        self._state = self.OPEN
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and self._clock() >= self._opened_at + self._open_for:
+            self._state = self.HALF_OPEN
+        return self._state
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+from datetime import datetime
+import json
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Iterable, Iterator
+
+from mircrewapi.model.record.magnet_record import MagnetRecord
+from mircrewapi.model.record.post_record import PostRecord
+
+
+class IndexManager:
+    """Persistent SQLite index of seen posts and magnets keyed by infohash."""
+
+    _SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS posts (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            id TEXT NOT NULL UNIQUE,
+            title TEXT NOT NULL,
+            url TEXT NOT NULL,
+            first_seen TEXT NOT NULL,
+            last_seen TEXT NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS magnets (
+            infohash TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            url TEXT NOT NULL,
+            display_name TEXT,
+            size INTEGER,
+            trackers TEXT NOT NULL DEFAULT '[]',
+            first_seen TEXT NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS post_magnets (
+            post_id TEXT NOT NULL,
+            infohash TEXT NOT NULL,
+            PRIMARY KEY (post_id, infohash)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS post_magnets_infohash ON post_magnets (infohash)",
+    )
+    # Columns carried by snapshots, in insertion order; posts get a local seq on import.
+    EXPORT_COLUMNS = {
+        "posts": ("id", "title", "url", "first_seen", "last_seen"),
+        "magnets": ("infohash", "title", "url", "display_name", "size", "trackers", "first_seen"),
+        "post_magnets": ("post_id", "infohash"),
+    }
+    _EXPORT_ORDER = {"posts": "seq", "magnets": "infohash", "post_magnets": "post_id, infohash"}
+
+    def __init__(self, db_path: str):
+        self._db_path = Path(db_path)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self._db_path), check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            for statement in self._SCHEMA:
+                self._connection.execute(statement)
+
+    def record_posts(self, posts: list[PostRecord]) -> list[PostRecord]:
+        """Upsert posts, stamp their cursors and return the ones seen for the first time."""
+        if not posts:
+            return []
+        now = datetime.utcnow().isoformat()
+        ids = [post.id for post in posts]
+        with self._lock, self._connection:
+            placeholders = ",".join("?" * len(ids))
+            known = {
+                row[0]
+                for row in self._connection.execute(f"SELECT id FROM posts WHERE id IN ({placeholders})", ids)
+            }
+            self._connection.executemany(
+                """
+                INSERT INTO posts (id, title, url, first_seen, last_seen) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET title = excluded.title, url = excluded.url,
+                    last_seen = excluded.last_seen
+                """,
+                [(post.id, post.title, post.url, now, now) for post in posts],
+            )
+            cursors = self._cursors_for(ids)
+        for post in posts:
+            post.cursor = cursors.get(post.id)
+        return [post for post in posts if post.id not in known]
+
+    def cursors_for(self, post_ids: list[str]) -> dict[str, int]:
+        """Return the monotonic first-seen sequence of each known post."""
+        if not post_ids:
+            return {}
+        with self._lock:
+            return self._cursors_for(post_ids)
+
+    def record_magnets(self, post_id: str, magnets: list[MagnetRecord]) -> None:
+        indexed = [magnet for magnet in magnets if magnet.infohash]
+        if not indexed:
+            return
+        now = datetime.utcnow().isoformat()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                """
+                INSERT INTO magnets (infohash, title, url, display_name, size, trackers, first_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(infohash) DO UPDATE SET
+                    display_name = COALESCE(excluded.display_name, magnets.display_name),
+                    size = COALESCE(excluded.size, magnets.size),
+                    trackers = CASE WHEN excluded.trackers != '[]' THEN excluded.trackers
+                        ELSE magnets.trackers END
+                """,
+                [
+                    (
+                        magnet.infohash,
+                        magnet.title,
+                        magnet.url,
+                        magnet.display_name,
+                        magnet.size,
+                        json.dumps(list(magnet.trackers)),
+                        now,
+                    )
+                    for magnet in indexed
+                ],
+            )
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO post_magnets (post_id, infohash) VALUES (?, ?)",
+                [(post_id, magnet.infohash) for magnet in indexed],
+            )
+
+    def recent_titles(self, limit: int) -> list[str]:
+        """Return up to ``limit`` post titles, oldest first."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT title FROM (SELECT seq, title FROM posts ORDER BY seq DESC LIMIT ?) ORDER BY seq",
+                (limit,),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def recent_posts(self, limit: int) -> list[PostRecord]:
+        """Return up to ``limit`` posts, newest first."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT seq, id, title, url FROM posts ORDER BY seq DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [PostRecord(id=row["id"], title=row["title"], url=row["url"], cursor=row["seq"]) for row in rows]
+
+    def first_seen_for(self, post_ids: list[str]) -> dict[str, datetime]:
+        if not post_ids:
+            return {}
+        placeholders = ",".join("?" * len(post_ids))
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT id, first_seen FROM posts WHERE id IN ({placeholders})",
+                post_ids,
+            ).fetchall()
+        return {row[0]: datetime.fromisoformat(row[1]) for row in rows}
+
+    def magnets_for_post(self, post_id: str) -> list[MagnetRecord]:
+        with self._lock:
+            rows = self._connection.execute(
+                """
+                SELECT m.* FROM post_magnets pm JOIN magnets m ON m.infohash = pm.infohash
+                WHERE pm.post_id = ?
+                ORDER BY m.first_seen, m.infohash
+                """,
+                (post_id,),
+            ).fetchall()
+        return [self._magnet_from_row(row) for row in rows]
+
+    def get_magnet(self, infohash: str) -> MagnetRecord | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT * FROM magnets WHERE infohash = ?",
+                (infohash,),
+            ).fetchone()
+        if row is None:
+            return None
+        return self._magnet_from_row(row)
+
+    def posts_for_magnet(self, infohash: str) -> list[PostRecord]:
+        with self._lock:
+            rows = self._connection.execute(
+                """
+                SELECT pm.post_id AS id, p.title AS title, p.url AS url
+                FROM post_magnets pm LEFT JOIN posts p ON p.id = pm.post_id
+                WHERE pm.infohash = ?
+                ORDER BY pm.post_id
+                """,
+                (infohash,),
+            ).fetchall()
+        return [PostRecord(id=row["id"], title=row["title"] or "", url=row["url"] or "") for row in rows]
+
+    def export_rows(self, table: str, batch_size: int = 1000) -> Iterator[dict]:
+        """Stream every row of an exportable table as a dict."""
+        columns = self.EXPORT_COLUMNS[table]
+        with self._lock:
+            cursor = self._connection.execute(
+                f"SELECT {', '.join(columns)} FROM {table} ORDER BY {self._EXPORT_ORDER[table]}"
+            )
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for row in rows:
+                yield dict(zip(columns, row))
+
+    def import_rows(self, table: str, rows: Iterable[dict], batch_size: int = 5000) -> int:
+        """Bulk insert exported rows in one transaction, keeping rows already present."""
+        columns = self.EXPORT_COLUMNS[table]
+        statement = (
+            f"INSERT OR IGNORE INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))})"
+        )
+        inserted = 0
+        batch: list[tuple] = []
+        with self._lock, self._connection:
+            for row in rows:
+                batch.append(tuple(row.get(column) for column in columns))
+                if len(batch) >= batch_size:
+                    inserted += self._connection.executemany(statement, batch).rowcount
+                    batch.clear()
+            if batch:
+                inserted += self._connection.executemany(statement, batch).rowcount
+        return inserted
+
+    def _cursors_for(self, post_ids: list[str]) -> dict[str, int]:
+        placeholders = ",".join("?" * len(post_ids))
+        rows = self._connection.execute(f"SELECT id, seq FROM posts WHERE id IN ({placeholders})", post_ids)
+        return {row[0]: row[1] for row in rows}
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    @staticmethod
+    def _magnet_from_row(row: sqlite3.Row) -> MagnetRecord:
+        return MagnetRecord(
+            title=row["title"],
+            url=row["url"],
+            infohash=row["infohash"],
+            display_name=row["display_name"],
+            size=row["size"],
+            trackers=tuple(json.loads(row["trackers"])),
+        )
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+import signal
+import threading
+import time
+from typing import Callable
+
+from mircrewapi.manager.metrics_manager import MetricsManager
+from mircrewapi.model.service.memory_sample import MemorySample
+
+
+class MemoryWatchdog:
+    """Sample the RSS of this process and of its child processes from ``/proc``.
+
+    Descendant processes are the headless browsers, started by the
+    Playwright driver. With a budget set, browser launches wait (up to
+    ``gate_timeout``) while the descendants are above it, so running browsers
+    finish and close before new ones start; browser processes still alive
+    while no browser is open are leaked and get terminated, including ones
+    seen earlier that were reparented to init when their driver exited.
+    ``budget_bytes`` 0 only samples.
+    """
+
+    _BROWSER_NAMES = ("firefox", "camoufox")
+
+    def __init__(
+        self,
+        budget_bytes: int = 0,
+        interval: float = 30.0,
+        gate_timeout: float = 60.0,
+        metrics_manager: MetricsManager | None = None,
+        proc_root: str = "/proc",
+        pid: int | None = None,
+        kill: Callable[[int, int], None] = os.kill,
+    ):
+        self.budget_bytes = budget_bytes
+        self._interval = interval
+        self._gate_timeout = gate_timeout
+        self._metrics = metrics_manager or MetricsManager(enabled=False)
+        self._proc = Path(proc_root)
+        self._pid = pid or os.getpid()
+        self._kill = kill
+        self._stop = threading.Event()
+        # Browser processes seen among the descendants, by pid, with their start time.
+        self._seen_browsers: dict[int, str] = {}
+        self._thread: threading.Thread | None = None
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def enabled(self) -> bool:
+        return self.budget_bytes > 0
+
+    def sample(self) -> MemorySample:
+        table = self._process_table()
+        descendants = self._descendants(table)
+        self._remember_browsers(table, descendants)
+        children = {pid: rss for pid in descendants if (rss := self._rss(pid)) is not None}
+        children_rss = sum(children.values())
+        sample = MemorySample(
+            process_rss=self._rss(self._pid),
+            children_rss=children_rss,
+            children=children,
+            budget=self.budget_bytes,
+            over_budget=self.enabled and children_rss > self.budget_bytes,
+        )
+        if sample.process_rss is not None:
+            self._metrics.set_gauge("memory_rss_bytes", sample.process_rss, process="self")
+        self._metrics.set_gauge("memory_rss_bytes", children_rss, process="children")
+        return sample
+
+    def wait_for_headroom(self, poll: float = 0.5) -> float:
+        """Block while the children are over budget; return the seconds waited."""
+        if not self.enabled:
+            return 0.0
+        started = time.monotonic()
+        while self.sample().over_budget:
+            waited = time.monotonic() - started
+            if waited >= self._gate_timeout:
+                self._logger.warning("Browser memory still over budget after %.0fs, launching anyway.", waited)
+                self._metrics.increment("browser_memory_gate_total", result="timeout")
+                return waited
+            time.sleep(poll)
+        waited = time.monotonic() - started
+        if waited:
+            self._metrics.increment("browser_memory_gate_total", result="waited")
+        return waited
+
+    def check(self, browsers_open: Callable[[], int]) -> MemorySample:
+        """Sample once and terminate leaked browsers when over budget with none open."""
+        sample = self.sample()
+        if sample.over_budget:
+            self._metrics.increment("memory_over_budget_total")
+            if not browsers_open():
+                self.terminate_leaked_browsers()
+        return sample
+
+    def terminate_leaked_browsers(self) -> list[int]:
+        table = self._process_table()
+        descendants = self._descendants(table)
+        self._remember_browsers(table, descendants)
+        terminated = []
+        for pid in sorted(self._seen_browsers):
+            if pid not in table or table[pid][1] != self._seen_browsers[pid]:
+                # Exited, or the pid now belongs to another process.
+                del self._seen_browsers[pid]
+                continue
+            if table[pid][0] in self._seen_browsers:
+                # Browser helpers go down with their parent browser.
+                continue
+            try:
+                self._kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                continue
+            terminated.append(pid)
+        if terminated:
+            self._logger.warning("Terminated leaked browser processes %s.", terminated)
+            self._metrics.increment("browser_recycles_total", len(terminated))
+        return terminated
+
+    def start(self, browsers_open: Callable[[], int]) -> None:
+        if self._thread is not None or self._interval <= 0:
+            return
+
+        def _run() -> None:
+            while not self._stop.wait(self._interval):
+                try:
+                    self.check(browsers_open)
+                except Exception:
+                    self._logger.exception("Memory check failed.")
+
+        self._thread = threading.Thread(target=_run, name="memory-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _descendants(self, table: dict[int, tuple[int, str]]) -> list[int]:
+        children: dict[int, list[int]] = {}
+        for pid, (ppid, _) in table.items():
+            children.setdefault(ppid, []).append(pid)
+        found: list[int] = []
+        pending = [self._pid]
+        while pending:
+            below = sorted(children.get(pending.pop(), ()))
+            found.extend(below)
+            pending.extend(below)
+        return sorted(found)
+
+    def _remember_browsers(self, table: dict[int, tuple[int, str]], descendants: list[int]) -> None:
+        for pid in descendants:
+            if pid not in self._seen_browsers and self._is_browser(pid):
+                self._seen_browsers[pid] = table[pid][1]
+
+    def _is_browser(self, pid: int) -> bool:
+        name = self._name(pid).lower()
+        return any(browser in name for browser in self._BROWSER_NAMES)
+
+    def _process_table(self) -> dict[int, tuple[int, str]]:
+        """Map every pid to its parent pid and start time."""
+        table = {}
+        for stat in self._proc.glob("[0-9]*/stat"):
+            try:
+                # The command name may contain spaces and parentheses; the fields follow the last ')'.
+                fields = stat.read_text().rsplit(")", 1)[1].split()
+                table[int(stat.parent.name)] = (int(fields[1]), fields[19] if len(fields) > 19 else "")
+            except (OSError, IndexError, ValueError):
+                continue
+        return table
+
+    def _rss(self, pid: int) -> int | None:
+        for line in self._status_lines(pid):
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+        return None
+
+    def _name(self, pid: int) -> str:
+        for line in self._status_lines(pid):
+            if line.startswith("Name:"):
+                return line.split(":", 1)[1].strip()
+        return ""
+
+    def _status_lines(self, pid: int) -> list[str]:
+        try:
+            return (self._proc / str(pid) / "status").read_text().splitlines()
+        except OSError:
+            return []
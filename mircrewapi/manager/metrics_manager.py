@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from contextvars import ContextVar, Token
+import threading
+import time
+
+_request_spans: ContextVar[list[tuple[str, float]] | None] = ContextVar(
+    "mircrew_request_spans",
+    default=None,
+)
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("_manager", "_name", "_started")
+
+    def __init__(self, manager: "MetricsManager", name: str):
+        self._manager = manager
+        self._name = name
+        self._started = 0.0
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._manager.observe(self._name, time.perf_counter() - self._started)
+        return False
+
+
+class _Histogram:
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.total = 0.0
+        self.count = 0
+
+
+class MetricsManager:
+    """In-process stage histograms, counters and gauges with Prometheus text export."""
+
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+    _PREFIX = "mircrew"
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._histograms: dict[str, _Histogram] = {}
+        self._counters: dict[tuple[str, tuple[tuple[str, str], ...]], float] = {}
+        self._gauges: dict[tuple[str, tuple[tuple[str, str], ...]], float] = {}
+
+    def span(self, name: str):
+        """Time a named stage; a shared no-op context when disabled."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def observe(self, name: str, seconds: float) -> None:
+        if not self.enabled:
+            return
+        spans = _request_spans.get()
+        if spans is not None:
+            spans.append((name, seconds))
+        index = bisect_left(self.BUCKETS, seconds)
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = _Histogram(len(self.BUCKETS) + 1)
+            histogram.counts[index] += 1
+            histogram.total += seconds
+            histogram.count += 1
+
+    def increment(self, name: str, amount: float = 1, **labels: str) -> None:
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def counter(self, name: str, **labels: str) -> float:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._gauges[key] = value
+
+    def begin_request(self) -> Token | None:
+        if not self.enabled:
+            return None
+        return _request_spans.set([])
+
+    def end_request(self, token: Token | None) -> list[tuple[str, float]]:
+        if token is None:
+            return []
+        spans = _request_spans.get() or []
+        _request_spans.reset(token)
+        return spans
+
+    @staticmethod
+    def current_spans() -> list[tuple[str, float]]:
+        return list(_request_spans.get() or ())
+
+    @staticmethod
+    def server_timing(spans: list[tuple[str, float]]) -> str:
+        totals: dict[str, float] = {}
+        for name, seconds in spans:
+            totals[name] = totals.get(name, 0.0) + seconds
+        return ", ".join(f"{name};dur={seconds * 1000:.1f}" for name, seconds in totals.items())
+
+    def render_prometheus(self) -> str:
+        lines: list[str] = []
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = sorted(self._counters.items())
+            gauges = sorted(self._gauges.items())
+
+        histogram_name = f"{self._PREFIX}_stage_duration_seconds"
+        lines.append(f"# HELP {histogram_name} Duration of instrumented stages.")
+        lines.append(f"# TYPE {histogram_name} histogram")
+        for stage, histogram in histograms:
+            cumulative = 0
+            for bound, count in zip(self.BUCKETS, histogram.counts):
+                cumulative += count
+                lines.append(f'{histogram_name}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+            lines.append(f'{histogram_name}_bucket{{stage="{stage}",le="+Inf"}} {histogram.count}')
+            lines.append(f'{histogram_name}_sum{{stage="{stage}"}} {histogram.total:.6f}')
+            lines.append(f'{histogram_name}_count{{stage="{stage}"}} {histogram.count}')
+
+        typed: set[str] = set()
+        for kind, series in (("counter", counters), ("gauge", gauges)):
+            for (name, labels), value in series:
+                metric = f"{self._PREFIX}_{name}"
+                if metric not in typed:
+                    lines.append(f"# TYPE {metric} {kind}")
+                    typed.add(metric)
+                label_text = ",".join(f'{key}="{_escape_label(val)}"' for key, val in labels)
+                suffix = f"{{{label_text}}}" if label_text else ""
+                lines.append(f"{metric}{suffix} {value:g}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
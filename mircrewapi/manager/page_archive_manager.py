@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import gzip
+import hashlib
+import logging
+import os
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Iterator
+
+from mircrewapi.model.record.archived_page_record import ArchivedPageRecord
+
+try:
+    import zstandard
+except ImportError:  # Optional: fall back to gzip when zstandard is not installed.
+    zstandard = None
+
+
+class PageArchiveManager:
+    """Compressed, content-addressed archive of fetched upstream pages keyed by URL.
+
+    Blobs are named by the sha256 of the HTML, so identical pages are stored
+    once; a small SQLite table maps each URL to its latest blob together with
+    the validators (ETag/Last-Modified) needed for conditional revalidation.
+    A blob is deleted as soon as no URL references it any more; ``prune``
+    additionally drops pages older than ``max_age`` or beyond ``max_bytes``.
+    """
+
+    _SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS pages (
+            url TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            ref TEXT NOT NULL,
+            digest TEXT NOT NULL,
+            codec TEXT NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            fetched_at TEXT NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS pages_kind ON pages (kind)",
+        "CREATE INDEX IF NOT EXISTS pages_digest ON pages (digest)",
+    )
+    _EXTENSIONS = {"zstd": "zst", "gzip": "gz"}
+
+    def __init__(
+        self,
+        archive_dir: str,
+        codec: str | None = None,
+        max_age: timedelta | None = None,
+        max_bytes: int | None = None,
+    ):
+        self._archive_dir = Path(archive_dir)
+        self._blob_dir = self._archive_dir / "blobs"
+        self._blob_dir.mkdir(parents=True, exist_ok=True)
+        self.codec = codec or ("zstd" if zstandard is not None else "gzip")
+        if self.codec == "zstd" and zstandard is None:
+            raise ValueError("zstd archive codec requires the zstandard package")
+        self._max_age = max_age
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self._connection = sqlite3.connect(str(self._archive_dir / "pages.sqlite3"), check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            for statement in self._SCHEMA:
+                self._connection.execute(statement)
+
+    def store(
+        self,
+        url: str,
+        html: str,
+        kind: str,
+        ref: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> ArchivedPageRecord:
+        raw = html.encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self._blob_path(digest, self.codec)
+        # Compress outside the lock; the blob itself is written under it so GC never races a store.
+        compressed = None if path.exists() else self._compress(raw)
+        record = ArchivedPageRecord(
+            url=url,
+            kind=kind,
+            ref=ref,
+            digest=digest,
+            codec=self.codec,
+            fetched_at=datetime.utcnow(),
+            etag=etag,
+            last_modified=last_modified,
+        )
+        with self._lock, self._connection:
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_name(f"{path.name}.tmp")
+                tmp_path.write_bytes(compressed if compressed is not None else self._compress(raw))
+                os.replace(tmp_path, path)
+            previous = self._connection.execute("SELECT digest, codec FROM pages WHERE url = ?", (url,)).fetchone()
+            self._connection.execute(
+                """
+                INSERT INTO pages (url, kind, ref, digest, codec, etag, last_modified, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET kind = excluded.kind, ref = excluded.ref,
+                    digest = excluded.digest, codec = excluded.codec, etag = excluded.etag,
+                    last_modified = excluded.last_modified, fetched_at = excluded.fetched_at
+                """,
+                (url, kind, ref, digest, self.codec, etag, last_modified, record.fetched_at.isoformat()),
+            )
+            if previous is not None and previous["digest"] != digest:
+                self._delete_if_unreferenced(previous["digest"], previous["codec"])
+        return record
+
+    def get(self, url: str) -> ArchivedPageRecord | None:
+        with self._lock:
+            row = self._connection.execute("SELECT * FROM pages WHERE url = ?", (url,)).fetchone()
+        return self._record_from_row(row) if row else None
+
+    def read(self, record: ArchivedPageRecord) -> str | None:
+        path = self._blob_path(record.digest, record.codec)
+        if not path.exists():
+            return None
+        return self._decompress(path.read_bytes(), record.codec).decode("utf-8")
+
+    def touch(self, url: str) -> None:
+        """Mark an archived page as revalidated (upstream answered 304)."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE pages SET fetched_at = ? WHERE url = ?",
+                (datetime.utcnow().isoformat(), url),
+            )
+
+    def iter_pages(self, kind: str | None = None) -> Iterator[ArchivedPageRecord]:
+        query = "SELECT * FROM pages" + (" WHERE kind = ?" if kind else "") + " ORDER BY fetched_at"
+        with self._lock:
+            rows = self._connection.execute(query, (kind,) if kind else ()).fetchall()
+        for row in rows:
+            yield self._record_from_row(row)
+
+    def prune(self, now: datetime | None = None) -> int:
+        """Apply the retention limits and delete unreferenced blobs; return how many blobs were removed."""
+        now = now or datetime.utcnow()
+        with self._lock, self._connection:
+            if self._max_age is not None:
+                self._connection.execute(
+                    "DELETE FROM pages WHERE fetched_at < ?", ((now - self._max_age).isoformat(),)
+                )
+            if self._max_bytes is not None:
+                self._connection.executemany(
+                    "DELETE FROM pages WHERE url = ?", [(url,) for url in self._over_budget()]
+                )
+            return self._collect_garbage()
+
+    def start_pruning(self, interval: float) -> None:
+        if self._thread is not None or interval <= 0:
+            return
+
+        def _run() -> None:
+            while not self._stop.wait(interval):
+                try:
+                    pruned = self.prune()
+                except Exception:
+                    self._logger.exception("Archive prune failed.")
+                    continue
+                if pruned:
+                    self._logger.info("Pruned %d archived page blobs.", pruned)
+
+        self._thread = threading.Thread(target=_run, name="archive-prune", daemon=True)
+        self._thread.start()
+
+    def stop_pruning(self) -> None:
+        self._stop.set()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _over_budget(self) -> list[str]:
+        """URLs to drop, oldest first, so the distinct blobs still referenced fit in ``max_bytes``."""
+        rows = self._connection.execute("SELECT url, digest, codec FROM pages ORDER BY fetched_at DESC").fetchall()
+        kept: set[str] = set()
+        total = 0
+        dropped: list[str] = []
+        for row in rows:
+            if row["digest"] in kept:
+                continue
+            path = self._blob_path(row["digest"], row["codec"])
+            size = path.stat().st_size if path.exists() else 0
+            if total + size > self._max_bytes:
+                dropped.append(row["url"])
+                continue
+            kept.add(row["digest"])
+            total += size
+        return dropped
+
+    def _collect_garbage(self) -> int:
+        rows = self._connection.execute("SELECT DISTINCT digest, codec FROM pages").fetchall()
+        referenced = {self._blob_path(row["digest"], row["codec"]) for row in rows}
+        removed = 0
+        for path in self._blob_dir.glob("*/*"):
+            if path not in referenced:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def _delete_if_unreferenced(self, digest: str, codec: str) -> None:
+        if self._connection.execute("SELECT 1 FROM pages WHERE digest = ? LIMIT 1", (digest,)).fetchone() is None:
+            self._blob_path(digest, codec).unlink(missing_ok=True)
+
+    def _blob_path(self, digest: str, codec: str) -> Path:
+        return self._blob_dir / digest[:2] / f"{digest}.html.{self._EXTENSIONS[codec]}"
+
+    def _compress(self, raw: bytes) -> bytes:
+        if self.codec == "zstd":
+            return zstandard.ZstdCompressor(level=10).compress(raw)
+        return gzip.compress(raw, compresslevel=6)
+
+    @staticmethod
+    def _decompress(data: bytes, codec: str) -> bytes:
+        if codec == "zstd":
+            if zstandard is None:
+                raise ValueError("Archived page is zstd compressed but zstandard is not installed")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+
+    @staticmethod
+    def _record_from_row(row: sqlite3.Row) -> ArchivedPageRecord:
+        return ArchivedPageRecord(
+            url=row["url"],
+            kind=row["kind"],
+            ref=row["ref"],
+            digest=row["digest"],
+            codec=row["codec"],
+            fetched_at=datetime.fromisoformat(row["fetched_at"]),
+            etag=row["etag"],
+            last_modified=row["last_modified"],
+        )
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from concurrent.futures import Future, wait
+from datetime import datetime
+import logging
+import queue
+import threading
+from typing import Callable
+
+from mircrewapi.manager.metrics_manager import MetricsManager
+from mircrewapi.manager.upstream_budget import UpstreamBudget
+
+
+class PrefetchManager:
+    """Single background worker for speculative, low-priority upstream fetches.
+
+    Work is keyed so the same key is never queued or run twice at once. Work
+    is refused when queued and cancelled before it starts whenever the
+    upstream budget has no headroom, so prefetching never competes with
+    foreground requests. ``top_k`` is how many search results are prefetched;
+    0 disables prefetching. A foreground request waits at most
+    ``claim_timeout`` for a running prefetch of the same key.
+    """
+
+    def __init__(
+        self,
+        top_k: int = 0,
+        upstream_budget: UpstreamBudget | None = None,
+        metrics_manager: MetricsManager | None = None,
+        min_tokens: float = 2.0,
+        max_queue: int = 32,
+        claim_timeout: float = 2.0,
+    ):
+        self.top_k = top_k
+        self._budget = upstream_budget
+        self._metrics = metrics_manager or MetricsManager(enabled=False)
+        self._min_tokens = min_tokens
+        self._claim_timeout = claim_timeout
+        self._queue: queue.Queue[tuple[str, Callable[[], object], Future]] = queue.Queue(maxsize=max_queue)
+        self._pending: dict[str, Future] = {}
+        self._prefetched: dict[str, datetime] = {}
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def enabled(self) -> bool:
+        return self.top_k > 0
+
+    def submit(self, key: str, task: Callable[[], object]) -> bool:
+        """Queue ``task`` unless ``key`` is already pending or the budget is tight."""
+        if not self.enabled:
+            return False
+        if not self._has_headroom():
+            self._metrics.increment("prefetch_total", result="skipped_budget")
+            return False
+        future: Future = Future()
+        with self._lock:
+            if key in self._pending:
+                self._metrics.increment("prefetch_total", result="deduped")
+                return False
+            try:
+                self._queue.put_nowait((key, task, future))
+            except queue.Full:
+                self._metrics.increment("prefetch_total", result="dropped")
+                return False
+            self._pending[key] = future
+            self._ensure_worker()
+        self._metrics.increment("prefetch_total", result="queued")
+        return True
+
+    def claim(self, key: str, timeout: float | None = None) -> None:
+        """Let a foreground request take over ``key``.
+
+        Queued work is cancelled so the caller fetches it itself; running work
+        is awaited briefly so its result can land in the cache first, after
+        which the caller fetches it itself.
+        """
+        with self._lock:
+            future = self._pending.get(key)
+        if future is None or future.cancel():
+            return
+        _, not_done = wait([future], timeout=self._claim_timeout if timeout is None else timeout)
+        if not_done:
+            self._metrics.increment("prefetch_total", result="claim_timeout")
+
+    def join(self) -> None:
+        """Block until every queued prefetch has finished or been cancelled."""
+        self._queue.join()
+
+    def mark_prefetched(self, key: str, expires_at: datetime) -> None:
+        with self._lock:
+            now = datetime.utcnow()
+            if len(self._prefetched) > 4096:
+                self._prefetched = {k: v for k, v in self._prefetched.items() if v > now}
+            self._prefetched[key] = expires_at
+
+    def was_prefetched(self, key: str) -> bool:
+        """True while the cache entry for ``key`` is one written by a prefetch."""
+        with self._lock:
+            expires_at = self._prefetched.get(key)
+        return expires_at is not None and expires_at > datetime.utcnow()
+
+    def forget(self, key: str) -> None:
+        with self._lock:
+            self._prefetched.pop(key, None)
+
+    def _has_headroom(self) -> bool:
+        return self._budget is None or self._budget.has_headroom(self._min_tokens)
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="magnet-prefetch", daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            key, task, future = self._queue.get()
+            try:
+                if not future.set_running_or_notify_cancel():
+                    self._metrics.increment("prefetch_total", result="claimed")
+                    continue
+                if not self._has_headroom():
+                    self._metrics.increment("prefetch_total", result="cancelled")
+                    future.set_result(None)
+                    continue
+                try:
+                    future.set_result(task())
+                    self._metrics.increment("prefetch_total", result="done")
+                except Exception as exc:
+                    self._logger.info("Prefetch of %s failed: %s", key, exc)
+                    self._metrics.increment("prefetch_total", result="failed")
+                    future.set_exception(exc)
+            finally:
+                with self._lock:
+                    if self._pending.get(key) is future:
+                        del self._pending[key]
+                self._queue.task_done()
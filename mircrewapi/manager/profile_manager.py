@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from contextvars import ContextVar
+from datetime import datetime
+from functools import wraps
+import json
+import logging
+import os
+from pathlib import Path
+import re
+import sys
+import threading
+import time
+from typing import Callable, TypeVar
+import uuid
+
+from mircrewapi.manager.metrics_manager import MetricsManager
+from mircrewapi.model.service.request_profile import ProfileSpan, ProfileStack, RequestProfile, RequestProfileInfo
+
+T = TypeVar("T")
+
+_current_capture: ContextVar[ProfileCapture | None] = ContextVar("mircrew_profile_capture", default=None)
+
+
+class ProfileCapture:
+    """A request being watched; it is sampled once forced or past its deadline.
+
+    Only the request's own threads are sampled: the event loop thread while
+    it runs the request's task, and the threads attached through
+    ``ProfileManager.bind`` while they run work handed off by the request.
+    """
+
+    __slots__ = (
+        "id", "method", "path", "forced", "started", "deadline", "stacks", "samples",
+        "task", "loop", "loop_thread", "threads", "token", "_lock",
+    )
+
+    def __init__(self, method: str, path: str, forced: bool, started: float, deadline: float):
+        self.id = uuid.uuid4().hex[:16]
+        self.method = method
+        self.path = path
+        self.forced = forced
+        self.started = started
+        self.deadline = deadline
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self.task: asyncio.Task | None = None
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.loop_thread = 0
+        self.threads: Counter[int] = Counter()
+        self.token = None
+        self._lock = threading.Lock()
+
+    def attach(self, ident: int) -> None:
+        with self._lock:
+            self.threads[ident] += 1
+
+    def detach(self, ident: int) -> None:
+        with self._lock:
+            self.threads[ident] -= 1
+            if self.threads[ident] <= 0:
+                del self.threads[ident]
+
+    def thread_idents(self) -> set[int]:
+        with self._lock:
+            idents = set(self.threads)
+        if self.task is not None and asyncio.current_task(self.loop) is self.task:
+            idents.add(self.loop_thread)
+        return idents
+
+
+class ProfileManager:
+    """Sampling profiler for slow or explicitly flagged requests.
+
+    Watched requests cost one set insertion until they outlive ``threshold``
+    (or immediately, when forced); from then on a single sampler thread walks
+    the stacks of the request's threads each ``interval``, including time
+    spent waiting on the browser or the threadpool. Stacks are kept folded (``thread;outer;...;inner``
+    with a sample count), the format flamegraph.pl and speedscope read.
+    Profiles are written as JSON to ``store_dir`` by the sampler thread, off
+    the event loop, keeping the newest ``max_profiles``. ``threshold`` 0 only
+    profiles forced requests.
+    """
+
+    _ID_RE = re.compile(r"^[0-9a-f]{16}$")
+    _FLUSH_TIMEOUT = 5.0
+
+    def __init__(
+        self,
+        store_dir: str,
+        threshold: float = 0.0,
+        interval: float = 0.01,
+        max_profiles: int = 50,
+        max_depth: int = 64,
+        metrics_manager: MetricsManager | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.threshold = threshold
+        self.interval = interval
+        self._store = Path(store_dir)
+        self._max_profiles = max_profiles
+        self._max_depth = max_depth
+        self._metrics = metrics_manager or MetricsManager(enabled=False)
+        self._clock = clock
+        self._active: set[ProfileCapture] = set()
+        self._writes: list[tuple[RequestProfile, Counter[str]]] = []
+        self._unwritten = 0
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold > 0
+
+    def begin(self, method: str, path: str, forced: bool = False) -> ProfileCapture:
+        now = self._clock()
+        capture = ProfileCapture(method, path, forced, now, now if forced else now + self.threshold)
+        try:
+            capture.task = asyncio.current_task()
+        except RuntimeError:
+            capture.task = None
+        if capture.task is not None:
+            capture.loop = asyncio.get_running_loop()
+            capture.loop_thread = threading.get_ident()
+        else:
+            capture.attach(threading.get_ident())
+        capture.token = _current_capture.set(capture)
+        with self._condition:
+            self._active.add(capture)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+        return capture
+
+    def end(
+        self,
+        capture: ProfileCapture,
+        status_code: int | None,
+        spans: list[tuple[str, float]],
+    ) -> RequestProfileInfo | None:
+        """Stop watching ``capture``; store and return its profile when it was triggered."""
+        duration = self._clock() - capture.started
+        _current_capture.reset(capture.token)
+        with self._condition:
+            self._active.discard(capture)
+            self._condition.notify_all()
+        if not capture.forced and duration < self.threshold:
+            return None
+        trigger = "header" if capture.forced else "threshold"
+        profile = RequestProfile(
+            id=capture.id,
+            method=capture.method,
+            path=capture.path,
+            trigger=trigger,
+            status_code=status_code,
+            duration_seconds=round(duration, 6),
+            samples=capture.samples,
+            interval_seconds=self.interval,
+            captured_at=datetime.utcnow(),
+            spans=[ProfileSpan(name=name, seconds=round(seconds, 6)) for name, seconds in spans],
+        )
+        with self._condition:
+            self._writes.append((profile, capture.stacks))
+            self._unwritten += 1
+            self._condition.notify_all()
+        self._metrics.increment("profiles_captured_total", trigger=trigger)
+        self._logger.info("Captured %s profile %s for %s %s.", trigger, capture.id, capture.method, capture.path)
+        return RequestProfileInfo(**profile.model_dump(exclude={"spans", "top_stacks"}))
+
+    @staticmethod
+    def bind(function: Callable[..., T]) -> Callable[..., T]:
+        """Attribute the thread that runs ``function`` to the request profiled in the caller's context.
+
+        Wrap work before handing it to another thread; outside a watched
+        request ``function`` is returned unchanged.
+        """
+        capture = _current_capture.get()
+        if capture is None:
+            return function
+
+        @wraps(function)
+        def bound(*args, **kwargs):
+            ident = threading.get_ident()
+            capture.attach(ident)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                capture.detach(ident)
+
+        return bound
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every ended profile is on disk; False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._unwritten, timeout=timeout)
+
+    def profiles(self) -> list[RequestProfileInfo]:
+        """Stored profiles, newest first."""
+        self.flush(timeout=self._FLUSH_TIMEOUT)
+        listed = []
+        for path in self._profile_paths():
+            try:
+                document = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+            document.pop("spans", None)
+            document.pop("stacks", None)
+            listed.append(RequestProfileInfo(**document))
+        return listed
+
+    def profile(self, profile_id: str, top: int = 20) -> RequestProfile:
+        document = self._read(profile_id)
+        stacks = Counter(document.pop("stacks"))
+        return RequestProfile(
+            **document,
+            top_stacks=[ProfileStack(stack=stack, samples=count) for stack, count in stacks.most_common(top)],
+        )
+
+    def folded(self, profile_id: str) -> str:
+        """The profile's stacks in folded format, one ``stack count`` line each."""
+        stacks = self._read(profile_id)["stacks"]
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(stacks.items()))
+
+    def clear(self) -> int:
+        self.flush(timeout=self._FLUSH_TIMEOUT)
+        paths = self._profile_paths()
+        for path in paths:
+            path.unlink(missing_ok=True)
+        return len(paths)
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while True:
+            with self._condition:
+                writes, self._writes = self._writes, []
+                now = self._clock()
+                sampling = [capture for capture in self._active if now >= capture.deadline]
+                if not sampling and not writes:
+                    pending = [capture.deadline - now for capture in self._active]
+                    self._condition.wait(timeout=min(pending) if pending else None)
+                    continue
+            if writes:
+                self._write_all(writes)
+            if not sampling:
+                continue
+            frames = sys._current_frames()
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for capture in sampling:
+                stacks = self._fold(frames, names, capture.thread_idents() - {own})
+                with self._condition:
+                    capture.samples += 1
+                    capture.stacks.update(stacks)
+            del frames
+            time.sleep(self.interval)
+
+    def _fold(self, frames: dict, names: dict[int, str], idents: set[int]) -> list[str]:
+        stacks = []
+        for ident in idents:
+            frame = frames.get(ident)
+            labels = []
+            while frame is not None and len(labels) < self._max_depth:
+                code = frame.f_code
+                labels.append(f"{getattr(code, 'co_qualname', code.co_name)} ({self._short_path(code.co_filename)})")
+                frame = frame.f_back
+            if labels:
+                labels.append(names.get(ident, f"thread-{ident}"))
+                stacks.append(";".join(reversed(labels)))
+        return stacks
+
+    def _write_all(self, writes: list[tuple[RequestProfile, Counter[str]]]) -> None:
+        for profile, stacks in writes:
+            try:
+                self._write(profile, stacks)
+            except Exception:
+                self._logger.exception("Could not store profile %s.", profile.id)
+        with self._condition:
+            self._unwritten -= len(writes)
+            self._condition.notify_all()
+
+    def _write(self, profile: RequestProfile, stacks: Counter[str]) -> None:
+        self._store.mkdir(parents=True, exist_ok=True)
+        document = profile.model_dump(mode="json", exclude={"top_stacks"})
+        document["stacks"] = dict(stacks)
+        path = self._store / f"{profile.id}.json"
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(document))
+        os.replace(temporary, path)
+        for stale in self._profile_paths()[self._max_profiles:]:
+            stale.unlink(missing_ok=True)
+
+    def _read(self, profile_id: str) -> dict:
+        if not self._ID_RE.match(profile_id):
+            raise KeyError(profile_id)
+        self.flush(timeout=self._FLUSH_TIMEOUT)
+        try:
+            return json.loads((self._store / f"{profile_id}.json").read_text())
+        except FileNotFoundError as exc:
+            raise KeyError(profile_id) from exc
+
+    def _profile_paths(self) -> list[Path]:
+        if not self._store.is_dir():
+            return []
+        paths = []
+        for path in self._store.glob("*.json"):
+            try:
+                paths.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        return [path for _, path in sorted(paths, key=lambda entry: entry[0], reverse=True)]
+
+    @staticmethod
+    def _short_path(filename: str) -> str:
+        parts = Path(filename).parts
+        return "/".join(parts[-2:]) if len(parts) > 1 else filename
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Callable
+
+
+class RefreshManager:
+    """Adaptive cache TTLs driven by how long a cached result has stayed unchanged.
+
+    Every refetch records a content hash per cache key. A changed (or first
+    seen) result gets the floor TTL; an unchanged one gets the larger of the
+    previous interval times ``growth`` and ``age_factor`` times the time since
+    the last change, clamped to the ceiling. Bounds are configured per key
+    kind, the part of the cache key before the first underscore.
+    """
+
+    _SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS refresh_state (
+            key TEXT PRIMARY KEY,
+            content_hash TEXT NOT NULL,
+            first_seen TEXT NOT NULL,
+            last_changed TEXT NOT NULL,
+            last_checked TEXT NOT NULL,
+            interval_seconds REAL NOT NULL
+        )
+        """,
+    )
+
+    def __init__(
+        self,
+        db_path: str,
+        bounds: dict[str, tuple[timedelta, timedelta]],
+        growth: float = 2.0,
+        age_factor: float = 0.25,
+        clock: Callable[[], datetime] = datetime.utcnow,
+    ):
+        path = Path(db_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._bounds = {kind: (floor.total_seconds(), ceiling.total_seconds()) for kind, (floor, ceiling) in bounds.items()}
+        self._growth = growth
+        self._age_factor = age_factor
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            for statement in self._SCHEMA:
+                self._connection.execute(statement)
+
+    def next_ttl(self, key: str, content_hash: str) -> timedelta:
+        """Record a fresh fetch of ``key`` and return how long to cache it."""
+        floor, ceiling = self._bounds_for(key)
+        now = self._clock()
+        with self._lock, self._connection:
+            row = self._connection.execute("SELECT * FROM refresh_state WHERE key = ?", (key,)).fetchone()
+            if row is None or row["content_hash"] != content_hash:
+                interval = floor
+                first_seen = row["first_seen"] if row else now.isoformat()
+                last_changed = now.isoformat()
+            else:
+                unchanged_for = (now - datetime.fromisoformat(row["last_changed"])).total_seconds()
+                interval = max(row["interval_seconds"] * self._growth, unchanged_for * self._age_factor)
+                interval = min(ceiling, max(floor, interval))
+                first_seen = row["first_seen"]
+                last_changed = row["last_changed"]
+            self._connection.execute(
+                """
+                INSERT INTO refresh_state (key, content_hash, first_seen, last_changed, last_checked, interval_seconds)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET content_hash = excluded.content_hash,
+                    last_changed = excluded.last_changed, last_checked = excluded.last_checked,
+                    interval_seconds = excluded.interval_seconds
+                """,
+                (key, content_hash, first_seen, last_changed, now.isoformat(), interval),
+            )
+        return timedelta(seconds=interval)
+
+    def floor(self, key: str) -> timedelta:
+        return timedelta(seconds=self._bounds_for(key)[0])
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _bounds_for(self, key: str) -> tuple[float, float]:
+        kind = key.split("_", 1)[0]
+        if kind not in self._bounds:
+            raise KeyError(f"No refresh bounds configured for {kind} keys")
+        return self._bounds[kind]
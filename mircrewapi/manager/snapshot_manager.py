@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import datetime
+import hashlib
+import json
+import mmap
+import os
+from pathlib import Path
+import struct
+from typing import Iterable, Iterator
+import zlib
+
+try:
+    import zstandard
+except ImportError:  # Optional: fall back to gzip when zstandard is not installed.
+    zstandard = None
+
+
+class SnapshotManager:
+    """Versioned, compressed and checksummed snapshot files of named record sections.
+
+    Layout: ``MAGIC``, a big-endian uint16 version, one compressed stream of
+    newline-delimited JSON records per section, then a JSON footer listing
+    every section's offset, length, record count and sha256, followed by the
+    footer length and crc32 and ``MAGIC`` again. Writing streams section by
+    section into a temporary file that replaces the target at the end;
+    reading memory-maps the file and verifies every checksum before the first
+    record is yielded.
+    """
+
+    MAGIC = b"MCSNAP"
+    VERSION = 1
+    _TRAILER = struct.Struct(">II")
+    _CHUNK_SIZE = 1 << 20
+
+    def __init__(self, codec: str | None = None):
+        self.codec = codec or ("zstd" if zstandard is not None else "gzip")
+        if self.codec == "zstd" and zstandard is None:
+            raise ValueError("zstd snapshot codec requires the zstandard package")
+
+    def write(self, path: str | Path, sections: Iterable[tuple[str, Iterable[dict]]]) -> dict:
+        """Write ``(name, records)`` sections to ``path`` and return the footer."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        footer = {
+            "version": self.VERSION,
+            "codec": self.codec,
+            "created_at": datetime.utcnow().isoformat(),
+            "sections": [],
+        }
+        try:
+            with open(tmp_path, "wb") as handle:
+                handle.write(self.MAGIC + struct.pack(">H", self.VERSION))
+                for name, records in sections:
+                    footer["sections"].append(self._write_section(handle, name, records))
+                encoded = json.dumps(footer).encode("utf-8")
+                handle.write(encoded)
+                handle.write(self._TRAILER.pack(len(encoded), zlib.crc32(encoded)))
+                handle.write(self.MAGIC)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return footer
+
+    @contextmanager
+    def read(self, path: str | Path) -> Iterator[SnapshotReader]:
+        with open(path, "rb") as handle:
+            try:
+                mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as exc:  # Empty files cannot be mapped.
+                raise ValueError("Not a snapshot file") from exc
+            reader = SnapshotReader(mapped)
+            try:
+                yield reader
+            finally:
+                reader.close()
+
+    def _write_section(self, handle, name: str, records: Iterable[dict]) -> dict:
+        offset = handle.tell()
+        digest = hashlib.sha256()
+        compressor = self._compressor()
+        count = 0
+        buffer: list[str] = []
+
+        def emit(data: bytes) -> None:
+            if data:
+                digest.update(data)
+                handle.write(data)
+
+        for record in records:
+            buffer.append(json.dumps(record, separators=(",", ":")))
+            count += 1
+            if len(buffer) >= 1000:
+                emit(compressor.compress(("\n".join(buffer) + "\n").encode("utf-8")))
+                buffer.clear()
+        if buffer:
+            emit(compressor.compress(("\n".join(buffer) + "\n").encode("utf-8")))
+        emit(compressor.flush())
+        return {
+            "name": name,
+            "offset": offset,
+            "length": handle.tell() - offset,
+            "records": count,
+            "sha256": digest.hexdigest(),
+        }
+
+    def _compressor(self):
+        if self.codec == "zstd":
+            return zstandard.ZstdCompressor(level=10).compressobj()
+        return zlib.compressobj(6, zlib.DEFLATED, 31)
+
+
+class SnapshotReader:
+    """Verified, memory-mapped view of a snapshot file."""
+
+    def __init__(self, mapped: mmap.mmap):
+        self._mapped = mapped
+        self._view = memoryview(mapped)
+        try:
+            self.footer = self._read_footer()
+            self.sections = {section["name"]: section for section in self.footer["sections"]}
+            for section in self.footer["sections"]:
+                data = self._view[section["offset"]:section["offset"] + section["length"]]
+                if hashlib.sha256(data).hexdigest() != section["sha256"]:
+                    raise ValueError(f"Snapshot section {section['name']} is corrupt")
+        except BaseException:
+            self.close()
+            raise
+
+    def records(self, name: str) -> Iterator[dict]:
+        """Stream the records of a section; a missing section yields nothing."""
+        section = self.sections.get(name)
+        if section is None:
+            return
+        start, end = section["offset"], section["offset"] + section["length"]
+        decompressor = self._decompressor(self.footer["codec"])
+        pending = b""
+        for chunk_start in range(start, end, SnapshotManager._CHUNK_SIZE):
+            chunk = self._view[chunk_start:min(end, chunk_start + SnapshotManager._CHUNK_SIZE)]
+            pending += decompressor.decompress(chunk)
+            lines = pending.split(b"\n")
+            pending = lines.pop()
+            for line in lines:
+                yield json.loads(line)
+        if pending:
+            yield json.loads(pending)
+
+    def close(self) -> None:
+        try:
+            self._view.release()
+            self._mapped.close()
+        except BufferError:
+            # A half-consumed record stream still holds a slice; the map is
+            # closed once it is garbage collected.
+            pass
+
+    def _read_footer(self) -> dict:
+        magic = SnapshotManager.MAGIC
+        trailer_size = SnapshotManager._TRAILER.size + len(magic)
+        header_size = len(magic) + 2
+        view = self._view
+        if len(view) < header_size + trailer_size or view[:len(magic)] != magic or view[-len(magic):] != magic:
+            raise ValueError("Not a snapshot file")
+        (version,) = struct.unpack(">H", view[len(magic):header_size])
+        if version > SnapshotManager.VERSION:
+            raise ValueError(f"Unsupported snapshot version {version}")
+        length, crc = SnapshotManager._TRAILER.unpack(view[-trailer_size:-len(magic)])
+        footer_start = len(view) - trailer_size - length
+        if footer_start < header_size:
+            raise ValueError("Snapshot footer is corrupt")
+        encoded = bytes(view[footer_start:footer_start + length])
+        if zlib.crc32(encoded) != crc:
+            raise ValueError("Snapshot footer is corrupt")
+        return json.loads(encoded)
+
+    @staticmethod
+    def _decompressor(codec: str):
+        if codec == "zstd":
+            if zstandard is None:
+                raise ValueError("Snapshot is zstd compressed but zstandard is not installed")
+            return zstandard.ZstdDecompressor().decompressobj()
+        return zlib.decompressobj(31)
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import OrderedDict
+import gzip
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Callable, Iterable
+
+from mircrewapi.parser.query_normalizer import QueryNormalizer
+
+
+class SuggestManager:
+    """Bounded in-memory prefix index over post titles.
+
+    Titles are indexed under each of their first word-start suffixes in a
+    sorted array, so a lookup is one bisect plus a short forward scan. When
+    more than ``max_titles`` are known the least recently seen title is
+    evicted. The title list is persisted as a gzip JSON snapshot.
+    """
+
+    _SNAPSHOT_VERSION = 1
+    _MAX_WORDS = 6
+
+    def __init__(
+        self,
+        snapshot_path: str | None = None,
+        max_titles: int = 50000,
+        save_interval: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self._max_titles = max_titles
+        self._save_interval = save_interval
+        self._clock = clock
+        self._titles: OrderedDict[str, str] = OrderedDict()
+        self._keys: list[tuple[str, str]] = []
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_save = clock()
+        self._save_thread: threading.Thread | None = None
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def add_titles(self, titles: Iterable[str]) -> int:
+        """Index new titles, refresh known ones and return how many were added."""
+        added = 0
+        with self._lock:
+            new_keys: list[tuple[str, str]] = []
+            for title in titles:
+                key = QueryNormalizer.fold(title)
+                if not key:
+                    continue
+                if key not in self._titles:
+                    new_keys.extend((suffix, key) for suffix in self._suffixes(key))
+                    added += 1
+                self._titles[key] = title
+                self._titles.move_to_end(key)
+            if len(new_keys) > len(self._keys) // 16:
+                # Large batches are cheaper to merge with one sort than to insort one by one.
+                self._keys.extend(new_keys)
+                self._keys.sort()
+            else:
+                for entry in new_keys:
+                    insort(self._keys, entry)
+            evicted: set[str] = set()
+            while len(self._titles) > self._max_titles:
+                evicted.add(self._titles.popitem(last=False)[0])
+            self._remove_keys(evicted)
+            self._dirty = self._dirty or added > 0
+            due = added and self._clock() - self._last_save >= self._save_interval
+            if due and self._snapshot_path is not None and (self._save_thread is None or not self._save_thread.is_alive()):
+                # Writing the snapshot is slow; keep it off the caller's path.
+                self._save_thread = threading.Thread(target=self.save, name="suggest-save", daemon=True)
+                self._save_thread.start()
+        return added
+
+    def suggest(self, prefix: str, limit: int = 10) -> list[str]:
+        """Return up to ``limit`` titles containing a word sequence starting with ``prefix``."""
+        normalized = QueryNormalizer.fold(prefix)
+        if not normalized or limit <= 0:
+            return []
+        results: list[str] = []
+        seen: set[str] = set()
+        with self._lock:
+            index = bisect_left(self._keys, (normalized, ""))
+            while index < len(self._keys) and len(results) < limit:
+                suffix, key = self._keys[index]
+                if not suffix.startswith(normalized):
+                    break
+                if key not in seen:
+                    seen.add(key)
+                    results.append(self._titles[key])
+                index += 1
+        return results
+
+    def save(self) -> None:
+        """Write the snapshot atomically if anything changed since the last save."""
+        if self._snapshot_path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {"version": self._SNAPSHOT_VERSION, "titles": list(self._titles.values())}
+            self._dirty = False
+            self._last_save = self._clock()
+        self._snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._snapshot_path.with_name(f"{self._snapshot_path.name}.tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as handle:
+            json.dump(payload, handle, ensure_ascii=False)
+        os.replace(tmp_path, self._snapshot_path)
+
+    def _load(self) -> None:
+        if self._snapshot_path is None or not self._snapshot_path.exists():
+            return
+        try:
+            with gzip.open(self._snapshot_path, "rt", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, ValueError) as exc:
+            self._logger.warning("Ignoring unreadable suggest snapshot %s: %s", self._snapshot_path, exc)
+            return
+        if not isinstance(payload, dict) or payload.get("version") != self._SNAPSHOT_VERSION:
+            return
+        titles = payload.get("titles")
+        if not isinstance(titles, list):
+            self._logger.warning("Ignoring malformed suggest snapshot %s", self._snapshot_path)
+            return
+        for title in titles[-self._max_titles:]:
+            if not isinstance(title, str):
+                continue
+            key = QueryNormalizer.fold(title)
+            if key:
+                self._titles[key] = title
+                self._titles.move_to_end(key)
+        # Bulk build: one sort instead of an insort per suffix.
+        self._keys = sorted((suffix, key) for key in self._titles for suffix in self._suffixes(key))
+
+    def _remove_keys(self, keys: set[str]) -> None:
+        if len(keys) > 16:
+            self._keys = [entry for entry in self._keys if entry[1] not in keys]
+            return
+        for key in keys:
+            for suffix in self._suffixes(key):
+                index = bisect_left(self._keys, (suffix, key))
+                if index < len(self._keys) and self._keys[index] == (suffix, key):
+                    del self._keys[index]
+
+    @classmethod
+    def _suffixes(cls, key: str) -> set[str]:
+        words = key.split(" ")
+        return {" ".join(words[index:]) for index in range(min(len(words), cls._MAX_WORDS))}
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+import threading
+import time
+from typing import Callable, Iterator
+
+
+class UpstreamBudget:
+    """Token bucket plus a concurrency cap shared by every upstream operation.
+
+    ``rate_per_minute`` operations may start per minute on average with bursts
+    of up to ``burst``; at most ``max_concurrency`` run at the same time. A
+    rate of 0 disables the bucket.
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float = 30.0,
+        burst: int = 5,
+        max_concurrency: int = 2,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._rate_per_second = rate_per_minute / 60.0
+        self._burst = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self._burst)
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+        self._max_concurrency = max(1, max_concurrency)
+        self._slots = threading.BoundedSemaphore(self._max_concurrency)
+        self._active = 0
+
+    @contextmanager
+    def acquire(self) -> Iterator[float]:
+        """Block until a concurrency slot and a rate token are available; yields the seconds waited."""
+        started = self._clock()
+        self._slots.acquire()
+        with self._lock:
+            self._active += 1
+        try:
+            self._take_token()
+            yield self._clock() - started
+        finally:
+            with self._lock:
+                self._active -= 1
+            self._slots.release()
+
+    def has_headroom(self, min_tokens: float = 1.0, reserved_slots: int = 1) -> bool:
+        """True when background work can start without eating into foreground capacity.
+
+        Requires ``min_tokens`` in the bucket and more than ``reserved_slots``
+        free concurrency slots, so one slot stays available for callers that
+        cannot wait.
+        """
+        with self._lock:
+            self._refill()
+            if self._max_concurrency - self._active <= reserved_slots:
+                return False
+            return self._rate_per_second <= 0 or self._tokens >= min_tokens
+
+    def available_tokens(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def _take_token(self) -> None:
+        if self._rate_per_second <= 0:
+            return
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate_per_second
+            self._sleep(wait)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        if self._rate_per_second > 0:
+            self._tokens = min(self._burst, self._tokens + (now - self._updated_at) * self._rate_per_second)
+        self._updated_at = now
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from datetime import datetime
+import json
+from pathlib import Path
+import sqlite3
+import threading
+
+from mircrewapi.model.record.post_record import PostRecord
+from mircrewapi.model.record.watchlist_match_record import WatchlistMatchRecord
+from mircrewapi.model.record.watchlist_record import WatchlistRecord
+
+
+class WatchlistManager:
+    """Persist watchlists and their matches in the local SQLite index."""
+
+    _SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS watchlists (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            query TEXT NOT NULL,
+            filters TEXT NOT NULL DEFAULT '[]',
+            webhook_url TEXT,
+            created_at TEXT NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS watchlist_matches (
+            cursor INTEGER PRIMARY KEY AUTOINCREMENT,
+            watchlist_id INTEGER NOT NULL,
+            post_id TEXT NOT NULL,
+            title TEXT NOT NULL,
+            url TEXT NOT NULL,
+            matched_at TEXT NOT NULL,
+            UNIQUE (watchlist_id, post_id)
+        )
+        """,
+    )
+
+    def __init__(self, db_path: str):
+        path = Path(db_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            for statement in self._SCHEMA:
+                self._connection.execute(statement)
+
+    def find_all(self) -> list[WatchlistRecord]:
+        with self._lock:
+            rows = self._connection.execute("SELECT * FROM watchlists ORDER BY id").fetchall()
+        return [self._watchlist_from_row(row) for row in rows]
+
+    def get(self, watchlist_id: int) -> WatchlistRecord | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT * FROM watchlists WHERE id = ?",
+                (watchlist_id,),
+            ).fetchone()
+        return self._watchlist_from_row(row) if row else None
+
+    def save(self, watchlist: WatchlistRecord) -> WatchlistRecord:
+        values = (watchlist.name, watchlist.query, json.dumps(watchlist.filters), watchlist.webhook_url)
+        with self._lock, self._connection:
+            if watchlist.id is None:
+                watchlist.created_at = datetime.utcnow()
+                cursor = self._connection.execute(
+                    "INSERT INTO watchlists (name, query, filters, webhook_url, created_at) VALUES (?, ?, ?, ?, ?)",
+                    (*values, watchlist.created_at.isoformat()),
+                )
+                watchlist.id = cursor.lastrowid
+            else:
+                self._connection.execute(
+                    "UPDATE watchlists SET name = ?, query = ?, filters = ?, webhook_url = ? WHERE id = ?",
+                    (*values, watchlist.id),
+                )
+        return watchlist
+
+    def delete(self, watchlist_id: int) -> bool:
+        with self._lock, self._connection:
+            deleted = self._connection.execute("DELETE FROM watchlists WHERE id = ?", (watchlist_id,)).rowcount
+            self._connection.execute("DELETE FROM watchlist_matches WHERE watchlist_id = ?", (watchlist_id,))
+        return deleted > 0
+
+    def add_matches(self, matches: list[tuple[int, PostRecord]]) -> list[WatchlistMatchRecord]:
+        """Store matches, skipping ones already recorded, and return the new rows."""
+        stored: list[WatchlistMatchRecord] = []
+        now = datetime.utcnow()
+        with self._lock, self._connection:
+            for watchlist_id, post in matches:
+                cursor = self._connection.execute(
+                    """
+                    INSERT OR IGNORE INTO watchlist_matches (watchlist_id, post_id, title, url, matched_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (watchlist_id, post.id, post.title, post.url, now.isoformat()),
+                )
+                if cursor.rowcount:
+                    stored.append(
+                        WatchlistMatchRecord(
+                            cursor=cursor.lastrowid,
+                            watchlist_id=watchlist_id,
+                            post_id=post.id,
+                            title=post.title,
+                            url=post.url,
+                            matched_at=now,
+                        )
+                    )
+        return stored
+
+    def matches_since(
+        self,
+        since: int = 0,
+        watchlist_id: int | None = None,
+        limit: int = 100,
+    ) -> list[WatchlistMatchRecord]:
+        query = "SELECT * FROM watchlist_matches WHERE cursor > ?"
+        params: list = [since]
+        if watchlist_id is not None:
+            query += " AND watchlist_id = ?"
+            params.append(watchlist_id)
+        query += " ORDER BY cursor LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+        return [
+            WatchlistMatchRecord(
+                cursor=row["cursor"],
+                watchlist_id=row["watchlist_id"],
+                post_id=row["post_id"],
+                title=row["title"],
+                url=row["url"],
+                matched_at=datetime.fromisoformat(row["matched_at"]),
+            )
+            for row in rows
+        ]
+
+    @staticmethod
+    def _watchlist_from_row(row: sqlite3.Row) -> WatchlistRecord:
+        return WatchlistRecord(
+            id=row["id"],
+            name=row["name"],
+            query=row["query"],
+            filters=json.loads(row["filters"]),
+            webhook_url=row["webhook_url"],
+            created_at=datetime.fromisoformat(row["created_at"]),
+        )
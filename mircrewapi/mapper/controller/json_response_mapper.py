@@ -0,0 +1,63 @@
+from datetime import datetime
+import hashlib
+import json
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from mircrewapi.model.service.cached_result import CachedResult
+
+
+class JsonResponseMapper:
+    """Serialize controller models straight to JSON with HTTP caching headers.
+
+    ``fields`` projects every entry of the model's ``results`` list; ``compact``
+    additionally turns them into rows of values listed once under ``columns``.
+    """
+
+    def to_response(
+        self,
+        request: Request,
+        model: BaseModel,
+        result: CachedResult,
+        fields: list[str] | None = None,
+        compact: bool = False,
+    ) -> Response:
+        body = self._serialize(model, fields, compact)
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        headers = {"ETag": etag, **self._freshness_headers(result)}
+        if self._matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    @staticmethod
+    def _serialize(model: BaseModel, fields: list[str] | None, compact: bool) -> bytes:
+        if not fields:
+            return model.model_dump_json().encode()
+        include = {name: True for name in type(model).model_fields if name != "results"}
+        include["results"] = {"__all__": set(fields)}
+        if not compact:
+            return model.model_dump_json(include=include).encode()
+        payload = model.model_dump(mode="json", include=include)
+        payload["columns"] = fields
+        payload["results"] = [[row.get(field) for field in fields] for row in payload["results"]]
+        return json.dumps(payload, separators=(",", ":")).encode()
+
+    @staticmethod
+    def _freshness_headers(result: CachedResult) -> dict[str, str]:
+        if result.created_at is None or result.expires_at is None:
+            return {"Cache-Control": "no-cache"}
+        now = datetime.utcnow()
+        age = max(0, int((now - result.created_at).total_seconds()))
+        max_age = max(0, int((result.expires_at - result.created_at).total_seconds()))
+        return {"Cache-Control": f"public, max-age={max_age}", "Age": str(age)}
+
+    @staticmethod
+    def _matches(if_none_match: str | None, etag: str) -> bool:
+        if not if_none_match:
+            return False
+        for candidate in if_none_match.split(","):
+            candidate = candidate.strip()
+            if candidate == "*" or candidate.removeprefix("W/") == etag:
+                return True
+        return False
@@ -1,6 +1,9 @@
 from mircrewapi.model.controller.magnet_item import MagnetItem as ControllerMagnetItem
+from mircrewapi.model.controller.magnet_lookup_response import MagnetLookupResponse
 from mircrewapi.model.controller.magnets_response import MagnetsResponse
+from mircrewapi.model.controller.post_item import PostItem as ControllerPostItem
 from mircrewapi.model.service.magnet_item import MagnetItem
+from mircrewapi.model.service.post_item import PostItem
 
 
 class MagnetMapper:
@@ -11,8 +14,39 @@ class MagnetMapper:
         post_id: str,
         post_url: str,
         items: list[MagnetItem],
+        total: int | None = None,
+        offset: int = 0,
     ) -> MagnetsResponse:
-        controller_items = [
-            ControllerMagnetItem(title=item.title, url=item.url) for item in items
-        ]
-        return MagnetsResponse(post_id=post_id, post_url=post_url, results=controller_items)
+        controller_items = [self._to_item(item) for item in items]
+        return MagnetsResponse(
+            post_id=post_id,
+            post_url=post_url,
+            total=total,
+            offset=offset,
+            next_offset=self._next_offset(total, offset, len(items)),
+            results=controller_items,
+        )
+
+    def to_lookup_response(self, magnet: MagnetItem, posts: list[PostItem]) -> MagnetLookupResponse:
+        return MagnetLookupResponse(
+            infohash=magnet.infohash,
+            magnet=self._to_item(magnet),
+            posts=[ControllerPostItem(id=post.id, title=post.title, url=post.url) for post in posts],
+        )
+
+    @staticmethod
+    def _to_item(item: MagnetItem) -> ControllerMagnetItem:
+        return ControllerMagnetItem(
+            title=item.title,
+            url=item.url,
+            infohash=item.infohash,
+            display_name=item.display_name,
+            size=item.size,
+            trackers=list(item.trackers),
+        )
+
+    @staticmethod
+    def _next_offset(total: int | None, offset: int, returned: int) -> int | None:
+        if total is None or offset + returned >= total:
+            return None
+        return offset + returned
@@ -1,14 +1,56 @@
 from mircrewapi.model.controller.post_item import PostItem as ControllerPostItem
 from mircrewapi.model.controller.post_search_response import PostSearchResponse
+from mircrewapi.model.controller.release_item import ReleaseItem
+from mircrewapi.model.record.release_info import ReleaseInfo
 from mircrewapi.model.service.post_item import PostItem
 
 
 class PostMapper:
     """Map domain posts into controller responses."""
 
-    def to_response(self, query: str, items: list[PostItem]) -> PostSearchResponse:
+    def to_response(
+        self,
+        query: str,
+        items: list[PostItem],
+        cursor: int | None = None,
+        total: int | None = None,
+        offset: int = 0,
+    ) -> PostSearchResponse:
         controller_items = [
-            ControllerPostItem(id=item.id, title=item.title, url=item.url)
+            ControllerPostItem(
+                id=item.id,
+                title=item.title,
+                url=item.url,
+                release=self._to_release(item.release),
+                cursor=item.cursor,
+            )
             for item in items
         ]
-        return PostSearchResponse(query=query, results=controller_items)
+        return PostSearchResponse(
+            query=query,
+            cursor=cursor,
+            total=total,
+            offset=offset,
+            next_offset=self._next_offset(total, offset, len(items)),
+            results=controller_items,
+        )
+
+    @staticmethod
+    def _to_release(release: ReleaseInfo | None) -> ReleaseItem | None:
+        if release is None:
+            return None
+        return ReleaseItem(
+            resolution=release.resolution,
+            codec=release.codec,
+            source=release.source,
+            languages=list(release.languages),
+            season=release.season,
+            episode=release.episode,
+            year=release.year,
+        )
+
+    @staticmethod
+    def _next_offset(total: int | None, offset: int, returned: int) -> int | None:
+        if total is None or offset + returned >= total:
+            return None
+        return offset + returned
@@ -0,0 +1,77 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from xml.etree import ElementTree
+
+from mircrewapi.model.service.torznab_item import TorznabItem
+
+_TORZNAB_NS = "http://torznab.com/schemas/2015/feed"
+ElementTree.register_namespace("torznab", _TORZNAB_NS)
+
+
+class TorznabMapper:
+    """Render Torznab capabilities, result feeds and errors as XML."""
+
+    def to_caps_xml(self, categories: dict[int, tuple[str, dict[int, str]]], default_limit: int, max_limit: int) -> bytes:
+        caps = ElementTree.Element("caps")
+        ElementTree.SubElement(caps, "server", title="Mircrew API")
+        ElementTree.SubElement(caps, "limits", default=str(default_limit), max=str(max_limit))
+        searching = ElementTree.SubElement(caps, "searching")
+        ElementTree.SubElement(searching, "search", available="yes", supportedParams="q")
+        ElementTree.SubElement(searching, "tv-search", available="yes", supportedParams="q,season,ep")
+        ElementTree.SubElement(searching, "movie-search", available="yes", supportedParams="q")
+        category_root = ElementTree.SubElement(caps, "categories")
+        for category_id, (name, subcategories) in categories.items():
+            category = ElementTree.SubElement(category_root, "category", id=str(category_id), name=name)
+            for sub_id, sub_name in subcategories.items():
+                ElementTree.SubElement(category, "subcat", id=str(sub_id), name=sub_name)
+        return self._serialize(caps)
+
+    def to_feed_xml(self, items: list[TorznabItem], offset: int, link: str) -> bytes:
+        rss = ElementTree.Element("rss", version="2.0")
+        channel = ElementTree.SubElement(rss, "channel")
+        ElementTree.SubElement(channel, "title").text = "Mircrew API"
+        ElementTree.SubElement(channel, "link").text = link
+        ElementTree.SubElement(channel, f"{{{_TORZNAB_NS}}}response", offset=str(offset))
+        for item in items:
+            channel.append(self._to_element(item))
+        return self._serialize(rss)
+
+    def to_error_xml(self, code: int, description: str) -> bytes:
+        return self._serialize(ElementTree.Element("error", code=str(code), description=description))
+
+    def _to_element(self, item: TorznabItem) -> ElementTree.Element:
+        element = ElementTree.Element("item")
+        ElementTree.SubElement(element, "title").text = item.title
+        ElementTree.SubElement(element, "guid", isPermaLink="false").text = item.infohash or item.magnet_url
+        ElementTree.SubElement(element, "link").text = item.magnet_url
+        ElementTree.SubElement(element, "comments").text = item.comments_url
+        ElementTree.SubElement(element, "pubDate").text = self._rfc822(item.published_at or datetime.utcnow())
+        if item.size:
+            ElementTree.SubElement(element, "size").text = str(item.size)
+        for category in item.categories:
+            ElementTree.SubElement(element, "category").text = str(category)
+        ElementTree.SubElement(
+            element,
+            "enclosure",
+            url=item.magnet_url,
+            length=str(item.size or 0),
+            type="application/x-bittorrent",
+        )
+        attributes = [("magneturl", item.magnet_url)]
+        attributes += [("category", str(category)) for category in item.categories]
+        if item.infohash:
+            attributes.append(("infohash", item.infohash))
+        if item.size:
+            attributes.append(("size", str(item.size)))
+        for name, value in attributes:
+            ElementTree.SubElement(element, f"{{{_TORZNAB_NS}}}attr", name=name, value=value)
+        return element
+
+    @staticmethod
+    def _rfc822(value: datetime) -> str:
+        # Index timestamps are naive UTC.
+        return format_datetime(value.replace(tzinfo=timezone.utc))
+
+    @staticmethod
+    def _serialize(element: ElementTree.Element) -> bytes:
+        return ElementTree.tostring(element, encoding="utf-8", xml_declaration=True)
@@ -0,0 +1,45 @@
+from mircrewapi.model.controller.watchlist_feed_response import WatchlistFeedResponse
+from mircrewapi.model.controller.watchlist_item import WatchlistItem
+from mircrewapi.model.controller.watchlist_match_item import WatchlistMatchItem
+from mircrewapi.model.controller.watchlist_request import WatchlistRequest
+from mircrewapi.model.record.watchlist_match_record import WatchlistMatchRecord
+from mircrewapi.model.record.watchlist_record import WatchlistRecord
+
+
+class WatchlistMapper:
+    """Map watchlist records to and from controller models."""
+
+    def to_record(self, request: WatchlistRequest, watchlist_id: int | None = None) -> WatchlistRecord:
+        return WatchlistRecord(
+            id=watchlist_id,
+            name=request.name,
+            query=request.query,
+            filters=list(request.filters),
+            webhook_url=request.webhook_url,
+        )
+
+    def to_item(self, record: WatchlistRecord) -> WatchlistItem:
+        return WatchlistItem(
+            id=record.id,
+            name=record.name,
+            query=record.query,
+            filters=record.filters,
+            webhook_url=record.webhook_url,
+            created_at=record.created_at,
+        )
+
+    def to_feed_response(self, since: int, matches: list[WatchlistMatchRecord]) -> WatchlistFeedResponse:
+        return WatchlistFeedResponse(
+            cursor=matches[-1].cursor if matches else since,
+            results=[
+                WatchlistMatchItem(
+                    cursor=match.cursor,
+                    watchlist_id=match.watchlist_id,
+                    post_id=match.post_id,
+                    title=match.title,
+                    url=match.url,
+                    matched_at=match.matched_at,
+                )
+                for match in matches
+            ],
+        )
@@ -3,7 +3,10 @@ from mircrewapi.model.service.magnet_item import MagnetItem
 
 
 class MagnetMapper:
-    """Map client magnet results into domain models."""
+    """Map client magnet results into domain models.
+
+    Both layers share MagnetRecord, so results pass through without copying.
+    """
 
     def to_domain(self, items: list[SearchResult]) -> list[MagnetItem]:
-        return [MagnetItem(title=item.title, url=item.url) for item in items]
+        return items
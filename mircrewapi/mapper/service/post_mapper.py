@@ -3,7 +3,10 @@ from mircrewapi.model.service.post_item import PostItem
 
 
 class PostMapper:
-    """Map client post results into domain models."""
+    """Map client post results into domain models.
+
+    Both layers share PostRecord, so results pass through without copying.
+    """
 
     def to_domain(self, items: list[PostResult]) -> list[PostItem]:
-        return [PostItem(id=item.id, title=item.title, url=item.url) for item in items]
+        return items
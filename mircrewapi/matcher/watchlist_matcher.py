@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from collections import deque
+
+from mircrewapi.parser.query_normalizer import QueryNormalizer
+
+
+class WatchlistMatcher:
+    """Aho-Corasick automaton matching every watchlist term in one pass over a title.
+
+    A watchlist matches when all of its whole-word terms occur in the title.
+    """
+
+    def __init__(self, watchlists: dict[int, str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[int]] = [[]]
+        self._term_owners: list[list[int]] = []
+        self._required: dict[int, int] = {}
+        term_ids: dict[str, int] = {}
+
+        for watchlist_id, query in watchlists.items():
+            terms = set(self.normalize(query).split())
+            if not terms:
+                continue
+            self._required[watchlist_id] = len(terms)
+            for term in terms:
+                term_id = term_ids.get(term)
+                if term_id is None:
+                    term_id = term_ids[term] = len(self._term_owners)
+                    self._term_owners.append([])
+                    self._add_pattern(f" {term} ", term_id)
+                self._term_owners[term_id].append(watchlist_id)
+        self._build_failure_links()
+
+    def match(self, title: str) -> set[int]:
+        """Return the ids of watchlists whose terms all occur in ``title``."""
+        if not self._required:
+            return set()
+        text = f" {self.normalize(title)} "
+        seen_terms: set[int] = set()
+        state = 0
+        for char in text:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            seen_terms.update(self._output[state])
+
+        hits: dict[int, int] = {}
+        for term_id in seen_terms:
+            for watchlist_id in self._term_owners[term_id]:
+                hits[watchlist_id] = hits.get(watchlist_id, 0) + 1
+        return {watchlist_id for watchlist_id, count in hits.items() if count == self._required[watchlist_id]}
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return QueryNormalizer.fold(text)
+
+    def _add_pattern(self, pattern: str, term_id: int) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(term_id)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                candidate = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = candidate if candidate != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
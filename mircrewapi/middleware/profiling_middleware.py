@@ -0,0 +1,63 @@
+from typing import Callable
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from mircrewapi.manager.metrics_manager import MetricsManager
+from mircrewapi.manager.profile_manager import ProfileManager
+
+
+class ProfilingMiddleware:
+    """Profile requests slower than the configured threshold, or flagged with ``X-Profile``.
+
+    The flag is only honoured together with a valid ``X-Admin-Token``; flagged
+    responses carry the profile id. Requests pass straight through while no
+    threshold is configured and nothing is flagged.
+    """
+
+    HEADER = "X-Profile"
+    ID_HEADER = "X-Profile-Id"
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        profile_manager: ProfileManager,
+        authorize: Callable[[str | None], bool],
+        metrics_manager: MetricsManager | None = None,
+    ):
+        self.app = app
+        self.profile_manager = profile_manager
+        self.authorize = authorize
+        self.metrics_manager = metrics_manager or MetricsManager(enabled=False)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        forced = self._forced(scope)
+        if not forced and not self.profile_manager.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        capture = self.profile_manager.begin(scope["method"], scope["path"], forced)
+        status_code = None
+
+        async def send_with_profile(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if forced:
+                    MutableHeaders(scope=message)[self.ID_HEADER] = capture.id
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_profile)
+        finally:
+            self.profile_manager.end(capture, status_code, self.metrics_manager.current_spans())
+
+    def _forced(self, scope: Scope) -> bool:
+        headers = dict(scope["headers"])
+        if b"x-profile" not in headers:
+            return False
+        token = headers.get(b"x-admin-token")
+        return self.authorize(token.decode("latin-1") if token is not None else None)
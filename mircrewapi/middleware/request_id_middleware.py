@@ -0,0 +1,39 @@
+import re
+import uuid
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from mircrewapi.logger.request_context import request_id_var
+
+
+class RequestIdMiddleware:
+    """Tag each request with an id (client supplied or generated) for logs and responses."""
+
+    HEADER = "X-Request-ID"
+    _VALID_RE = re.compile(r"^[A-Za-z0-9._-]{1,128}$")
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        incoming = next(
+            (value.decode("latin-1") for key, value in scope["headers"] if key == b"x-request-id"),
+            "",
+        )
+        request_id = incoming if self._VALID_RE.match(incoming) else uuid.uuid4().hex
+        token = request_id_var.set(request_id)
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[self.HEADER] = request_id
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
@@ -0,0 +1,36 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from mircrewapi.manager.metrics_manager import MetricsManager
+
+
+class ServerTimingMiddleware:
+    """Collect per-request stage spans and expose them as a Server-Timing header."""
+
+    def __init__(self, app: ASGIApp, metrics_manager: MetricsManager):
+        self.app = app
+        self.metrics_manager = metrics_manager
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.metrics_manager.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        token = self.metrics_manager.begin_request()
+        started = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                spans = self.metrics_manager.current_spans()
+                spans.append(("total", time.perf_counter() - started))
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", self.metrics_manager.server_timing(spans))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            self.metrics_manager.end_request(token)
+            self.metrics_manager.observe("request", time.perf_counter() - started)
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from html import escape
+from pathlib import Path
+import random
+import re
+from urllib.parse import quote
+
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, RedirectResponse
+
+_DEFAULT_FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+_SESSION_COOKIE = "phpbb3_mock_sid"
+_TITLE_PATTERNS = (
+    "{query} S0{season}E0{episode} 1080p WEB-DL x264 ITA ENG",
+    "{query} S0{season}E0{episode} 720p HDTV x264 ITA",
+    "{query} ({year}) 2160p UHD BluRay x265 HDR ITA ENG",
+    "{query} ({year}) 1080p BluRay x264 AC3 ITA",
+    "{query} S0{season} Stagione Completa 1080p AMZN WEB-DL x265 ITA",
+    "{query} ({year}) DVDRip XviD ITA",
+)
+
+
+class MockUpstreamServer:
+    """Local stand-in for mircrew-releases.org built from the bundled page fixtures."""
+
+    def __init__(
+        self,
+        fixtures_dir: str | Path | None = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        results_per_query: int = 60,
+        page_size: int = 25,
+        magnets_per_post: int = 3,
+    ):
+        self.fixtures_dir = Path(fixtures_dir) if fixtures_dir else _DEFAULT_FIXTURES_DIR
+        self.latency = latency
+        self.jitter = jitter
+        self.results_per_query = results_per_query
+        self.page_size = page_size
+        self.magnets_per_post = magnets_per_post
+        self.request_counts: Counter[str] = Counter()
+        self._topic_titles: dict[str, str] = {}
+        self.app = FastAPI(title="Mock Mircrew upstream", docs_url=None, redoc_url=None)
+        self._register_routes()
+
+    def _register_routes(self) -> None:
+        self.app.add_api_route("/ucp.php", self.login_page, methods=["GET"])
+        self.app.add_api_route("/ucp.php", self.login_submit, methods=["POST"])
+        self.app.add_api_route("/index.php", self.index, methods=["GET"])
+        self.app.add_api_route("/search.php", self.search, methods=["GET"])
+        self.app.add_api_route("/viewtopic.php", self.viewtopic, methods=["GET"])
+
+    async def login_page(self, mode: str = "login") -> HTMLResponse:
+        await self._simulate("login")
+        if mode == "logout":
+            response = RedirectResponse("./index.php", status_code=302)
+            response.delete_cookie(_SESSION_COOKIE)
+            return response
+        tokens = "".join(re.findall(r"<input[^>]*>", self._fixture_body("index.html")))
+        body = (
+            '<form id="login" method="post" action="./ucp.php?mode=login">'
+            f"{tokens}"
+            '<input type="text" name="username" />'
+            '<input type="password" name="password" />'
+            '<input type="checkbox" name="autologin" />'
+            '<input type="checkbox" name="viewonline" />'
+            '<input type="submit" name="login" value="Login" />'
+            "</form>"
+        )
+        return self._page("Login", body)
+
+    async def login_submit(self) -> RedirectResponse:
+        await self._simulate("login_submit")
+        response = RedirectResponse("./index.php", status_code=302)
+        response.set_cookie(_SESSION_COOKIE, "mock-session", path="/")
+        return response
+
+    async def index(self, request: Request) -> HTMLResponse:
+        await self._simulate("index")
+        fixture = "index_logged_in.html" if self._logged_in(request) else "index_logged_out.html"
+        body = (
+            f"{self._fixture_body(fixture)}"
+            '<form id="search" method="get" action="./search.php">'
+            '<input type="search" id="keywords" name="keywords" />'
+            '<input type="hidden" name="sr" value="topics" />'
+            '<button class="button-search" type="submit">Search</button>'
+            "</form>"
+        )
+        return self._page("Index", body)
+
+    async def search(self, keywords: str = "", start: int = 0) -> HTMLResponse:
+        await self._simulate("search")
+        topics = self._topics_for(keywords)
+        if not topics:
+            body = (
+                '<div class="panel" id="message"><div class="inner">'
+                '<h2 class="message-title">Information</h2><p>No suitable matches were found.</p>'
+                "</div></div>"
+            )
+            return self._page("Search", body)
+        page = topics[start:start + self.page_size]
+        rows = "".join(
+            '<li class="row">'
+            f'<a class="topictitle" href="./viewtopic.php?t={topic_id}">{escape(title)}</a>'
+            "</li>"
+            for topic_id, title in page
+        )
+        pagination = ""
+        if start + self.page_size < len(topics):
+            next_start = start + self.page_size
+            pagination = (
+                '<div class="pagination">'
+                f'<a class="button" rel="next" href="./search.php?keywords={quote(keywords)}&amp;start={next_start}">'
+                "Next</a></div>"
+            )
+        body = (
+            f'<h2 class="searchresults-title">Search found {len(topics)} matches: {escape(keywords)}</h2>'
+            f'<ul class="topiclist topics">{rows}</ul>{pagination}'
+        )
+        return self._page("Search", body)
+
+    async def viewtopic(self, t: str = "") -> HTMLResponse:
+        await self._simulate("viewtopic")
+        title = self._title_for_topic(t)
+        boxes = "".join(
+            '<dd>'
+            f"<p>{escape(title)} part {index + 1}</p>"
+            f'<a href="{self._magnet_for(t, index, title)}">magnet link</a>'
+            "</dd>"
+            for index in range(self.magnets_per_post)
+        )
+        body = (
+            '<div class="post">'
+            '<ul class="post-buttons"><li><a href="./viewtopic.php?t='
+            f'{escape(t)}&amp;thanks=1"><i class="icon fa-thumbs-o-up"></i>Thanks</a></li></ul>'
+            f"<h3>{escape(title)}</h3>"
+            f'<dl class="hidebox unhide">{boxes}</dl>'
+            "</div>"
+        )
+        return self._page(title, body)
+
+    async def _simulate(self, route: str) -> None:
+        self.request_counts[route] += 1
+        delay = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _topics_for(self, keywords: str) -> list[tuple[str, str]]:
+        query = " ".join(keywords.split()) or "Mock"
+        seed = sum(ord(ch) for ch in query.lower())
+        topics = []
+        for index in range(self.results_per_query):
+            topic_id = str(100000 + (seed * 97 + index) % 900000)
+            title = self._format_title(query.title(), topic_id, index)
+            self._topic_titles.setdefault(topic_id, title)
+            topics.append((topic_id, title))
+        return topics
+
+    def _title_for_topic(self, topic_id: str) -> str:
+        if topic_id in self._topic_titles:
+            return self._topic_titles[topic_id]
+        number = int(topic_id) if topic_id.isdigit() else 0
+        return self._format_title("Mock Topic", topic_id, number)
+
+    @staticmethod
+    def _format_title(query: str, topic_id: str, index: int) -> str:
+        pattern = _TITLE_PATTERNS[index % len(_TITLE_PATTERNS)]
+        number = int(topic_id) if topic_id.isdigit() else index
+        return pattern.format(
+            query=query,
+            season=1 + number % 5,
+            episode=1 + number % 9,
+            year=1990 + number % 35,
+        )
+
+    @staticmethod
+    def _magnet_for(topic_id: str, index: int, title: str) -> str:
+        digest = f"{int(topic_id) if topic_id.isdigit() else 0:020x}{index:020x}"[:40]
+        return (
+            f"magnet:?xt=urn:btih:{digest}&amp;dn={quote(title)}"
+            f"&amp;xl={(index + 1) * 734003200}&amp;tr=udp%3A%2F%2Ftracker.example.org%3A1337"
+        )
+
+    def _fixture_body(self, filename: str) -> str:
+        html = (self.fixtures_dir / filename).read_text()
+        start = html.find("<body>")
+        end = html.rfind("</body>")
+        if start == -1 or end == -1:
+            return html
+        return html[start + len("<body>"):end]
+
+    @staticmethod
+    def _logged_in(request: Request) -> bool:
+        return request.cookies.get(_SESSION_COOKIE) is not None
+
+    @staticmethod
+    def _page(title: str, body: str) -> HTMLResponse:
+        html = f"<html><head><title>{escape(title)}</title></head><body>{body}</body></html>"
+        return HTMLResponse(html)
@@ -1,6 +1,3 @@
-from pydantic import BaseModel
+from mircrewapi.model.record.magnet_record import MagnetRecord
 
-
-class SearchResult(BaseModel):
-    title: str
-    url: str
+SearchResult = MagnetRecord
@@ -0,0 +1,7 @@
+from pydantic import BaseModel, Field
+
+
+class CacheInvalidationRequest(BaseModel):
+    prefix: str | None = Field(None, description="Delete keys starting with this prefix, e.g. `search_`")
+    pattern: str | None = Field(None, description="Delete keys matching this glob, e.g. `search_*dune*`")
+    post_id: str | None = Field(None, description="Delete a post's magnets and every search listing it")
@@ -1,6 +1,10 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class MagnetItem(BaseModel):
     title: str
     url: str
+    infohash: str | None = None
+    display_name: str | None = None
+    size: int | None = None
+    trackers: list[str] = Field(default_factory=list)
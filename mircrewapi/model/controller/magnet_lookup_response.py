@@ -0,0 +1,10 @@
+from pydantic import BaseModel, Field
+
+from mircrewapi.model.controller.magnet_item import MagnetItem
+from mircrewapi.model.controller.post_item import PostItem
+
+
+class MagnetLookupResponse(BaseModel):
+    infohash: str = Field(..., description="Hex infohash")
+    magnet: MagnetItem
+    posts: list[PostItem] = Field(default_factory=list)
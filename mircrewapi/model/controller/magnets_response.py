@@ -6,4 +6,7 @@ from mircrewapi.model.controller.magnet_item import MagnetItem
 class MagnetsResponse(BaseModel):
     post_id: str = Field(..., description="Post id")
     post_url: str = Field(..., description="Post url")
+    total: int | None = Field(None, description="Number of results before paging")
+    offset: int = Field(0, description="Offset of the first returned result")
+    next_offset: int | None = Field(None, description="Pass as `offset` for the next page, if any")
     results: list[MagnetItem] = Field(default_factory=list)
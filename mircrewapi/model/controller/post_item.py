@@ -1,7 +1,11 @@
 from pydantic import BaseModel
 
+from mircrewapi.model.controller.release_item import ReleaseItem
+
 
 class PostItem(BaseModel):
     id: str
     title: str
     url: str
+    release: ReleaseItem | None = None
+    cursor: int | None = None
@@ -5,4 +5,8 @@ from mircrewapi.model.controller.post_item import PostItem
 
 class PostSearchResponse(BaseModel):
     query: str = Field(..., description="Search query")
+    cursor: int | None = Field(None, description="Pass as `since` to receive only newer posts")
+    total: int | None = Field(None, description="Number of results before paging")
+    offset: int = Field(0, description="Offset of the first returned result")
+    next_offset: int | None = Field(None, description="Pass as `offset` for the next page, if any")
     results: list[PostItem] = Field(default_factory=list)
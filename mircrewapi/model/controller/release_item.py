@@ -0,0 +1,11 @@
+from pydantic import BaseModel, Field
+
+
+class ReleaseItem(BaseModel):
+    resolution: str | None = None
+    codec: str | None = None
+    source: str | None = None
+    languages: list[str] = Field(default_factory=list)
+    season: int | None = None
+    episode: int | None = None
+    year: int | None = None
@@ -0,0 +1,6 @@
+from pydantic import BaseModel, Field
+
+
+class SuggestResponse(BaseModel):
+    prefix: str = Field(..., description="Prefix as typed by the client")
+    suggestions: list[str] = Field(default_factory=list)
@@ -0,0 +1,8 @@
+from pydantic import BaseModel, Field
+
+from mircrewapi.model.controller.watchlist_match_item import WatchlistMatchItem
+
+
+class WatchlistFeedResponse(BaseModel):
+    cursor: int = Field(..., description="Pass as `since` to fetch only newer matches")
+    results: list[WatchlistMatchItem] = Field(default_factory=list)
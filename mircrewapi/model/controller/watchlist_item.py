@@ -0,0 +1,12 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class WatchlistItem(BaseModel):
+    id: int
+    name: str
+    query: str
+    filters: list[str] = Field(default_factory=list)
+    webhook_url: str | None = None
+    created_at: datetime | None = None
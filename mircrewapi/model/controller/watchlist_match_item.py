@@ -0,0 +1,12 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class WatchlistMatchItem(BaseModel):
+    cursor: int
+    watchlist_id: int
+    post_id: str
+    title: str
+    url: str
+    matched_at: datetime
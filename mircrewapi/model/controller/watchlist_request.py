@@ -0,0 +1,11 @@
+from pydantic import BaseModel, Field
+
+
+class WatchlistRequest(BaseModel):
+    name: str = Field(..., description="Watchlist name")
+    query: str = Field(..., description="Terms that must all appear in a post title")
+    filters: list[str] = Field(default_factory=list, description="Release filters, e.g. resolution>=1080p")
+    webhook_url: str | None = Field(
+        None,
+        description="Local URL (loopback or WEBHOOK_ALLOWED_HOSTS) receiving a POST for every new match",
+    )
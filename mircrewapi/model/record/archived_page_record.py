@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(slots=True)
+class ArchivedPageRecord:
+    """Metadata of an archived upstream page; the HTML lives in a content-addressed blob.
+
+    ``kind`` is ``search`` or ``topic`` and ``ref`` the query or post id it was fetched for.
+    """
+
+    url: str
+    kind: str
+    ref: str
+    digest: str
+    codec: str
+    fetched_at: datetime
+    etag: str | None = None
+    last_modified: str | None = None
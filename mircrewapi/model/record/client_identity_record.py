@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class ClientIdentityRecord:
+    """Who is calling the API; ``keyed`` clients presented a configured API key."""
+
+    name: str
+    weight: float = 1.0
+    keyed: bool = False
+
+    @property
+    def metrics_label(self) -> str:
+        # Anonymous ids are unbounded; keep them out of metric labels.
+        return self.name if self.keyed else "anonymous"
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class MagnetRecord:
+    """Internal magnet record shared by the client and service layers."""
+
+    title: str
+    url: str
+    infohash: str | None = None
+    display_name: str | None = None
+    size: int | None = None
+    trackers: tuple[str, ...] = ()
+
+    def to_dict(self) -> dict:
+        return {
+            "title": self.title,
+            "url": self.url,
+            "infohash": self.infohash,
+            "display_name": self.display_name,
+            "size": self.size,
+            "trackers": list(self.trackers),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> MagnetRecord:
+        return cls(
+            title=payload["title"],
+            url=payload["url"],
+            infohash=payload.get("infohash"),
+            display_name=payload.get("display_name"),
+            size=payload.get("size"),
+            trackers=tuple(payload.get("trackers") or ()),
+        )
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from mircrewapi.model.record.release_info import ReleaseInfo
+
+
+@dataclass(slots=True)
+class PostRecord:
+    """Internal post record shared by the client and service layers."""
+
+    id: str
+    title: str
+    url: str
+    release: ReleaseInfo | None = None
+    cursor: int | None = None
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "title": self.title,
+            "url": self.url,
+            "release": self.release.to_dict() if self.release else None,
+            "cursor": self.cursor,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> PostRecord:
+        release = payload.get("release")
+        return cls(
+            id=payload["id"],
+            title=payload["title"],
+            url=payload["url"],
+            release=ReleaseInfo.from_dict(release) if release else None,
+            cursor=payload.get("cursor"),
+        )
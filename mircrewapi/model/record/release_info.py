@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class ReleaseInfo:
+    """Metadata extracted once from a release title."""
+
+    resolution: str | None = None
+    codec: str | None = None
+    source: str | None = None
+    languages: tuple[str, ...] = ()
+    season: int | None = None
+    episode: int | None = None
+    year: int | None = None
+
+    def to_dict(self) -> dict:
+        return {
+            "resolution": self.resolution,
+            "codec": self.codec,
+            "source": self.source,
+            "languages": list(self.languages),
+            "season": self.season,
+            "episode": self.episode,
+            "year": self.year,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> ReleaseInfo:
+        return cls(
+            resolution=payload.get("resolution"),
+            codec=payload.get("codec"),
+            source=payload.get("source"),
+            languages=tuple(payload.get("languages") or ()),
+            season=payload.get("season"),
+            episode=payload.get("episode"),
+            year=payload.get("year"),
+        )
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(slots=True)
+class WatchlistMatchRecord:
+    """A post matched by a watchlist; ``cursor`` grows monotonically."""
+
+    cursor: int
+    watchlist_id: int
+    post_id: str
+    title: str
+    url: str
+    matched_at: datetime
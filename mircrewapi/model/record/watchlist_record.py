@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+
+
+@dataclass(slots=True)
+class WatchlistRecord:
+    """A saved query whose terms are matched against newly seen posts."""
+
+    id: int | None
+    name: str
+    query: str
+    filters: list[str] = field(default_factory=list)
+    webhook_url: str | None = None
+    created_at: datetime | None = None
@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class AllocationSnapshotInfo(BaseModel):
+    id: int
+    label: str
+    traced_bytes: int
+    peak_bytes: int
+    taken_at: datetime
+
+
+class AllocationDiffEntry(BaseModel):
+    location: str
+    size_bytes: int
+    size_diff_bytes: int
+    count: int
+    count_diff: int
+
+
+class AllocationDiff(BaseModel):
+    first: AllocationSnapshotInfo
+    second: AllocationSnapshotInfo
+    group_by: str
+    entries: list[AllocationDiffEntry] = Field(default_factory=list)
@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class CacheKindStats(BaseModel):
+    entries: int = 0
+    expired: int = 0
+    bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+    stale_hits: int = 0
+    hit_rate: float | None = None
+
+
+class CacheEntryInfo(BaseModel):
+    key: str
+    created_at: datetime
+    expires_at: datetime
+    expires_in_seconds: float
+
+
+class CacheStats(BaseModel):
+    entries: int
+    bytes: int
+    kinds: dict[str, CacheKindStats] = Field(default_factory=dict)
+    expiry_distribution: dict[str, int] = Field(default_factory=dict)
+    near_expiry: list[CacheEntryInfo] = Field(default_factory=list)
@@ -0,0 +1,10 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class CachedResult(BaseModel):
+    items: list
+    created_at: datetime | None = None
+    expires_at: datetime | None = None
+    cursor: int | None = None
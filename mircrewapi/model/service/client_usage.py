@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+
+
+class ClientUsage(BaseModel):
+    name: str
+    weight: float
+    keyed: bool
+    in_flight: int
+    queued: int
+    admitted: int
+    cached: int
+    rejected: int
+    tokens: float | None = None
@@ -0,0 +1,6 @@
+from pydantic import BaseModel, Field
+
+
+class InvalidationReport(BaseModel):
+    deleted: int
+    keys: list[str] = Field(default_factory=list)
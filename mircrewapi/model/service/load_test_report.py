@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+
+
+class LoadTestReport(BaseModel):
+    concurrency: int
+    requests: int
+    failures: int
+    duration_seconds: float
+    throughput_rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    browser_launches_per_request: float
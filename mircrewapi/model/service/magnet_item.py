@@ -1,6 +1,3 @@
-from pydantic import BaseModel
+from mircrewapi.model.record.magnet_record import MagnetRecord
 
-
-class MagnetItem(BaseModel):
-    title: str
-    url: str
+MagnetItem = MagnetRecord
@@ -0,0 +1,12 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class MemorySample(BaseModel):
+    process_rss: int | None = None
+    children_rss: int = 0
+    children: dict[int, int] = Field(default_factory=dict, description="RSS in bytes per child pid")
+    budget: int = 0
+    over_budget: bool = False
+    sampled_at: datetime = Field(default_factory=datetime.utcnow)
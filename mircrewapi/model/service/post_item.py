@@ -1,7 +1,3 @@
-from pydantic import BaseModel
+from mircrewapi.model.record.post_record import PostRecord
 
-
-class PostItem(BaseModel):
-    id: str
-    title: str
-    url: str
+PostItem = PostRecord
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+class ReparseReport(BaseModel):
+    search_pages: int = 0
+    topic_pages: int = 0
+    missing_pages: int = 0
+    posts: int = 0
+    magnets: int = 0
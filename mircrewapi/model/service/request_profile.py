@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class RequestProfileInfo(BaseModel):
+    id: str
+    method: str
+    path: str
+    trigger: str = Field(description="threshold or header")
+    status_code: int | None = None
+    duration_seconds: float
+    samples: int
+    interval_seconds: float
+    captured_at: datetime
+
+
+class ProfileSpan(BaseModel):
+    name: str
+    seconds: float
+
+
+class ProfileStack(BaseModel):
+    stack: str
+    samples: int
+
+
+class RequestProfile(RequestProfileInfo):
+    spans: list[ProfileSpan] = Field(default_factory=list)
+    top_stacks: list[ProfileStack] = Field(default_factory=list)
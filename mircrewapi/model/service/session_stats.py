@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+
+class SessionStats(BaseModel):
+    logged_in: bool
+    session_age_seconds: float | None = None
+    state_file_age_seconds: float | None = None
+    open_browsers: int = 0
+    open_contexts: int = 0
+    browser_launches: int = 0
+    logins: int = 0
@@ -0,0 +1,11 @@
+from pydantic import BaseModel, Field
+
+
+class SnapshotReport(BaseModel):
+    path: str
+    version: int
+    codec: str
+    records: dict[str, int] = Field(default_factory=dict)
+    imported: dict[str, int] = Field(default_factory=dict)
+    size_bytes: int = 0
+    duration_seconds: float = 0.0
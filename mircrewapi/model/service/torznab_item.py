@@ -0,0 +1,14 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class TorznabItem(BaseModel):
+    post_id: str
+    title: str
+    magnet_url: str
+    comments_url: str
+    infohash: str | None = None
+    size: int | None = None
+    categories: list[int] = Field(default_factory=list)
+    published_at: datetime | None = None
@@ -0,0 +1,11 @@
+from pydantic import BaseModel, Field
+
+
+class WarmReport(BaseModel):
+    total: int
+    skipped: int
+    succeeded: int
+    failed: int
+    duration_seconds: float
+    throughput_per_minute: float
+    failures: dict[str, str] = Field(default_factory=dict)
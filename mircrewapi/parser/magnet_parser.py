@@ -0,0 +1,46 @@
+import base64
+import binascii
+import re
+from urllib.parse import parse_qs, urlsplit
+
+from mircrewapi.model.record.magnet_record import MagnetRecord
+
+
+class MagnetParser:
+    """Parse magnet URIs into structured records with a normalized hex infohash."""
+
+    _BTIH_PREFIX = "urn:btih:"
+    _HEX_RE = re.compile(r"^[0-9a-fA-F]{40}$")
+    _BASE32_RE = re.compile(r"^[A-Za-z2-7]{32}$")
+
+    def parse(self, url: str, title: str) -> MagnetRecord:
+        record = MagnetRecord(title=title, url=url)
+        try:
+            query = parse_qs(urlsplit(url).query)
+        except ValueError:
+            return record
+        for topic in query.get("xt", ()):
+            if topic.lower().startswith(self._BTIH_PREFIX):
+                record.infohash = self.normalize_infohash(topic[len(self._BTIH_PREFIX):])
+                if record.infohash:
+                    break
+        display_names = query.get("dn")
+        if display_names:
+            record.display_name = display_names[0]
+        sizes = query.get("xl")
+        if sizes and sizes[0].isdigit():
+            record.size = int(sizes[0])
+        record.trackers = tuple(dict.fromkeys(query.get("tr", ())))
+        return record
+
+    def normalize_infohash(self, value: str) -> str | None:
+        """Return the lowercase hex form of a hex or base32 BitTorrent v1 infohash."""
+        value = value.strip()
+        if self._HEX_RE.match(value):
+            return value.lower()
+        if self._BASE32_RE.match(value):
+            try:
+                return base64.b32decode(value.upper()).hex()
+            except binascii.Error:
+                return None
+        return None
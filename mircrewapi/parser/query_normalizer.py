@@ -0,0 +1,29 @@
+import re
+import unicodedata
+
+
+class QueryNormalizer:
+    """Canonical form of search queries so equivalent spellings share one cache entry."""
+
+    _NON_WORD_RE = re.compile(r"[^0-9a-z]+")
+    # Articles and conjunctions (English and Italian) that the upstream phpBB search ignores anyway.
+    STOPWORDS = frozenset((
+        "a", "an", "and", "the", "of",
+        "il", "lo", "la", "i", "gli", "le", "l", "un", "uno", "una", "e", "di", "del", "della",
+    ))
+
+    def normalize(self, query: str) -> str:
+        """Fold case, accents and punctuation, collapse whitespace and drop stopwords.
+
+        A query made only of stopwords keeps them, so "The The" stays searchable.
+        """
+        words = self.fold(query).split()
+        meaningful = [word for word in words if word not in self.STOPWORDS]
+        return " ".join(meaningful or words)
+
+    @classmethod
+    def fold(cls, text: str) -> str:
+        """Case-fold, strip accents and turn punctuation runs into single spaces."""
+        decomposed = unicodedata.normalize("NFKD", text.casefold())
+        stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+        return cls._NON_WORD_RE.sub(" ", stripped).strip()
@@ -0,0 +1,97 @@
+import operator
+import re
+from typing import Callable
+
+from mircrewapi.model.record.release_info import ReleaseInfo
+from mircrewapi.parser.release_title_parser import ReleaseTitleParser
+
+ReleasePredicate = Callable[[ReleaseInfo], bool]
+
+
+class ReleaseFilterParser:
+    """Compile `field<op>value` filters and sort specs over ReleaseInfo."""
+
+    _EXPRESSION_RE = re.compile(r"^\s*(?P<field>[a-z_]+)\s*(?P<op>>=|<=|!=|=|>|<)\s*(?P<value>.+?)\s*$")
+    _OPERATORS = {
+        "=": operator.eq,
+        "!=": operator.ne,
+        ">=": operator.ge,
+        "<=": operator.le,
+        ">": operator.gt,
+        "<": operator.lt,
+    }
+    _ORDERED_FIELDS = ("resolution", "season", "episode", "year")
+    _TEXT_FIELDS = {"codec": ReleaseTitleParser.normalize_codec, "source": ReleaseTitleParser.normalize_source}
+    _SORT_FIELDS = _ORDERED_FIELDS + tuple(_TEXT_FIELDS)
+
+    def parse_filters(self, expressions: list[str]) -> ReleasePredicate | None:
+        predicates = [self._parse_expression(expression) for expression in expressions if expression.strip()]
+        if not predicates:
+            return None
+        if len(predicates) == 1:
+            return predicates[0]
+        return lambda info: all(predicate(info) for predicate in predicates)
+
+    def parse_sort(self, spec: str | None) -> list[tuple[str, bool]]:
+        """Return (field, descending) pairs for a spec such as `-resolution,year`."""
+        if not spec:
+            return []
+        keys: list[tuple[str, bool]] = []
+        for part in spec.split(","):
+            part = part.strip()
+            if not part:
+                continue
+            descending = part.startswith("-")
+            field = part.lstrip("+-")
+            if field not in self._SORT_FIELDS:
+                raise ValueError(f"Unsupported sort field: {field}")
+            keys.append((field, descending))
+        return keys
+
+    @classmethod
+    def sort_value(cls, info: ReleaseInfo, field: str):
+        if field == "resolution":
+            return ReleaseTitleParser.resolution_rank(info.resolution) or None
+        return getattr(info, field)
+
+    def _parse_expression(self, expression: str) -> ReleasePredicate:
+        match = self._EXPRESSION_RE.match(expression)
+        if not match:
+            raise ValueError(f"Invalid filter expression: {expression}")
+        field = match.group("field")
+        compare = self._OPERATORS[match.group("op")]
+        raw_value = match.group("value").lower()
+
+        if field == "resolution":
+            expected = ReleaseTitleParser.resolution_rank(raw_value)
+            if not expected:
+                raise ValueError(f"Unknown resolution: {raw_value}")
+            return lambda info: info.resolution is not None and compare(
+                ReleaseTitleParser.resolution_rank(info.resolution),
+                expected,
+            )
+        if field in ("season", "episode", "year"):
+            if not raw_value.isdigit():
+                raise ValueError(f"Filter {field} expects a number")
+            expected_number = int(raw_value)
+            return lambda info: getattr(info, field) is not None and compare(
+                getattr(info, field),
+                expected_number,
+            )
+        if compare not in (operator.eq, operator.ne):
+            raise ValueError(f"Filter {field} only supports = and !=")
+        if field in self._TEXT_FIELDS:
+            # Values go through the title parser's aliases: hevc matches x265, webdl matches web-dl.
+            expected_text = self._TEXT_FIELDS[field](raw_value)
+            if expected_text is None:
+                raise ValueError(f"Unknown {field}: {raw_value}")
+            return lambda info: compare(getattr(info, field), expected_text)
+        if field == "language":
+            # Same aliases as titles: italian and italiano match ita, deu matches ger.
+            language = ReleaseTitleParser.normalize_language(raw_value)
+            if language is None:
+                raise ValueError(f"Unknown language: {raw_value}")
+            if compare is operator.eq:
+                return lambda info: language in info.languages
+            return lambda info: language not in info.languages
+        raise ValueError(f"Unsupported filter field: {field}")
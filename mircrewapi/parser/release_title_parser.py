@@ -0,0 +1,140 @@
+import re
+
+from mircrewapi.model.record.release_info import ReleaseInfo
+
+
+class ReleaseTitleParser:
+    """Extract resolution, codec, source, languages, season/episode and year in one pass."""
+
+    RESOLUTION_RANKS = {"480p": 1, "576p": 2, "720p": 3, "1080p": 4, "1440p": 5, "2160p": 6}
+    _QUALITY_RESOLUTIONS = frozenset(("480p", "720p", "1080p", "2160p"))
+    _QUALITY_CODECS = frozenset(("x264", "x265"))
+    # The original substring check; anything it accepted stays accepted.
+    _QUALITY_KEYWORDS = ("2160p", "1080p", "720p", "480p", "4k", "x265", "x264")
+
+    # Word guards that, unlike \b, treat "_" as a separator: Film_1080p_x264.
+    _L = r"(?<![a-z0-9])"
+    _R = r"(?![a-z0-9])"
+    _SOURCE_PATTERN = (
+        r"web[-._ ]?dl|web[-._ ]?rip|blu[-._ ]?ray|bd[-._ ]?rip|br[-._ ]?rip|remux|hdtv"
+        r"|dvd[-._ ]?rip|dvd|hd[-._ ]?rip|dl[-._ ]?mux|bd[-._ ]?mux"
+    )
+    _TOKEN_RE = re.compile(
+        rf"""
+        (?P<episode>{_L}S(?P<ep_season>\d{{1,2}})[ ._]?E(?P<ep_number>\d{{1,3}}){_R})
+        |(?P<cross>{_L}(?P<cross_season>\d{{1,2}})x(?P<cross_number>\d{{2,3}}){_R})
+        |(?P<season>{_L}(?:S|Stagione\s*|Season\s*)(?P<season_number>\d{{1,2}}){_R})
+        |(?P<glued>{_L}(?P<glued_source>{_SOURCE_PATTERN})(?P<glued_lines>2160|1440|1080|720|576|480)[pi]{_R})
+        |(?P<resolution>{_L}(?:(?P<lines>2160|1440|1080|720|576|480)[pi]|4k|uhd){_R})
+        |(?P<codec>{_L}(?:[xh]\.?26[45]|hevc|avc|xvid|divx|av1){_R})
+        |(?P<source>{_L}(?:{_SOURCE_PATTERN}){_R})
+        |(?P<language>{_L}(?:ita|eng|fre|fra|ger|deu|spa|esp|jap|jpn|multi|italian|italiano|english){_R})
+        |(?P<year>{_L}(?:19[3-9]\d|20[0-4]\d){_R})
+        """,
+        re.IGNORECASE | re.VERBOSE,
+    )
+    _SEPARATORS_RE = re.compile(r"[-._ ]")
+    _CODECS = {
+        "x264": "x264",
+        "h264": "x264",
+        "avc": "x264",
+        "x265": "x265",
+        "h265": "x265",
+        "hevc": "x265",
+        "xvid": "xvid",
+        "divx": "divx",
+        "av1": "av1",
+    }
+    _SOURCES = {
+        "webdl": "web-dl",
+        "webrip": "webrip",
+        "bluray": "bluray",
+        "bdrip": "bdrip",
+        "brrip": "bdrip",
+        "remux": "remux",
+        "hdtv": "hdtv",
+        "dvdrip": "dvdrip",
+        "dvd": "dvd",
+        "hdrip": "hdrip",
+        "dlmux": "web-dl",
+        "bdmux": "bluray",
+    }
+    _LANGUAGES = {
+        "ita": "ita",
+        "eng": "eng",
+        "fre": "fre",
+        "fra": "fre",
+        "ger": "ger",
+        "deu": "ger",
+        "spa": "spa",
+        "esp": "spa",
+        "jap": "jpn",
+        "jpn": "jpn",
+        "multi": "multi",
+        "italian": "ita",
+        "italiano": "ita",
+        "english": "eng",
+    }
+
+    def parse(self, title: str) -> ReleaseInfo:
+        info = ReleaseInfo()
+        languages: list[str] = []
+        for match in self._TOKEN_RE.finditer(title):
+            kind = match.lastgroup
+            if match.group("episode"):
+                info.season = info.season or int(match.group("ep_season"))
+                info.episode = info.episode or int(match.group("ep_number"))
+            elif match.group("cross"):
+                info.season = info.season or int(match.group("cross_season"))
+                info.episode = info.episode or int(match.group("cross_number"))
+            elif match.group("season"):
+                info.season = info.season or int(match.group("season_number"))
+            elif match.group("glued"):
+                info.source = info.source or self.normalize_source(match.group("glued_source"))
+                info.resolution = info.resolution or f"{match.group('glued_lines')}p"
+            elif match.group("resolution"):
+                lines = match.group("lines")
+                info.resolution = info.resolution or (f"{lines}p" if lines else "2160p")
+            elif kind == "codec":
+                info.codec = info.codec or self.normalize_codec(match.group())
+            elif kind == "source":
+                info.source = info.source or self.normalize_source(match.group())
+            elif kind == "language":
+                language = self._LANGUAGES[match.group().lower()]
+                if language not in languages:
+                    languages.append(language)
+            elif kind == "year":
+                info.year = int(match.group())
+        info.languages = tuple(languages)
+        return info
+
+    def is_quality(self, info: ReleaseInfo, title: str = "") -> bool:
+        if info.resolution in self._QUALITY_RESOLUTIONS or info.codec in self._QUALITY_CODECS:
+            return True
+        lowered = title.lower()
+        return any(keyword in lowered for keyword in self._QUALITY_KEYWORDS)
+
+    @classmethod
+    def resolution_rank(cls, resolution: str | None) -> int:
+        if not resolution:
+            return 0
+        normalized = resolution.lower()
+        if normalized in ("4k", "uhd"):
+            normalized = "2160p"
+        return cls.RESOLUTION_RANKS.get(normalized, 0)
+
+    @classmethod
+    def normalize_codec(cls, value: str) -> str | None:
+        return cls._CODECS.get(cls._compact(value))
+
+    @classmethod
+    def normalize_source(cls, value: str) -> str | None:
+        return cls._SOURCES.get(cls._compact(value))
+
+    @classmethod
+    def normalize_language(cls, value: str) -> str | None:
+        return cls._LANGUAGES.get(cls._compact(value))
+
+    @classmethod
+    def _compact(cls, value: str) -> str:
+        return cls._SEPARATORS_RE.sub("", value.lower())
@@ -0,0 +1,216 @@
+from datetime import datetime
+from fnmatch import fnmatchcase
+import json
+import logging
+import secrets
+
+from injector import inject
+
+from mircrewapi.client.mircrew_client import MircrewClient
+from mircrewapi.manager.admission_manager import AdmissionManager
+from mircrewapi.manager.allocation_snapshot_manager import AllocationSnapshotManager
+from mircrewapi.manager.cache_manager import CacheManager
+from mircrewapi.manager.memory_watchdog import MemoryWatchdog
+from mircrewapi.manager.metrics_manager import MetricsManager
+from mircrewapi.manager.prefetch_manager import PrefetchManager
+from mircrewapi.manager.profile_manager import ProfileManager
+from mircrewapi.model.service.allocation_snapshot import AllocationDiff, AllocationSnapshotInfo
+from mircrewapi.model.service.cache_item import CacheItem
+from mircrewapi.model.service.cache_stats import CacheEntryInfo, CacheKindStats, CacheStats
+from mircrewapi.model.service.client_usage import ClientUsage
+from mircrewapi.model.service.invalidation_report import InvalidationReport
+from mircrewapi.model.service.memory_sample import MemorySample
+from mircrewapi.model.service.request_profile import RequestProfile, RequestProfileInfo
+from mircrewapi.model.service.session_stats import SessionStats
+
+
+class AdminService:
+    """Cache, session, browser, client, memory and request profile introspection plus targeted cache invalidation.
+
+    The admin API is disabled unless an admin token is configured.
+    """
+
+    _EXPIRY_BUCKETS = (("<5m", 300), ("<1h", 3600), ("<6h", 21600), ("<24h", 86400), ("<7d", 604800))
+
+    @inject
+    def __init__(
+        self,
+        cache_manager: CacheManager,
+        mircrew_client: MircrewClient,
+        metrics_manager: MetricsManager,
+        prefetch_manager: PrefetchManager | None = None,
+        admin_token: str = "",
+        memory_watchdog: MemoryWatchdog | None = None,
+        allocation_snapshot_manager: AllocationSnapshotManager | None = None,
+        admission_manager: AdmissionManager | None = None,
+        profile_manager: ProfileManager | None = None,
+    ):
+        self.cache_manager = cache_manager
+        self.mircrew_client = mircrew_client
+        self.metrics_manager = metrics_manager
+        self.prefetch_manager = prefetch_manager
+        self._admin_token = admin_token
+        self.memory_watchdog = memory_watchdog or MemoryWatchdog()
+        self.allocation_snapshot_manager = allocation_snapshot_manager or AllocationSnapshotManager()
+        self.admission_manager = admission_manager
+        self.profile_manager = profile_manager
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._admin_token)
+
+    def authorize(self, token: str | None) -> bool:
+        return self.enabled and token is not None and secrets.compare_digest(token, self._admin_token)
+
+    def cache_stats(self, near_expiry_seconds: float = 300, near_expiry_limit: int = 50) -> CacheStats:
+        now = datetime.utcnow()
+        kinds: dict[str, CacheKindStats] = {}
+        distribution = {"expired": 0, **{label: 0 for label, _ in self._EXPIRY_BUCKETS}, ">=7d": 0}
+        near_expiry: list[CacheEntryInfo] = []
+        entries = total_bytes = 0
+        for item, size in self.cache_manager.iter_items():
+            entries += 1
+            total_bytes += size
+            stats = kinds.setdefault(self._kind_of(item.key), CacheKindStats())
+            stats.entries += 1
+            stats.bytes += size
+            remaining = (item.expires_at - now).total_seconds()
+            if remaining <= 0:
+                stats.expired += 1
+            distribution[self._expiry_bucket(remaining)] += 1
+            if 0 < remaining <= near_expiry_seconds:
+                near_expiry.append(
+                    CacheEntryInfo(
+                        key=item.key,
+                        created_at=item.created_at,
+                        expires_at=item.expires_at,
+                        expires_in_seconds=round(remaining, 3),
+                    )
+                )
+        for kind, stats in kinds.items():
+            stats.hits = int(self.metrics_manager.counter("cache_hits_total", kind=kind))
+            stats.misses = int(self.metrics_manager.counter("cache_misses_total", kind=kind))
+            stats.stale_hits = int(self.metrics_manager.counter("cache_stale_hits_total", kind=kind))
+            lookups = stats.hits + stats.misses
+            stats.hit_rate = round(stats.hits / lookups, 4) if lookups else None
+        near_expiry.sort(key=lambda entry: entry.expires_in_seconds)
+        return CacheStats(
+            entries=entries,
+            bytes=total_bytes,
+            kinds=dict(sorted(kinds.items())),
+            expiry_distribution=distribution,
+            near_expiry=near_expiry[:near_expiry_limit],
+        )
+
+    def invalidate(
+        self,
+        prefix: str | None = None,
+        pattern: str | None = None,
+        post_id: str | None = None,
+    ) -> InvalidationReport:
+        """Delete every entry matching any of the given selectors."""
+        if not (prefix or pattern or post_id):
+            raise ValueError("Provide at least one of prefix, pattern or post_id")
+        keys = [
+            item.key
+            for item, _ in self.cache_manager.iter_items()
+            if self._matches(item, prefix, pattern, post_id)
+        ]
+        for key in keys:
+            self.cache_manager.delete(key)
+            if self.prefetch_manager:
+                self.prefetch_manager.forget(key)
+        self.metrics_manager.increment("cache_invalidations_total", len(keys))
+        self._logger.info("Invalidated %d cache entries.", len(keys))
+        return InvalidationReport(deleted=len(keys), keys=sorted(keys))
+
+    def session_stats(self) -> SessionStats:
+        session_age = self.mircrew_client.session_age()
+        state_age = self.mircrew_client.state_file_age()
+        open_browsers, open_contexts = self.mircrew_client.browser_counts()
+        return SessionStats(
+            logged_in=session_age is not None,
+            session_age_seconds=session_age.total_seconds() if session_age is not None else None,
+            state_file_age_seconds=state_age.total_seconds() if state_age is not None else None,
+            open_browsers=open_browsers,
+            open_contexts=open_contexts,
+            browser_launches=int(self.metrics_manager.counter("browser_launches_total")),
+            logins=int(self.metrics_manager.counter("logins_total")),
+        )
+
+    def refresh_session(self) -> SessionStats:
+        self._logger.info("Forcing an upstream session refresh.")
+        self.mircrew_client.refresh_session()
+        return self.session_stats()
+
+    def client_usage(self) -> list[ClientUsage]:
+        return self.admission_manager.usage() if self.admission_manager else []
+
+    def memory_sample(self) -> MemorySample:
+        return self.memory_watchdog.sample()
+
+    def take_allocation_snapshot(self, label: str = "") -> AllocationSnapshotInfo:
+        return self.allocation_snapshot_manager.take(label)
+
+    def allocation_snapshots(self) -> list[AllocationSnapshotInfo]:
+        return self.allocation_snapshot_manager.snapshots()
+
+    def diff_allocation_snapshots(
+        self,
+        first_id: int,
+        second_id: int,
+        group_by: str = "lineno",
+        limit: int = 25,
+    ) -> AllocationDiff:
+        return self.allocation_snapshot_manager.diff(first_id, second_id, group_by, limit)
+
+    def clear_allocation_snapshots(self) -> None:
+        self.allocation_snapshot_manager.clear()
+
+    def profiles(self) -> list[RequestProfileInfo]:
+        return self.profile_manager.profiles() if self.profile_manager else []
+
+    def profile(self, profile_id: str, top: int = 20) -> RequestProfile:
+        if not self.profile_manager:
+            raise KeyError(profile_id)
+        return self.profile_manager.profile(profile_id, top)
+
+    def folded_profile(self, profile_id: str) -> str:
+        if not self.profile_manager:
+            raise KeyError(profile_id)
+        return self.profile_manager.folded(profile_id)
+
+    def clear_profiles(self) -> int:
+        return self.profile_manager.clear() if self.profile_manager else 0
+
+    @staticmethod
+    def _kind_of(key: str) -> str:
+        return key.split("_", 1)[0]
+
+    @classmethod
+    def _expiry_bucket(cls, remaining: float) -> str:
+        if remaining <= 0:
+            return "expired"
+        for label, limit in cls._EXPIRY_BUCKETS:
+            if remaining < limit:
+                return label
+        return ">=7d"
+
+    @staticmethod
+    def _matches(item: CacheItem, prefix: str | None, pattern: str | None, post_id: str | None) -> bool:
+        if prefix and item.key.startswith(prefix):
+            return True
+        if pattern and fnmatchcase(item.key, pattern):
+            return True
+        if not post_id:
+            return False
+        if item.key == f"magnets_{post_id}":
+            return True
+        if not item.key.startswith("search_"):
+            return False
+        try:
+            listed = json.loads(item.value)
+        except ValueError:
+            return False
+        return any(isinstance(entry, dict) and entry.get("id") == post_id for entry in listed)
@@ -0,0 +1,97 @@
+import asyncio
+import math
+import time
+
+from injector import inject
+
+from mircrewapi.manager.metrics_manager import MetricsManager
+from mircrewapi.model.service.load_test_report import LoadTestReport
+
+
+class LoadTestService:
+    """Drive an ASGI app in-process at a fixed concurrency and summarize latency.
+
+    Requests carry an ``X-Client-Id`` so admission limits are applied per
+    simulated client rather than to one shared address: ``clients`` ids are
+    used round-robin, one per worker by default. An ``api_key`` is sent as
+    ``X-API-Key`` to run as a configured client instead.
+    """
+
+    @inject
+    def __init__(self, metrics_manager: MetricsManager):
+        self.metrics_manager = metrics_manager
+
+    def run(
+        self,
+        app,
+        paths: list[str],
+        concurrency: int,
+        total_requests: int,
+        clients: int = 0,
+        api_key: str | None = None,
+    ) -> LoadTestReport:
+        concurrency = max(1, concurrency)
+        return asyncio.run(
+            self._run(app, paths, concurrency, max(1, total_requests), clients or concurrency, api_key)
+        )
+
+    async def _run(
+        self,
+        app,
+        paths: list[str],
+        concurrency: int,
+        total_requests: int,
+        clients: int,
+        api_key: str | None,
+    ) -> LoadTestReport:
+        import httpx
+
+        latencies: list[float] = []
+        failures = 0
+        next_index = 0
+        launches_before = self.metrics_manager.counter("browser_launches_total")
+        transport = httpx.ASGITransport(app=app)
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=None) as client:
+
+            async def worker() -> None:
+                nonlocal failures, next_index
+                while next_index < total_requests:
+                    path = paths[next_index % len(paths)]
+                    headers = {"X-Client-Id": f"loadtest-{next_index % clients}"}
+                    if api_key:
+                        headers["X-API-Key"] = api_key
+                    next_index += 1
+                    started = time.perf_counter()
+                    try:
+                        response = await client.get(path, headers=headers)
+                        if response.status_code >= 400:
+                            failures += 1
+                    except Exception:
+                        failures += 1
+                    latencies.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            duration = time.perf_counter() - started
+
+        launches = self.metrics_manager.counter("browser_launches_total") - launches_before
+        latencies.sort()
+        return LoadTestReport(
+            concurrency=concurrency,
+            requests=len(latencies),
+            failures=failures,
+            duration_seconds=round(duration, 3),
+            throughput_rps=round(len(latencies) / duration, 2) if duration > 0 else 0.0,
+            p50_ms=self._percentile(latencies, 50),
+            p95_ms=self._percentile(latencies, 95),
+            p99_ms=self._percentile(latencies, 99),
+            browser_launches_per_request=round(launches / len(latencies), 3),
+        )
+
+    @staticmethod
+    def _percentile(sorted_values: list[float], percentile: float) -> float:
+        if not sorted_values:
+            return 0.0
+        rank = max(1, math.ceil(percentile / 100 * len(sorted_values)))
+        return round(sorted_values[rank - 1] * 1000, 2)
@@ -0,0 +1,46 @@
+from injector import inject
+
+from mircrewapi.client.mircrew_client import MircrewClient
+from mircrewapi.manager.index_manager import IndexManager
+from mircrewapi.manager.page_archive_manager import PageArchiveManager
+from mircrewapi.mapper.service.magnet_mapper import MagnetMapper
+from mircrewapi.mapper.service.post_mapper import PostMapper
+from mircrewapi.model.service.reparse_report import ReparseReport
+
+
+class ReparseService:
+    """Rebuild the post/magnet index from archived pages without touching the network."""
+
+    @inject
+    def __init__(
+        self,
+        page_archive_manager: PageArchiveManager,
+        mircrew_client: MircrewClient,
+        index_manager: IndexManager,
+        post_mapper: PostMapper,
+        magnet_mapper: MagnetMapper,
+    ):
+        self.page_archive_manager = page_archive_manager
+        self.mircrew_client = mircrew_client
+        self.index_manager = index_manager
+        self.post_mapper = post_mapper
+        self.magnet_mapper = magnet_mapper
+
+    def run(self, kind: str | None = None) -> ReparseReport:
+        report = ReparseReport()
+        for record in self.page_archive_manager.iter_pages(kind):
+            html = self.page_archive_manager.read(record)
+            if html is None:
+                report.missing_pages += 1
+                continue
+            if record.kind == "search":
+                posts = self.post_mapper.to_domain(self.mircrew_client.parse_search_page(html))
+                self.index_manager.record_posts(posts)
+                report.search_pages += 1
+                report.posts += len(posts)
+            elif record.kind == "topic":
+                magnets = self.magnet_mapper.to_domain(self.mircrew_client.parse_topic_page(html))
+                self.index_manager.record_magnets(record.ref, magnets)
+                report.topic_pages += 1
+                report.magnets += len(magnets)
+        return report
@@ -1,30 +1,306 @@
+from datetime import datetime, timedelta
+import hashlib
+import json
+import logging
+from typing import Callable, TypeVar
+
 from injector import inject
 
 from mircrewapi.client.mircrew_client import MircrewClient
+from mircrewapi.manager.cache_manager import CacheManager
+from mircrewapi.manager.circuit_breaker import UpstreamUnavailableError
+from mircrewapi.manager.index_manager import IndexManager
+from mircrewapi.manager.metrics_manager import MetricsManager
+from mircrewapi.manager.prefetch_manager import PrefetchManager
+from mircrewapi.manager.refresh_manager import RefreshManager
 from mircrewapi.mapper.service.magnet_mapper import MagnetMapper
 from mircrewapi.mapper.service.post_mapper import PostMapper
+from mircrewapi.model.service.cache_item import CacheItem
+from mircrewapi.model.service.cached_result import CachedResult
 from mircrewapi.model.service.magnet_item import MagnetItem
+from mircrewapi.model.record.release_info import ReleaseInfo
 from mircrewapi.model.service.post_item import PostItem
+from mircrewapi.parser.magnet_parser import MagnetParser
+from mircrewapi.parser.query_normalizer import QueryNormalizer
+from mircrewapi.parser.release_filter_parser import ReleaseFilterParser
+from mircrewapi.parser.release_title_parser import ReleaseTitleParser
+from mircrewapi.service.suggest_service import SuggestService
+from mircrewapi.service.watchlist_service import WatchlistService
+
+ItemT = TypeVar("ItemT", PostItem, MagnetItem)
 
 
 class SearchService:
     """Service layer for search operations."""
 
+    _SEARCH_TTL = timedelta(minutes=15)
+    _MAGNETS_TTL = timedelta(hours=1)
+
     @inject
     def __init__(
         self,
         mircrew_client: MircrewClient,
         post_mapper: PostMapper,
         magnet_mapper: MagnetMapper,
+        cache_manager: CacheManager | None = None,
+        metrics_manager: MetricsManager | None = None,
+        release_title_parser: ReleaseTitleParser | None = None,
+        release_filter_parser: ReleaseFilterParser | None = None,
+        index_manager: IndexManager | None = None,
+        magnet_parser: MagnetParser | None = None,
+        watchlist_service: WatchlistService | None = None,
+        suggest_service: SuggestService | None = None,
+        query_normalizer: QueryNormalizer | None = None,
+        prefetch_manager: PrefetchManager | None = None,
+        refresh_manager: RefreshManager | None = None,
     ):
         self.mircrew_client = mircrew_client
         self.post_mapper = post_mapper
         self.magnet_mapper = magnet_mapper
+        self.cache_manager = cache_manager
+        self.metrics_manager = metrics_manager or MetricsManager(enabled=False)
+        self.release_title_parser = release_title_parser or ReleaseTitleParser()
+        self.release_filter_parser = release_filter_parser or ReleaseFilterParser()
+        self.index_manager = index_manager
+        self.magnet_parser = magnet_parser or MagnetParser()
+        self.watchlist_service = watchlist_service
+        self.suggest_service = suggest_service
+        self.query_normalizer = query_normalizer or QueryNormalizer()
+        self.prefetch_manager = prefetch_manager
+        self.refresh_manager = refresh_manager
+        self._logger = logging.getLogger(self.__class__.__name__)
 
     def search_posts(self, query: str) -> list[PostItem]:
-        items = self.mircrew_client.search_posts(query)
-        return self.post_mapper.to_domain(items)
+        return self.search_posts_result(query).items
 
     def get_magnets(self, post_id: str) -> list[MagnetItem]:
-        items = self.mircrew_client.get_magnets(post_id)
-        return self.magnet_mapper.to_domain(items)
+        return self.get_magnets_result(post_id).items
+
+    def filter_posts(
+        self,
+        items: list[PostItem],
+        filters: list[str] | None = None,
+        sort: str | None = None,
+    ) -> list[PostItem]:
+        """Filter and order posts on their precomputed release metadata.
+
+        Raises ValueError for malformed filter or sort expressions.
+        """
+        predicate = self.release_filter_parser.parse_filters(filters or [])
+        sort_keys = self.release_filter_parser.parse_sort(sort)
+        if predicate is None and not sort_keys:
+            return items
+        selected = [item for item in items if predicate is None or predicate(self._release_of(item))]
+        for field, descending in reversed(sort_keys):
+            selected.sort(
+                key=lambda item: self._sort_key(self._release_of(item), field, descending),
+                reverse=descending,
+            )
+        return selected
+
+    def posts_since(self, result: CachedResult, since: int | None = None) -> CachedResult:
+        """Keep only posts first seen after ``since`` and stamp the latest cursor.
+
+        Cursors are the index's first-seen sequence, so a client polling with
+        the returned cursor only receives posts it has not seen before.
+        """
+        items: list[PostItem] = result.items
+        missing = [item.id for item in items if item.cursor is None]
+        if missing and self.index_manager:
+            # Entries cached before cursors existed are backfilled from the index.
+            cursors = self.index_manager.cursors_for(missing)
+            for item in items:
+                if item.cursor is None:
+                    item.cursor = cursors.get(item.id)
+        cursor = max((item.cursor for item in items if item.cursor is not None), default=since)
+        if since is not None:
+            cursor = max(cursor, since)
+            items = [item for item in items if item.cursor is None or item.cursor > since]
+        return result.model_copy(update={"items": items, "cursor": cursor})
+
+    def search_posts_result(self, query: str) -> CachedResult:
+        canonical = self._canonical(query)
+        if canonical != query:
+            self.metrics_manager.increment("queries_normalized_total")
+        return self._cached(
+            f"search_{canonical}",
+            PostItem,
+            # The canonical form only keys the cache; phpBB still searches what the user typed.
+            lambda: self._load_posts(" ".join(query.split())),
+            self._SEARCH_TTL,
+        )
+
+    def get_magnets_result(self, post_id: str) -> CachedResult:
+        key = f"magnets_{post_id}"
+        if self.prefetch_manager:
+            self.prefetch_manager.claim(key)
+        result = self._cached(
+            key,
+            MagnetItem,
+            lambda: self._load_magnets(post_id),
+            self._MAGNETS_TTL,
+        )
+        self.metrics_manager.increment("magnet_requests_total")
+        if self.prefetch_manager and self.prefetch_manager.was_prefetched(key):
+            self.metrics_manager.increment("magnet_prefetch_hits_total")
+        return result
+
+    def has_fresh_search(self, query: str) -> bool:
+        """Whether ``search_posts_result`` would be answered from the cache."""
+        return self._is_fresh(f"search_{self._canonical(query)}")
+
+    def has_fresh_magnets(self, post_id: str) -> bool:
+        return self._is_fresh(f"magnets_{post_id}")
+
+    def local_magnets(self, post_id: str) -> list[MagnetItem] | None:
+        """Magnets known without going upstream: cached (even stale) or indexed."""
+        if self.cache_manager:
+            cached = self.cache_manager.get(f"magnets_{post_id}", allow_stale=True)
+            if cached is not None:
+                return self._to_result(cached, MagnetItem).items
+        if self.index_manager:
+            return self.index_manager.magnets_for_post(post_id) or None
+        return None
+
+    def recent_posts(self, limit: int) -> list[PostItem]:
+        """Newest indexed posts, e.g. for feeds polled without a query."""
+        if not self.index_manager:
+            return []
+        return self.index_manager.recent_posts(limit)
+
+    def first_seen(self, post_ids: list[str]) -> dict[str, datetime]:
+        if not self.index_manager:
+            return {}
+        return self.index_manager.first_seen_for(post_ids)
+
+    def find_magnet(self, infohash: str) -> tuple[MagnetItem, list[PostItem]] | None:
+        """Look up a magnet (hex or base32 infohash) and the posts containing it."""
+        normalized = self.magnet_parser.normalize_infohash(infohash)
+        if not normalized or not self.index_manager:
+            return None
+        magnet = self.index_manager.get_magnet(normalized)
+        if magnet is None:
+            return None
+        posts = self.index_manager.posts_for_magnet(normalized)
+        for post in posts:
+            post.url = post.url or self.mircrew_client.build_post_url(post.id)
+        return magnet, posts
+
+    def _load_posts(self, query: str) -> list[PostItem]:
+        items = self._map(self.post_mapper.to_domain, self.mircrew_client.search_posts(query))
+        new_items = self.index_manager.record_posts(items) if self.index_manager else items
+        if self.watchlist_service and new_items:
+            self.watchlist_service.process_posts(new_items)
+        if self.suggest_service:
+            self.suggest_service.add_posts(items)
+        # Only fresh results are scanned; a cache hit already queued its prefetches when it was loaded.
+        self._prefetch_magnets(items)
+        return items
+
+    def _load_magnets(self, post_id: str) -> list[MagnetItem]:
+        items = self._dedupe_magnets(
+            self._map(self.magnet_mapper.to_domain, self.mircrew_client.get_magnets(post_id))
+        )
+        if self.index_manager:
+            self.index_manager.record_magnets(post_id, items)
+        return items
+
+    def _prefetch_magnets(self, posts: list[PostItem]) -> None:
+        """Queue background magnet fetches for the top posts that are not cached yet."""
+        if not self.prefetch_manager or not self.prefetch_manager.enabled or not self.cache_manager:
+            return
+        for post in posts[:self.prefetch_manager.top_k]:
+            key = f"magnets_{post.id}"
+            if self.cache_manager.get(key) is not None:
+                continue
+            self.prefetch_manager.submit(key, lambda post_id=post.id: self._prefetch_magnets_for(post_id))
+
+    def _prefetch_magnets_for(self, post_id: str) -> None:
+        key = f"magnets_{post_id}"
+        if self.cache_manager.get(key) is not None:
+            return
+        items = self._load_magnets(post_id)
+        stored = self._store(key, items, self._ttl_for(key, items, self._MAGNETS_TTL))
+        self.prefetch_manager.mark_prefetched(key, stored.expires_at)
+
+    @staticmethod
+    def _dedupe_magnets(items: list[MagnetItem]) -> list[MagnetItem]:
+        seen: set[str] = set()
+        unique: list[MagnetItem] = []
+        for item in items:
+            key = item.infohash or item.url
+            if key in seen:
+                continue
+            seen.add(key)
+            unique.append(item)
+        return unique
+
+    def _cached(
+        self,
+        key: str,
+        item_type: type[ItemT],
+        loader: Callable[[], list[ItemT]],
+        ttl: timedelta,
+    ) -> CachedResult:
+        if not self.cache_manager:
+            return CachedResult(items=loader())
+        kind = key.split("_", 1)[0]
+        with self.metrics_manager.span("cache_lookup"):
+            cached = self.cache_manager.get(key)
+        if cached is not None:
+            self.metrics_manager.increment("cache_hits_total", kind=kind)
+            return self._to_result(cached, item_type)
+        self.metrics_manager.increment("cache_misses_total", kind=kind)
+        try:
+            items = loader()
+        except UpstreamUnavailableError:
+            stale = self.cache_manager.get(key, allow_stale=True)
+            if stale is None:
+                raise
+            self._logger.warning("Upstream unavailable, serving stale cache for %s.", key)
+            self.metrics_manager.increment("cache_stale_hits_total", kind=kind)
+            return self._to_result(stale, item_type)
+        stored = self._store(key, items, self._ttl_for(key, items, ttl))
+        if self.prefetch_manager:
+            self.prefetch_manager.forget(key)
+        return CachedResult(items=items, created_at=stored.created_at, expires_at=stored.expires_at)
+
+    def _canonical(self, query: str) -> str:
+        return self.query_normalizer.normalize(query) or query.strip()
+
+    def _is_fresh(self, key: str) -> bool:
+        return self.cache_manager is not None and self.cache_manager.get(key) is not None
+
+    def _ttl_for(self, key: str, items: list[ItemT], default: timedelta) -> timedelta:
+        """Adaptive TTL from the refresh policy, or the fixed default without one."""
+        if not self.refresh_manager:
+            return default
+        return self.refresh_manager.next_ttl(key, self._content_hash(items))
+
+    @staticmethod
+    def _content_hash(items: list[ItemT]) -> str:
+        # Order-insensitive: a reshuffled but otherwise identical list is unchanged.
+        keys = sorted(getattr(item, "infohash", None) or getattr(item, "id", None) or item.url for item in items)
+        return hashlib.sha256("\n".join(keys).encode("utf-8")).hexdigest()
+
+    def _store(self, key: str, items: list[ItemT], ttl: timedelta) -> CacheItem:
+        return self.cache_manager.set(key, json.dumps([item.to_dict() for item in items]), ttl)
+
+    def _release_of(self, item: PostItem) -> ReleaseInfo:
+        if item.release is None:
+            item.release = self.release_title_parser.parse(item.title)
+        return item.release
+
+    def _sort_key(self, release: ReleaseInfo, field: str, descending: bool) -> tuple:
+        value = self.release_filter_parser.sort_value(release, field)
+        # Missing values sort last in both directions.
+        return (value is not None, value) if descending else (value is None, value)
+
+    def _map(self, mapper: Callable[[list], list[ItemT]], items: list) -> list[ItemT]:
+        with self.metrics_manager.span("service_mapper"):
+            return mapper(items)
+
+    @staticmethod
+    def _to_result(cached: CacheItem, item_type: type[ItemT]) -> CachedResult:
+        items = [item_type.from_dict(payload) for payload in json.loads(cached.value)]
+        return CachedResult(items=items, created_at=cached.created_at, expires_at=cached.expires_at)
@@ -0,0 +1,25 @@
+from injector import inject
+
+from mircrewapi.manager.index_manager import IndexManager
+from mircrewapi.manager.suggest_manager import SuggestManager
+from mircrewapi.model.service.post_item import PostItem
+
+
+class SuggestService:
+    """Typeahead over every post title seen by the client."""
+
+    _BOOTSTRAP_LIMIT = 50000
+
+    @inject
+    def __init__(self, suggest_manager: SuggestManager, index_manager: IndexManager | None = None):
+        self.suggest_manager = suggest_manager
+        self.index_manager = index_manager
+        if self.index_manager and not len(self.suggest_manager):
+            # No snapshot yet: seed from the titles already in the index.
+            self.suggest_manager.add_titles(self.index_manager.recent_titles(self._BOOTSTRAP_LIMIT))
+
+    def suggest(self, prefix: str, limit: int = 10) -> list[str]:
+        return self.suggest_manager.suggest(prefix, limit)
+
+    def add_posts(self, posts: list[PostItem]) -> None:
+        self.suggest_manager.add_titles(post.title for post in posts)
@@ -0,0 +1,167 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import logging
+import secrets
+
+from injector import inject
+
+from mircrewapi.manager.metrics_manager import MetricsManager
+from mircrewapi.manager.profile_manager import ProfileManager
+from mircrewapi.model.record.release_info import ReleaseInfo
+from mircrewapi.model.service.magnet_item import MagnetItem
+from mircrewapi.model.service.post_item import PostItem
+from mircrewapi.model.service.torznab_item import TorznabItem
+from mircrewapi.parser.release_title_parser import ReleaseTitleParser
+from mircrewapi.service.search_service import SearchService
+
+
+class TorznabService:
+    """Torznab searches over SearchService, answered from the cache and the local index first.
+
+    Posts whose magnets are neither cached nor indexed are fetched upstream by
+    a small pool shared by every Torznab request, at most ``max_fetches`` per
+    request; the others are left out and show up on a later poll once their
+    magnets are known. Searches without a query (RSS polls) list the newest
+    indexed posts and never go upstream.
+    """
+
+    MOVIES, MOVIES_HD, MOVIES_UHD = 2000, 2040, 2045
+    TV, TV_HD, TV_UHD = 5000, 5040, 5045
+    CATEGORIES = {
+        MOVIES: ("Movies", {MOVIES_HD: "Movies/HD", MOVIES_UHD: "Movies/UHD"}),
+        TV: ("TV", {TV_HD: "TV/HD", TV_UHD: "TV/UHD"}),
+    }
+    MODES = ("search", "tvsearch", "movie")
+    DEFAULT_LIMIT = 50
+    MAX_LIMIT = 100
+
+    @inject
+    def __init__(
+        self,
+        search_service: SearchService,
+        release_title_parser: ReleaseTitleParser,
+        metrics_manager: MetricsManager | None = None,
+        api_key: str = "",
+        fetch_concurrency: int = 2,
+        max_fetches: int = 10,
+    ):
+        self.search_service = search_service
+        self.release_title_parser = release_title_parser
+        self.metrics_manager = metrics_manager or MetricsManager(enabled=False)
+        self._api_key = api_key
+        self._max_fetches = max_fetches
+        self._fetch_pool = ThreadPoolExecutor(max_workers=max(1, fetch_concurrency), thread_name_prefix="torznab")
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def authorize(self, api_key: str | None) -> bool:
+        if not self._api_key:
+            return True
+        # Compared as bytes: compare_digest rejects non-ASCII str, and apikey comes from the query string.
+        return api_key is not None and secrets.compare_digest(api_key.encode("utf-8"), self._api_key.encode("utf-8"))
+
+    def is_cached(self, query: str | None) -> bool:
+        """Whether the post listing is answered locally; magnet top-ups stay capped at ``max_fetches``."""
+        query = (query or "").strip()
+        return not query or self.search_service.has_fresh_search(query)
+
+    def search(
+        self,
+        mode: str,
+        query: str | None = None,
+        season: int | None = None,
+        episode: int | None = None,
+        categories: set[int] | None = None,
+        offset: int = 0,
+        limit: int = DEFAULT_LIMIT,
+    ) -> list[TorznabItem]:
+        query = (query or "").strip()
+        if query:
+            posts = self.search_service.search_posts_result(query).items
+        else:
+            posts = self.search_service.recent_posts(self.MAX_LIMIT)
+        wanted = self._wanted_categories(mode, categories)
+        candidates = []
+        for post in posts:
+            release = post.release or self.release_title_parser.parse(post.title)
+            if season is not None and release.season != season:
+                continue
+            if episode is not None and release.episode != episode:
+                continue
+            post_categories = self.categories_for(release)
+            if wanted and not wanted.intersection(post_categories):
+                continue
+            candidates.append((post, post_categories))
+
+        magnets = self._magnets_for([post for post, _ in candidates], fetch=bool(query))
+        published = self.search_service.first_seen([post.id for post, _ in candidates])
+        items = [
+            self._to_item(post, magnet, post_categories, published.get(post.id))
+            for post, post_categories in candidates
+            for magnet in magnets.get(post.id, [])
+        ]
+        return items[offset:offset + limit]
+
+    @classmethod
+    def categories_for(cls, release: ReleaseInfo) -> list[int]:
+        tv = release.season is not None or release.episode is not None
+        parent = cls.TV if tv else cls.MOVIES
+        rank = ReleaseTitleParser.resolution_rank(release.resolution)
+        if rank >= ReleaseTitleParser.RESOLUTION_RANKS["2160p"]:
+            return [parent, cls.TV_UHD if tv else cls.MOVIES_UHD]
+        if rank >= ReleaseTitleParser.RESOLUTION_RANKS["720p"]:
+            return [parent, cls.TV_HD if tv else cls.MOVIES_HD]
+        return [parent]
+
+    def _wanted_categories(self, mode: str, categories: set[int] | None) -> set[int]:
+        wanted = set(categories or ())
+        if mode == "tvsearch":
+            wanted = wanted or {self.TV}
+        elif mode == "movie":
+            wanted = wanted or {self.MOVIES}
+        return wanted
+
+    def _magnets_for(self, posts: list[PostItem], fetch: bool) -> dict[str, list[MagnetItem]]:
+        found: dict[str, list[MagnetItem]] = {}
+        missing: list[str] = []
+        for post in posts:
+            local = self.search_service.local_magnets(post.id)
+            if local is not None:
+                found[post.id] = local
+                self.metrics_manager.increment("torznab_magnets_total", source="local")
+            elif post.id not in missing:
+                missing.append(post.id)
+
+        to_fetch = missing[:self._max_fetches] if fetch else []
+        skipped = len(missing) - len(to_fetch)
+        if skipped:
+            self.metrics_manager.increment("torznab_magnets_total", skipped, source="skipped")
+        futures = {
+            post_id: self._fetch_pool.submit(ProfileManager.bind(self.search_service.get_magnets_result), post_id)
+            for post_id in to_fetch
+        }
+        for post_id, future in futures.items():
+            try:
+                found[post_id] = future.result().items
+                self.metrics_manager.increment("torznab_magnets_total", source="upstream")
+            except Exception as exc:
+                self._logger.warning("Magnets for post %s unavailable: %s", post_id, exc)
+                self.metrics_manager.increment("torznab_magnets_total", source="failed")
+        return found
+
+    def _to_item(
+        self,
+        post: PostItem,
+        magnet: MagnetItem,
+        categories: list[int],
+        published_at: datetime | None,
+    ) -> TorznabItem:
+        return TorznabItem(
+            post_id=post.id,
+            title=magnet.display_name or magnet.title or post.title,
+            magnet_url=magnet.url,
+            comments_url=post.url,
+            infohash=magnet.infohash,
+            size=magnet.size,
+            categories=categories,
+            published_at=published_at,
+        )
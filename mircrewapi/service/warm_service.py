@@ -0,0 +1,87 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import json
+import logging
+from pathlib import Path
+import threading
+import time
+from typing import Iterable
+
+from injector import inject
+
+from mircrewapi.model.service.warm_report import WarmReport
+from mircrewapi.service.search_service import SearchService
+
+
+class WarmService:
+    """Pre-populate the cache and index by running queries and post ids through SearchService.
+
+    Entries are plain queries or ``post:<id>``. Completed entries are appended to
+    an optional progress file and skipped on the next run, so an interrupted
+    warm-up resumes where it stopped; failed entries are retried.
+    """
+
+    POST_PREFIX = "post:"
+
+    @inject
+    def __init__(self, search_service: SearchService):
+        self.search_service = search_service
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def run(self, entries: Iterable[str], workers: int = 2, progress_path: str | None = None) -> WarmReport:
+        unique = list(dict.fromkeys(entry.strip() for entry in entries if entry.strip()))
+        done = self._load_progress(progress_path)
+        pending = [entry for entry in unique if entry not in done]
+        failures: dict[str, str] = {}
+        progress_lock = threading.Lock()
+        progress_file = open(progress_path, "a", encoding="utf-8") if progress_path else None
+
+        started = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="warm") as executor:
+                futures = {executor.submit(self._warm_entry, entry): entry for entry in pending}
+                for future in as_completed(futures):
+                    entry = futures[future]
+                    try:
+                        future.result()
+                    except Exception as exc:
+                        self._logger.warning("Warming %s failed: %s", entry, exc)
+                        failures[entry] = str(exc) or exc.__class__.__name__
+                        continue
+                    if progress_file:
+                        with progress_lock:
+                            progress_file.write(json.dumps(entry) + "\n")
+                            progress_file.flush()
+        finally:
+            if progress_file:
+                progress_file.close()
+        duration = time.perf_counter() - started
+
+        succeeded = len(pending) - len(failures)
+        return WarmReport(
+            total=len(unique),
+            skipped=len(unique) - len(pending),
+            succeeded=succeeded,
+            failed=len(failures),
+            duration_seconds=round(duration, 3),
+            throughput_per_minute=round(succeeded / duration * 60, 2) if duration > 0 else 0.0,
+            failures=failures,
+        )
+
+    def _warm_entry(self, entry: str) -> None:
+        if entry.startswith(self.POST_PREFIX):
+            self.search_service.get_magnets(entry[len(self.POST_PREFIX):].strip())
+        else:
+            self.search_service.search_posts(entry)
+
+    @staticmethod
+    def _load_progress(progress_path: str | None) -> set[str]:
+        if not progress_path or not Path(progress_path).exists():
+            return set()
+        done: set[str] = set()
+        for line in Path(progress_path).read_text(encoding="utf-8").splitlines():
+            try:
+                done.add(json.loads(line))
+            except ValueError:
+                # A line cut short by an interrupted run is simply retried.
+                continue
+        return done
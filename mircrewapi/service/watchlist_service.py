@@ -0,0 +1,160 @@
+from concurrent.futures import ThreadPoolExecutor
+import ipaddress
+import logging
+import threading
+from urllib.parse import urlsplit
+
+from injector import inject
+
+from mircrewapi.manager.watchlist_manager import WatchlistManager
+from mircrewapi.matcher.watchlist_matcher import WatchlistMatcher
+from mircrewapi.model.record.post_record import PostRecord
+from mircrewapi.model.record.watchlist_match_record import WatchlistMatchRecord
+from mircrewapi.model.record.watchlist_record import WatchlistRecord
+from mircrewapi.parser.release_filter_parser import ReleaseFilterParser
+from mircrewapi.parser.release_title_parser import ReleaseTitleParser
+
+
+class WatchlistService:
+    """Manage saved searches and match newly seen posts against all of them at once.
+
+    Webhooks are local: their host must be a loopback address or one of
+    ``webhook_allowed_hosts``, so watchlists cannot make the server call
+    arbitrary URLs.
+    """
+
+    _WEBHOOK_TIMEOUT = 5
+    _LOCAL_HOSTS = frozenset(("localhost",))
+
+    @inject
+    def __init__(
+        self,
+        watchlist_manager: WatchlistManager,
+        release_title_parser: ReleaseTitleParser,
+        release_filter_parser: ReleaseFilterParser,
+        webhook_allowed_hosts: frozenset[str] | None = None,
+    ):
+        self.watchlist_manager = watchlist_manager
+        self.release_title_parser = release_title_parser
+        self.release_filter_parser = release_filter_parser
+        self._webhook_allowed_hosts = frozenset(host.lower() for host in webhook_allowed_hosts or ())
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._webhook_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="watchlist-webhook")
+        self._rebuild()
+
+    def list_watchlists(self) -> list[WatchlistRecord]:
+        return self.watchlist_manager.find_all()
+
+    def get_watchlist(self, watchlist_id: int) -> WatchlistRecord | None:
+        return self.watchlist_manager.get(watchlist_id)
+
+    def save_watchlist(self, watchlist: WatchlistRecord) -> WatchlistRecord:
+        """Create or update a watchlist; raises ValueError for invalid queries or filters."""
+        if not WatchlistMatcher.normalize(watchlist.query):
+            raise ValueError("Watchlist query has no searchable terms")
+        self.release_filter_parser.parse_filters(watchlist.filters)
+        if watchlist.webhook_url:
+            self._check_webhook_url(watchlist.webhook_url)
+        saved = self.watchlist_manager.save(watchlist)
+        self._rebuild()
+        return saved
+
+    def delete_watchlist(self, watchlist_id: int) -> bool:
+        deleted = self.watchlist_manager.delete(watchlist_id)
+        self._rebuild()
+        return deleted
+
+    def matches_since(
+        self,
+        since: int = 0,
+        watchlist_id: int | None = None,
+        limit: int = 100,
+    ) -> list[WatchlistMatchRecord]:
+        return self.watchlist_manager.matches_since(since, watchlist_id, limit)
+
+    def process_posts(self, posts: list[PostRecord]) -> list[WatchlistMatchRecord]:
+        """Match posts against every watchlist in a single pass and store the hits."""
+        with self._lock:
+            matcher = self._matcher
+            watchlists = self._watchlists
+            predicates = self._predicates
+        if not watchlists or not posts:
+            return []
+
+        hits: list[tuple[int, PostRecord]] = []
+        for post in posts:
+            for watchlist_id in matcher.match(post.title):
+                predicate = predicates.get(watchlist_id)
+                if predicate is not None:
+                    if post.release is None:
+                        post.release = self.release_title_parser.parse(post.title)
+                    if not predicate(post.release):
+                        continue
+                hits.append((watchlist_id, post))
+        if not hits:
+            return []
+
+        stored = self.watchlist_manager.add_matches(hits)
+        for match in stored:
+            webhook_url = watchlists[match.watchlist_id].webhook_url
+            if webhook_url:
+                self._webhook_executor.submit(self._deliver, webhook_url, match)
+        return stored
+
+    def _deliver(self, webhook_url: str, match: WatchlistMatchRecord) -> None:
+        payload = {
+            "cursor": match.cursor,
+            "watchlist_id": match.watchlist_id,
+            "post_id": match.post_id,
+            "title": match.title,
+            "url": match.url,
+            "matched_at": match.matched_at.isoformat(),
+        }
+        try:
+            # Watchlists saved before webhooks were restricted are checked again here.
+            self._check_webhook_url(webhook_url)
+        except ValueError as exc:
+            self._logger.warning("Watchlist webhook %s skipped: %s", webhook_url, exc)
+            return
+        import requests
+
+        try:
+            # Redirects could point anywhere, so they are not followed.
+            requests.post(webhook_url, json=payload, timeout=self._WEBHOOK_TIMEOUT, allow_redirects=False)
+        except requests.RequestException as exc:
+            self._logger.warning("Watchlist webhook %s failed: %s", webhook_url, exc)
+
+    def _check_webhook_url(self, webhook_url: str) -> None:
+        try:
+            parts = urlsplit(webhook_url)
+            host = (parts.hostname or "").lower()
+        except ValueError as exc:
+            raise ValueError("Invalid webhook URL") from exc
+        if parts.scheme not in ("http", "https") or not host:
+            raise ValueError("Webhook URL must be an http or https URL")
+        if host in self._LOCAL_HOSTS or host in self._webhook_allowed_hosts:
+            return
+        try:
+            if ipaddress.ip_address(host).is_loopback:
+                return
+        except ValueError:
+            pass
+        raise ValueError(f"Webhook host {host} is not local or allowed by WEBHOOK_ALLOWED_HOSTS")
+
+    def _rebuild(self) -> None:
+        watchlists = {}
+        predicates = {}
+        for watchlist in self.watchlist_manager.find_all():
+            try:
+                predicates[watchlist.id] = self.release_filter_parser.parse_filters(watchlist.filters)
+            except ValueError as exc:
+                # A filter saved before a parser change must not take the whole API down.
+                self._logger.warning("Skipping watchlist %s with invalid filters: %s", watchlist.id, exc)
+                continue
+            watchlists[watchlist.id] = watchlist
+        matcher = WatchlistMatcher({watchlist_id: item.query for watchlist_id, item in watchlists.items()})
+        with self._lock:
+            self._watchlists = watchlists
+            self._matcher = matcher
+            self._predicates = predicates
@@ -0,0 +1,73 @@
+import gc
+import time
+
+import pytest
+from pydantic import BaseModel
+
+from mircrewapi.mapper.controller.post_mapper import PostMapper
+from mircrewapi.mapper.service.post_mapper import PostMapper as ServicePostMapper
+from mircrewapi.model.client.post_result import PostResult
+from mircrewapi.model.controller.post_item import PostItem as ControllerPostItem
+from mircrewapi.model.controller.post_search_response import PostSearchResponse
+
+_RESULTS = 500
+_ROUNDS = 20
+
+
+class LegacyPostResult(BaseModel):
+    id: str
+    title: str
+    url: str
+
+
+class LegacyPostItem(BaseModel):
+    id: str
+    title: str
+    url: str
+
+
+def _legacy_pipeline(rows: list[tuple[str, str, str]]) -> PostSearchResponse:
+    client_items = [LegacyPostResult(id=row[0], title=row[1], url=row[2]) for row in rows]
+    service_items = [LegacyPostItem(id=item.id, title=item.title, url=item.url) for item in client_items]
+    controller_items = [
+        ControllerPostItem(id=item.id, title=item.title, url=item.url) for item in service_items
+    ]
+    return PostSearchResponse(query="bench", results=controller_items)
+
+
+def _record_pipeline(rows: list[tuple[str, str, str]]) -> PostSearchResponse:
+    client_items = [PostResult(id=row[0], title=row[1], url=row[2]) for row in rows]
+    service_items = ServicePostMapper().to_domain(client_items)
+    return PostMapper().to_response(query="bench", items=service_items)
+
+
+def _per_result_us(pipeline, rows) -> float:
+    pipeline(rows)
+    # Like timeit, keep the collector out of the measurement: when it kicks in
+    # depends on whatever the rest of the test session left alive.
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for _ in range(_ROUNDS):
+            pipeline(rows)
+        return (time.perf_counter() - started) / (_ROUNDS * len(rows)) * 1_000_000
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+@pytest.mark.benchmark
+def test_record_pipeline_mapping_cost_per_result():
+    rows = [
+        (str(index), f"Show S01E{index % 10:02d} 1080p WEB-DL x264", f"https://example.com/viewtopic.php?t={index}")
+        for index in range(_RESULTS)
+    ]
+
+    assert _legacy_pipeline(rows) == _record_pipeline(rows)
+
+    legacy = _per_result_us(_legacy_pipeline, rows)
+    records = _per_result_us(_record_pipeline, rows)
+    print(f"\nmapping cost per result: legacy={legacy:.2f}us records={records:.2f}us")
+
+    assert records < legacy
@@ -0,0 +1,62 @@
+import pytest
+
+from mircrewapi.client.mircrew_client import MircrewClient
+from mircrewapi.manager.cache_manager import CacheManager
+from mircrewapi.manager.metrics_manager import MetricsManager
+from mircrewapi.mapper.service.magnet_mapper import MagnetMapper
+from mircrewapi.mapper.service.post_mapper import PostMapper
+from mircrewapi.model.client.post_result import PostResult
+from mircrewapi.parser.query_normalizer import QueryNormalizer
+from mircrewapi.service.search_service import SearchService
+
+_QUERIES = [
+    "The Office", "the office", "THE OFFICE ", "The  Office!", "office",
+    "Città di Dio", "citta di dio", "Città  di  Dio",
+    "Breaking Bad", "breaking bad", "Breaking-Bad", "breaking bad ",
+    "La Casa di Carta", "la casa di carta", "Casa di Carta",
+]
+
+
+class CountingMircrewClient(MircrewClient):
+    def __init__(self):
+        super().__init__(username="user", password="pass")
+        self.searches = 0
+
+    def search_posts(self, query: str):
+        self.searches += 1
+        return [PostResult(id="1", title=f"{query} 1080p", url="https://example.com/viewtopic.php?t=1")]
+
+
+class RawQueryNormalizer(QueryNormalizer):
+    def normalize(self, query: str) -> str:
+        return query
+
+
+def _replay(tmp_path, normalizer: QueryNormalizer) -> tuple[float, int]:
+    client = CountingMircrewClient()
+    metrics_manager = MetricsManager()
+    service = SearchService(
+        client,
+        PostMapper(),
+        MagnetMapper(),
+        cache_manager=CacheManager(cache_dir=str(tmp_path)),
+        metrics_manager=metrics_manager,
+        query_normalizer=normalizer,
+    )
+    for query in _QUERIES:
+        service.search_posts(query)
+    hits = metrics_manager.counter("cache_hits_total", kind="search")
+    return hits / len(_QUERIES), client.searches
+
+
+@pytest.mark.benchmark
+def test_normalized_queries_raise_cache_hit_rate(tmp_path):
+    before, before_searches = _replay(tmp_path / "raw", RawQueryNormalizer())
+    after, after_searches = _replay(tmp_path / "normalized", QueryNormalizer())
+    print(
+        f"\nsearch cache hit rate: raw={before:.0%} ({before_searches} upstream searches) "
+        f"normalized={after:.0%} ({after_searches} upstream searches)"
+    )
+
+    assert after_searches == 4
+    assert after > before
@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta
+import gc
+import time
+
+import pytest
+from starlette.requests import Request
+
+from mircrewapi.controller.search_controller import SearchController
+from mircrewapi.mapper.controller.json_response_mapper import JsonResponseMapper
+from mircrewapi.mapper.controller.post_mapper import PostMapper
+from mircrewapi.model.record.release_info import ReleaseInfo
+from mircrewapi.model.service.cached_result import CachedResult
+from mircrewapi.model.service.post_item import PostItem
+
+_RESULTS = 500
+_ROUNDS = 50
+
+
+def _respond(result: CachedResult, offset: int, limit: int | None, fields: list[str] | None, compact: bool):
+    page, total = SearchController._page(result, offset, limit)
+    model = PostMapper().to_response(query="show", items=page.items, total=total, offset=offset)
+    request = Request({"type": "http", "method": "GET", "headers": []})
+    return JsonResponseMapper().to_response(request, model, page, fields, compact)
+
+
+def _timed_us(*args) -> tuple[float, int]:
+    body = _respond(*args).body
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for _ in range(_ROUNDS):
+            _respond(*args)
+        return (time.perf_counter() - started) / _ROUNDS * 1_000_000, len(body)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+@pytest.mark.benchmark
+def test_paged_compact_response_is_smaller_and_faster():
+    now = datetime.utcnow()
+    items = [
+        PostItem(
+            id=str(index),
+            title=f"Show S01E{index % 10:02d} 1080p WEB-DL x264 ITA ENG",
+            url=f"https://example.com/viewtopic.php?t={index}",
+            release=ReleaseInfo(resolution="1080p", codec="x264", source="web-dl", languages=("ita", "eng")),
+            cursor=index,
+        )
+        for index in range(_RESULTS)
+    ]
+    result = CachedResult(items=items, created_at=now, expires_at=now + timedelta(minutes=15))
+
+    full_us, full_bytes = _timed_us(result, 0, None, None, False)
+    page_us, page_bytes = _timed_us(result, 0, 20, ["id"], True)
+    print(f"\nsearch response: full={full_bytes}B {full_us:.0f}us, first page ids={page_bytes}B {page_us:.0f}us")
+
+    assert page_bytes * 20 < full_bytes
+    assert page_us * 5 < full_us
@@ -0,0 +1,130 @@
+import asyncio
+import time
+from urllib.parse import urlencode, urlparse
+
+from bs4 import BeautifulSoup
+from fastapi.testclient import TestClient
+import pytest
+
+from mircrewapi.client.mircrew_client import MircrewClient
+from mircrewapi.mock.mock_upstream_server import MockUpstreamServer
+
+_LOAD_LATENCY = 0.02
+_QUERIES = ("stranger things", "the office", "breaking bad", "dark")
+
+
+class FakeResponse:
+    def __init__(self, response):
+        self.status = response.status_code
+        self.headers = dict(response.headers)
+
+
+class FakeLocator:
+    def __init__(self, page: "FakePage", selector: str):
+        self.page = page
+        self.selector = selector
+
+    async def count(self) -> int:
+        return len(BeautifulSoup(self.page.html, "html.parser").select(self.selector))
+
+
+class FakePage:
+    """Just enough of a Playwright page to drive the client's search flows against the mock upstream."""
+
+    def __init__(self, upstream: TestClient):
+        self.upstream = upstream
+        self.html = ""
+        self.loads = 0
+        self.fields: dict[str, str] = {}
+
+    async def goto(self, url: str, wait_until: str | None = None) -> FakeResponse:
+        parsed = urlparse(url)
+        target = f"{parsed.path}?{parsed.query}" if parsed.query else parsed.path
+        return await self._load(target)
+
+    async def content(self) -> str:
+        return self.html
+
+    def locator(self, selector: str) -> FakeLocator:
+        return FakeLocator(self, selector)
+
+    async def wait_for_selector(self, selector: str, timeout: int | None = None) -> None:
+        if not await self.locator(selector).count():
+            raise TimeoutError(selector)
+
+    async def fill(self, selector: str, value: str) -> None:
+        self.fields[selector] = value
+
+    async def click(self, selector: str) -> None:
+        if selector == ".button-search":
+            await self._load(f"/search.php?{urlencode({'keywords': self.fields['#keywords'], 'sr': 'topics'})}")
+
+    async def wait_for_load_state(self, state: str | None = None) -> None:
+        return None
+
+    async def screenshot(self, **kwargs) -> None:
+        return None
+
+    async def _load(self, target: str) -> FakeResponse:
+        self.loads += 1
+        await asyncio.sleep(_LOAD_LATENCY)
+        response = self.upstream.get(target)
+        self.html = response.text
+        return FakeResponse(response)
+
+
+def _run_flow(client: MircrewClient, upstream: TestClient, flow) -> tuple[float, float, list]:
+    page = FakePage(upstream)
+    results = []
+    started = time.perf_counter()
+    for query in _QUERIES:
+        html = asyncio.run(flow(page, query))
+        results.append([post.id for post in client.parse_search_page(html)])
+    elapsed = time.perf_counter() - started
+    return page.loads / len(_QUERIES), elapsed / len(_QUERIES) * 1000, results
+
+
+@pytest.mark.benchmark
+def test_direct_search_url_saves_a_page_load_per_query():
+    upstream = TestClient(MockUpstreamServer().app)
+    client = MircrewClient(username="user", password="pass", base_url="http://mock.local")
+
+    form_loads, form_ms, form_results = _run_flow(client, upstream, client._search_via_form)
+    direct_loads, direct_ms, direct_results = _run_flow(client, upstream, client._search_in_page)
+    print(
+        f"\nbrowser search: form={form_loads:.0f} loads {form_ms:.1f}ms/query "
+        f"direct={direct_loads:.0f} loads {direct_ms:.1f}ms/query"
+    )
+
+    assert direct_results == form_results
+    assert (form_loads, direct_loads) == (2, 1)
+    assert direct_ms < form_ms
+
+
+def test_direct_search_falls_back_to_form_when_results_are_missing():
+    class NoDirectResultsPage(FakePage):
+        async def goto(self, url: str, wait_until: str | None = None) -> FakeResponse:
+            response = await super().goto(url, wait_until)
+            if "search.php" in url:
+                self.html = "<html><body>Sorry, search is unavailable</body></html>"
+            return response
+
+    upstream = TestClient(MockUpstreamServer().app)
+    client = MircrewClient(username="user", password="pass", base_url="http://mock.local")
+    page = NoDirectResultsPage(upstream)
+
+    html = asyncio.run(client._search_in_page(page, "dark"))
+
+    assert page.loads == 3
+    assert client.parse_search_page(html)
+
+
+def test_direct_search_accepts_the_no_results_page():
+    upstream = TestClient(MockUpstreamServer(results_per_query=0).app)
+    client = MircrewClient(username="user", password="pass", base_url="http://mock.local")
+    page = FakePage(upstream)
+
+    html = asyncio.run(client._search_in_page(page, "nothing here"))
+
+    assert page.loads == 1
+    assert client.parse_search_page(html) == []
@@ -0,0 +1,52 @@
+from datetime import timedelta
+import json
+import time
+
+import pytest
+
+from mircrewapi.manager.cache_manager import CacheManager
+from mircrewapi.manager.index_manager import IndexManager
+from mircrewapi.manager.snapshot_manager import SnapshotManager
+from mircrewapi.model.record.magnet_record import MagnetRecord
+from mircrewapi.model.record.post_record import PostRecord
+from mircrewapi.service.snapshot_service import SnapshotService
+
+_POSTS = 20000
+_MAGNETS_PER_POST = 3
+_CACHE_ENTRIES = 2000
+
+
+@pytest.mark.benchmark
+def test_snapshot_import_warms_a_node_within_seconds(tmp_path):
+    index_manager = IndexManager(db_path=str(tmp_path / "source" / "index.sqlite3"))
+    posts = [PostRecord(id=str(i), title=f"Show {i} S01E01 1080p WEB-DL x264 ITA", url=f"u{i}") for i in range(_POSTS)]
+    index_manager.record_posts(posts)
+    for post in posts:
+        index_manager.record_magnets(
+            post.id,
+            [
+                MagnetRecord(title=post.title, url="magnet:", infohash=f"{int(post.id):032x}{index:08x}")
+                for index in range(_MAGNETS_PER_POST)
+            ],
+        )
+    cache_manager = CacheManager(cache_dir=str(tmp_path / "source" / "cache"))
+    for index in range(_CACHE_ENTRIES):
+        cache_manager.set(f"search_show {index}", json.dumps([post.to_dict() for post in posts[:10]]), timedelta(hours=1))
+    source = SnapshotService(cache_manager, index_manager, SnapshotManager())
+    export = source.export_snapshot(str(tmp_path / "node.snap"))
+
+    target = SnapshotService(
+        CacheManager(cache_dir=str(tmp_path / "target" / "cache")),
+        IndexManager(db_path=str(tmp_path / "target" / "index.sqlite3")),
+        SnapshotManager(),
+    )
+    started = time.perf_counter()
+    report = target.import_snapshot(str(tmp_path / "node.snap"))
+    elapsed = time.perf_counter() - started
+    print(
+        f"\nsnapshot: {export.size_bytes / 1024:.0f}KiB {export.records}, "
+        f"export {export.duration_seconds:.2f}s, import {elapsed:.2f}s"
+    )
+
+    assert report.imported["magnets"] == _POSTS * _MAGNETS_PER_POST
+    assert elapsed < 10
@@ -0,0 +1,90 @@
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+_ROOT = Path(__file__).resolve().parents[2]
+_HEAVY_MODULES = ("camoufox", "bs4", "requests", "httpx", "uvicorn")
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+imported = time.perf_counter() - started
+heavy = [name for name in {heavy!r} if name in sys.modules]
+first_response = None
+if hasattr({module}, "app"):
+    from fastapi.testclient import TestClient
+    response_started = time.perf_counter()
+    assert TestClient({module}.app).get("/health").status_code == 200
+    first_response = time.perf_counter() - response_started
+print(json.dumps({{"import": imported, "first_response": first_response, "heavy": heavy}}))
+"""
+
+
+# Importing the API builds the real container; keep its files out of the worktree.
+_STATE_PATHS = {
+    "SESSION_DIR": "session",
+    "LOG_DIR": "log",
+    "CACHE_DIR": "cache",
+    "INDEX_PATH": "index/index.sqlite3",
+    "ARCHIVE_DIR": "archive",
+    "SUGGEST_SNAPSHOT_PATH": "index/suggest.json.gz",
+    "PROFILE_DIR": "profiles",
+}
+
+
+_CONTAINER_PROBE = """
+import json, os, threading
+from mircrewapi.command.mock_upstream_command import MockUpstreamCommand
+from mircrewapi.container.default_container import DefaultContainer
+DefaultContainer.getInstance().get(MockUpstreamCommand)
+files = sorted(os.path.relpath(os.path.join(root, name)) for root, _, names in os.walk(".") for name in names)
+print(json.dumps({{"files": files, "threads": sorted(thread.name for thread in threading.enumerate())}}))
+"""
+
+
+def _probe(module: str, state_dir: Path, script: str = _PROBE) -> dict:
+    env = {
+        **os.environ,
+        **{name: str(state_dir / path) for name, path in _STATE_PATHS.items()},
+        "PYTHONPATH": os.pathsep.join(filter(None, (str(_ROOT), os.environ.get("PYTHONPATH")))),
+    }
+    output = subprocess.run(
+        [sys.executable, "-c", script.format(module=module, heavy=_HEAVY_MODULES)],
+        cwd=state_dir,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_cli_import_is_lightweight(tmp_path):
+    result = _probe("mircrewapi.cli", tmp_path)
+    print(f"\ncli import: {result['import'] * 1000:.0f}ms")
+
+    assert result["heavy"] == []
+
+
+def test_api_starts_without_browser_or_http_client_imports(tmp_path):
+    result = _probe("mircrewapi.api", tmp_path)
+    print(
+        f"\napi import: {result['import'] * 1000:.0f}ms, "
+        f"first response: {result['first_response'] * 1000:.0f}ms"
+    )
+
+    assert result["heavy"] == []
+
+
+def test_commands_without_storage_do_not_open_it(tmp_path):
+    result = _probe("mircrewapi.cli", tmp_path, _CONTAINER_PROBE)
+
+    assert [path for path in result["files"] if not path.startswith("log")] == []
+    assert not {"cache-prune", "archive-prune", "memory-watchdog"} & set(result["threads"])
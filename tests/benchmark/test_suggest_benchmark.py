@@ -0,0 +1,26 @@
+import time
+
+import pytest
+
+from mircrewapi.manager.suggest_manager import SuggestManager
+
+_TITLES = 50000
+_LOOKUPS = 2000
+
+
+@pytest.mark.benchmark
+def test_suggest_lookup_stays_under_a_millisecond():
+    manager = SuggestManager(max_titles=_TITLES)
+    manager.add_titles(
+        f"Show {index % 997} S{index % 9 + 1:02d}E{index % 20 + 1:02d} 1080p WEB-DL x264 ITA"
+        for index in range(_TITLES)
+    )
+    prefixes = [f"show {index % 997}" for index in range(_LOOKUPS)]
+
+    started = time.perf_counter()
+    for prefix in prefixes:
+        manager.suggest(prefix)
+    per_lookup_ms = (time.perf_counter() - started) / _LOOKUPS * 1000
+    print(f"\nsuggest lookup: {per_lookup_ms:.4f}ms over {len(manager)} titles")
+
+    assert per_lookup_ms < 1
@@ -0,0 +1,155 @@
+from datetime import timedelta
+import json
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.concurrency import run_in_threadpool
+
+from mircrewapi.client.mircrew_client import MircrewClient
+from mircrewapi.controller.admin_controller import AdminController
+from mircrewapi.manager.cache_manager import CacheManager
+from mircrewapi.manager.metrics_manager import MetricsManager
+from mircrewapi.manager.profile_manager import ProfileManager
+from mircrewapi.middleware.profiling_middleware import ProfilingMiddleware
+from mircrewapi.middleware.server_timing_middleware import ServerTimingMiddleware
+from mircrewapi.service.admin_service import AdminService
+
+
+def _posts(*ids: str) -> str:
+    return json.dumps([{"id": post_id, "title": f"Post {post_id}", "url": f"https://x/?t={post_id}"} for post_id in ids])
+
+
+def _client(tmp_path, token: str = "secret") -> tuple[TestClient, CacheManager]:
+    cache_manager = CacheManager(cache_dir=str(tmp_path))
+    cache_manager.set("search_dune", _posts("1", "2"), timedelta(minutes=2))
+    cache_manager.set("search_alien", _posts("3"), timedelta(hours=3))
+    cache_manager.set("magnets_2", "[]", timedelta(days=10))
+    cache_manager.set("magnets_3", "[]", timedelta(seconds=-1))
+    (tmp_path / "mircrew_state.json").write_text("{}")
+    metrics_manager = MetricsManager()
+    metrics_manager.increment("cache_hits_total", 3, kind="search")
+    metrics_manager.increment("cache_misses_total", 1, kind="search")
+    service = AdminService(
+        cache_manager,
+        MircrewClient("user", "pass", cache_manager=cache_manager),
+        metrics_manager,
+        admin_token=token,
+    )
+    app = FastAPI()
+    app.include_router(AdminController(service).router)
+    return TestClient(app), cache_manager
+
+
+def test_admin_routes_require_the_token(tmp_path):
+    client, _ = _client(tmp_path)
+    assert client.get("/admin/cache").status_code == 401
+    assert client.get("/admin/cache", headers={"X-Admin-Token": "nope"}).status_code == 401
+
+    disabled, _ = _client(tmp_path / "disabled", token="")
+    assert disabled.get("/admin/cache", headers={"X-Admin-Token": ""}).status_code == 404
+
+
+def test_admin_cache_stats_report_kinds_expiry_and_hit_rates(tmp_path):
+    client, _ = _client(tmp_path)
+    stats = client.get("/admin/cache", headers={"X-Admin-Token": "secret"}).json()
+
+    assert stats["entries"] == 4
+    assert stats["kinds"]["search"]["entries"] == 2
+    assert stats["kinds"]["search"]["hit_rate"] == 0.75
+    assert stats["kinds"]["magnets"]["expired"] == 1
+    assert stats["expiry_distribution"] == {
+        "expired": 1, "<5m": 1, "<1h": 0, "<6h": 1, "<24h": 0, "<7d": 0, ">=7d": 1,
+    }
+    assert [entry["key"] for entry in stats["near_expiry"]] == ["search_dune"]
+
+    session = client.get("/admin/session", headers={"X-Admin-Token": "secret"}).json()
+    assert session["logged_in"] is False
+    assert session["state_file_age_seconds"] is not None
+    assert session["open_browsers"] == 0
+
+
+def test_admin_invalidates_by_post_id_prefix_and_pattern(tmp_path):
+    client, cache_manager = _client(tmp_path)
+    headers = {"X-Admin-Token": "secret"}
+
+    report = client.post("/admin/cache/invalidate", json={"post_id": "2"}, headers=headers).json()
+    assert report == {"deleted": 2, "keys": ["magnets_2", "search_dune"]}
+    assert cache_manager.get("search_alien") is not None
+
+    report = client.post("/admin/cache/invalidate", json={"pattern": "*alien*", "prefix": "magnets_"}, headers=headers)
+    assert report.json()["keys"] == ["magnets_3", "search_alien"]
+
+    assert client.post("/admin/cache/invalidate", json={}, headers=headers).status_code == 400
+
+
+def test_admin_allocation_snapshots_diff_growth(tmp_path):
+    client, _ = _client(tmp_path)
+    headers = {"X-Admin-Token": "secret"}
+
+    first = client.post("/admin/memory/snapshots", params={"label": "before"}, headers=headers).json()
+    retained = [bytearray(1024) for _ in range(2000)]
+    second = client.post("/admin/memory/snapshots", headers=headers).json()
+
+    diff = client.get(f"/admin/memory/snapshots/{first['id']}/diff/{second['id']}", headers=headers).json()
+    assert diff["first"]["label"] == "before"
+    assert any(entry["size_diff_bytes"] >= 1024 * 2000 for entry in diff["entries"])
+    assert client.get(f"/admin/memory/snapshots/{first['id']}/diff/999", headers=headers).status_code == 404
+
+    assert client.delete("/admin/memory/snapshots", headers=headers).status_code == 204
+    assert client.get("/admin/memory/snapshots", headers=headers).json() == []
+    assert client.get("/admin/memory", headers=headers).json()["process_rss"] > 0
+    del retained
+
+
+def test_flagged_request_is_profiled_and_downloadable(tmp_path):
+    cache_manager = CacheManager(cache_dir=str(tmp_path / "cache"))
+    metrics_manager = MetricsManager()
+    profile_manager = ProfileManager(store_dir=str(tmp_path / "profiles"), interval=0.001)
+    service = AdminService(
+        cache_manager,
+        MircrewClient("user", "pass", cache_manager=cache_manager),
+        metrics_manager,
+        admin_token="secret",
+        profile_manager=profile_manager,
+    )
+    app = FastAPI()
+    app.include_router(AdminController(service).router)
+
+    def parse_pages():
+        with metrics_manager.span("parse"):
+            deadline = time.perf_counter() + 0.1
+            while time.perf_counter() < deadline:
+                sum(range(100))
+
+    async def busy_route():
+        await run_in_threadpool(ProfileManager.bind(parse_pages))
+        return {"ok": True}
+
+    app.add_api_route("/busy", busy_route)
+    app.add_middleware(
+        ProfilingMiddleware,
+        profile_manager=profile_manager,
+        authorize=service.authorize,
+        metrics_manager=metrics_manager,
+    )
+    app.add_middleware(ServerTimingMiddleware, metrics_manager=metrics_manager)
+    client = TestClient(app)
+    headers = {"X-Admin-Token": "secret"}
+
+    assert "x-profile-id" not in client.get("/busy", headers={"X-Profile": "1"}).headers
+    profile_id = client.get("/busy", headers={**headers, "X-Profile": "1"}).headers["x-profile-id"]
+
+    listed = client.get("/admin/profiles", headers=headers).json()
+    assert [entry["id"] for entry in listed] == [profile_id]
+    assert listed[0]["trigger"] == "header"
+    assert listed[0]["samples"] > 0
+    profile = client.get(f"/admin/profiles/{profile_id}", headers=headers).json()
+    assert [span["name"] for span in profile["spans"]] == ["parse"]
+    folded = client.get(f"/admin/profiles/{profile_id}/folded", headers=headers)
+    assert "parse_pages" in folded.text
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in folded.text.splitlines())
+    assert client.get("/admin/profiles/0000000000000000", headers=headers).status_code == 404
+
+    assert client.delete("/admin/profiles", headers=headers).status_code == 204
+    assert client.get("/admin/profiles", headers=headers).json() == []
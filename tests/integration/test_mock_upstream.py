@@ -0,0 +1,80 @@
+from bs4 import BeautifulSoup
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from mircrewapi.client.mircrew_client import MircrewClient
+from mircrewapi.manager.metrics_manager import MetricsManager
+from mircrewapi.mock.mock_upstream_server import MockUpstreamServer
+from mircrewapi.service.load_test_service import LoadTestService
+
+
+def test_mock_upstream_search_pages_parse_with_client():
+    server = MockUpstreamServer(results_per_query=30, page_size=25)
+    upstream = TestClient(server.app)
+    client = MircrewClient(username="user", password="pass", base_url="http://mock.local/")
+
+    first_page = upstream.get("/search.php", params={"keywords": "stranger"}).text
+    second_page = upstream.get("/search.php", params={"keywords": "stranger", "start": 25}).text
+
+    first = client._parse_search_results(first_page)
+    second = client._parse_search_results(second_page)
+    assert len(first) + len(second) > 0
+    assert first[0].url.startswith("http://mock.local/viewtopic.php?t=")
+    assert 'rel="next"' in first_page
+    assert 'rel="next"' not in second_page
+
+
+def test_mock_upstream_login_and_topic_flow():
+    server = MockUpstreamServer()
+    upstream = TestClient(server.app)
+
+    assert MircrewClient._is_logged_in_html(upstream.get("/index.php").text) is False
+    login_form = upstream.get("/ucp.php", params={"mode": "login"}).text
+    assert 'name="form_token"' in login_form
+
+    upstream.post("/ucp.php", params={"mode": "login"}, follow_redirects=False)
+    assert MircrewClient._is_logged_in_html(upstream.get("/index.php").text) is True
+
+    topic = BeautifulSoup(upstream.get("/viewtopic.php", params={"t": "123456"}).text, "html.parser")
+    magnets = topic.select('.hidebox.unhide dd a[href^="magnet:"]')
+    assert len(magnets) == server.magnets_per_post
+    assert server.request_counts["viewtopic"] == 1
+
+
+def test_load_test_service_reports_latency_percentiles():
+    server = MockUpstreamServer()
+    service = LoadTestService(MetricsManager())
+
+    report = service.run(server.app, ["/search.php?keywords=x", "/index.php"], concurrency=4, total_requests=20)
+
+    assert report.requests == 20
+    assert report.failures == 0
+    assert 0 < report.p50_ms <= report.p95_ms <= report.p99_ms
+    assert report.browser_launches_per_request == 0
+
+
+def test_mock_upstream_serves_its_bundled_fixtures_from_any_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    upstream = TestClient(MockUpstreamServer().app)
+
+    assert upstream.get("/index.php").status_code == 200
+    assert upstream.get("/ucp.php", params={"mode": "login"}).status_code == 200
+
+
+def test_load_test_service_spreads_requests_over_client_ids():
+    app = FastAPI()
+    seen: list[tuple[str | None, str | None]] = []
+
+    @app.get("/probe")
+    async def probe(request: Request):
+        seen.append((request.headers.get("x-client-id"), request.headers.get("x-api-key")))
+        return {}
+
+    service = LoadTestService(MetricsManager())
+    service.run(app, ["/probe"], concurrency=2, total_requests=6, clients=3)
+    assert sorted({client_id for client_id, _ in seen}) == ["loadtest-0", "loadtest-1", "loadtest-2"]
+
+    seen.clear()
+    service.run(app, ["/probe"], concurrency=2, total_requests=4, api_key="k1")
+    assert {client_id for client_id, _ in seen} == {"loadtest-0", "loadtest-1"}
+    assert {api_key for _, api_key in seen} == {"k1"}
@@ -0,0 +1,83 @@
+from fastapi.testclient import TestClient
+
+from mircrewapi.client.mircrew_client import MircrewClient
+from mircrewapi.manager.index_manager import IndexManager
+from mircrewapi.manager.page_archive_manager import PageArchiveManager
+from mircrewapi.mapper.service.magnet_mapper import MagnetMapper
+from mircrewapi.mapper.service.post_mapper import PostMapper
+from mircrewapi.mock.mock_upstream_server import MockUpstreamServer
+from mircrewapi.service.reparse_service import ReparseService
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, text: str = "", headers: dict | None = None):
+        self.status_code = status_code
+        self.text = text
+        self.content = text.encode()
+        self.headers = headers or {}
+
+
+class FakeSession:
+    def __init__(self, response: FakeResponse):
+        self.response = response
+        self.requests: list[dict] = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(headers or {})
+        return self.response
+
+
+class ArchivedMircrewClient(MircrewClient):
+    def _ensure_login(self) -> None:
+        return None
+
+    def _extract_magnets(self, title, post_url):
+        raise AssertionError("browser flow should not run for a revalidated page")
+
+
+def test_archived_topic_is_revalidated_without_browser(tmp_path):
+    topic_html = TestClient(MockUpstreamServer().app).get("/viewtopic.php", params={"t": "123456"}).text
+    archive = PageArchiveManager(str(tmp_path / "archive"))
+    client = ArchivedMircrewClient(
+        username="user",
+        password="pass",
+        base_url="http://mock.local",
+        page_archive_manager=archive,
+    )
+    post_url = client.build_post_url("123456")
+    archive.store(post_url, topic_html, "topic", "123456", etag='"abc"')
+    session = FakeSession(FakeResponse(304))
+    client._http_session = session
+
+    magnets = client.get_magnets("123456")
+
+    assert len(magnets) == 3
+    assert magnets[0].infohash
+    assert session.requests[0]["if-none-match"] == '"abc"'
+
+
+def test_reparse_rebuilds_index_from_archive(tmp_path):
+    upstream = TestClient(MockUpstreamServer().app)
+    archive = PageArchiveManager(str(tmp_path / "archive"))
+    client = MircrewClient(username="user", password="pass", base_url="http://mock.local")
+    archive.store(
+        client._search_page_url("stranger"),
+        upstream.get("/search.php", params={"keywords": "stranger"}).text,
+        "search",
+        "stranger",
+    )
+    archive.store(
+        client.build_post_url("123456"),
+        upstream.get("/viewtopic.php", params={"t": "123456"}).text,
+        "topic",
+        "123456",
+    )
+    index_manager = IndexManager(str(tmp_path / "index.sqlite3"))
+
+    report = ReparseService(archive, client, index_manager, PostMapper(), MagnetMapper()).run()
+
+    assert (report.search_pages, report.topic_pages, report.missing_pages) == (1, 1, 0)
+    assert report.posts > 0
+    assert report.magnets == 3
+    magnet = client.parse_topic_page(archive.read(archive.get(client.build_post_url("123456"))))[0]
+    assert [post.id for post in index_manager.posts_for_magnet(magnet.infohash)] == ["123456"]
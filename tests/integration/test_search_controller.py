@@ -1,7 +1,12 @@
 import asyncio
 
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
 from mircrewapi.client.mircrew_client import MircrewClient
 from mircrewapi.controller.search_controller import SearchController
+from mircrewapi.manager.admission_manager import AdmissionManager
+from mircrewapi.manager.cache_manager import CacheManager
 from mircrewapi.mapper.controller.magnet_mapper import MagnetMapper
 from mircrewapi.mapper.controller.post_mapper import PostMapper
 from mircrewapi.mapper.service.magnet_mapper import MagnetMapper as ServiceMagnetMapper
@@ -44,3 +49,147 @@ def test_search_controller_magnets_response():
     assert response.post_url.endswith("t=456")
     assert len(response.results) == 1
     assert response.results[0].url.startswith("magnet:")
+
+
+def test_search_route_sets_etag_and_honors_if_none_match(tmp_path):
+    cache_manager = CacheManager(cache_dir=str(tmp_path))
+    service = SearchService(FakeMircrewClient(), ServicePostMapper(), ServiceMagnetMapper(), cache_manager)
+    controller = SearchController(service, PostMapper(), MagnetMapper())
+    app = FastAPI()
+    app.include_router(controller.router)
+    client = TestClient(app)
+
+    response = client.get("/search", params={"q": "query"})
+    assert response.status_code == 200
+    assert response.json()["results"][0]["id"] == "456"
+    assert response.headers["cache-control"].startswith("public, max-age=")
+    assert response.headers["age"] == "0"
+    etag = response.headers["etag"]
+
+    cached = client.get("/search", params={"q": "query"}, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    magnets = client.get("/post/456/magnets", headers={"If-None-Match": '"stale"'})
+    assert magnets.status_code == 200
+    assert magnets.json()["post_id"] == "456"
+
+
+def test_search_route_filters_and_sorts_on_release_metadata():
+    class ReleaseMircrewClient(FakeMircrewClient):
+        def search_posts(self, query: str):
+            return self._parse_search_results(
+                "<ul>"
+                '<li class="row"><a class="topictitle" href="/viewtopic.php?t=1">Show S02E01 720p x264</a></li>'
+                '<li class="row"><a class="topictitle" href="/viewtopic.php?t=2">Show S02E02 2160p x265</a></li>'
+                '<li class="row"><a class="topictitle" href="/viewtopic.php?t=3">Show S01E01 1080p x264</a></li>'
+                "</ul>"
+            )
+
+    service = SearchService(ReleaseMircrewClient(), ServicePostMapper(), ServiceMagnetMapper())
+    app = FastAPI()
+    app.include_router(SearchController(service, PostMapper(), MagnetMapper()).router)
+    client = TestClient(app)
+
+    response = client.get(
+        "/search",
+        params={"q": "show", "filter": ["resolution>=720p", "season=2"], "sort": "-resolution"},
+    )
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [item["id"] for item in results] == ["2", "1"]
+    assert results[0]["release"]["resolution"] == "2160p"
+
+    assert client.get("/search", params={"q": "show", "filter": "bogus"}).status_code == 400
+
+
+def test_search_route_since_returns_only_newer_posts(tmp_path):
+    from mircrewapi.manager.index_manager import IndexManager
+
+    class GrowingMircrewClient(FakeMircrewClient):
+        def __init__(self):
+            super().__init__()
+            self.posts = [PostResult(id="1", title="Show 1080p", url="https://example.com/viewtopic.php?t=1")]
+
+        def search_posts(self, query: str):
+            return list(self.posts)
+
+    upstream = GrowingMircrewClient()
+    index_manager = IndexManager(str(tmp_path / "index.sqlite3"))
+    service = SearchService(upstream, ServicePostMapper(), ServiceMagnetMapper(), index_manager=index_manager)
+    app = FastAPI()
+    app.include_router(SearchController(service, PostMapper(), MagnetMapper()).router)
+    client = TestClient(app)
+
+    first = client.get("/search", params={"q": "show"}).json()
+    cursor = first["cursor"]
+    assert first["results"][0]["cursor"] == cursor
+
+    assert client.get("/search", params={"q": "show", "since": cursor}).json()["results"] == []
+
+    upstream.posts.insert(0, PostResult(id="2", title="Show 720p", url="https://example.com/viewtopic.php?t=2"))
+    newer = client.get("/search", params={"q": "show", "since": cursor}).json()
+    assert [item["id"] for item in newer["results"]] == ["2"]
+    assert newer["cursor"] > cursor
+
+
+def test_search_route_pages_projects_and_compacts_the_cached_result(tmp_path):
+    class ManyPostsMircrewClient(FakeMircrewClient):
+        calls = 0
+
+        def search_posts(self, query: str):
+            self.calls += 1
+            return [
+                PostResult(id=str(index), title=f"Show {index} 1080p", url=f"https://example.com/viewtopic.php?t={index}")
+                for index in range(5)
+            ]
+
+    upstream = ManyPostsMircrewClient()
+    service = SearchService(upstream, ServicePostMapper(), ServiceMagnetMapper(), CacheManager(str(tmp_path)))
+    app = FastAPI()
+    app.include_router(SearchController(service, PostMapper(), MagnetMapper()).router)
+    client = TestClient(app)
+
+    first = client.get("/search", params={"q": "show", "limit": 2, "fields": "id,title"}).json()
+    assert first["results"] == [{"id": "0", "title": "Show 0 1080p"}, {"id": "1", "title": "Show 1 1080p"}]
+    assert (first["total"], first["offset"], first["next_offset"]) == (5, 0, 2)
+
+    last = client.get("/search", params={"q": "show", "offset": 4, "limit": 2, "fields": "id", "format": "compact"})
+    assert last.json()["columns"] == ["id"]
+    assert last.json()["results"] == [["4"]]
+    assert last.json()["next_offset"] is None
+    assert upstream.calls == 1
+
+    magnets = client.get("/post/456/magnets", params={"format": "compact"}).json()
+    assert magnets["columns"][:3] == ["title", "url", "infohash"]
+    assert magnets["results"][0][0] == "Magnet"
+
+    assert client.get("/search", params={"q": "show", "fields": "bogus"}).status_code == 400
+
+
+def test_search_route_admits_per_client_and_serves_cache_hits_without_limits(tmp_path):
+    cache_manager = CacheManager(cache_dir=str(tmp_path))
+    service = SearchService(FakeMircrewClient(), ServicePostMapper(), ServiceMagnetMapper(), cache_manager)
+    admission_manager = AdmissionManager(
+        clients=AdmissionManager.parse_clients("sonarr:secret"),
+        rate_per_minute=1,
+        burst=1,
+    )
+    controller = SearchController(service, PostMapper(), MagnetMapper(), admission_manager=admission_manager)
+    app = FastAPI()
+    app.include_router(controller.router)
+    client = TestClient(app)
+    headers = {"X-API-Key": "secret"}
+
+    assert client.get("/search", params={"q": "query"}, headers=headers).status_code == 200
+    assert client.get("/search", params={"q": "query"}, headers=headers).status_code == 200
+
+    limited = client.get("/post/456/magnets", headers=headers)
+    assert limited.status_code == 429
+    assert limited.headers["retry-after"] == "60"
+    assert client.get("/post/456/magnets", headers={"X-Client-Id": "other"}).status_code == 200
+    assert client.get("/search", params={"q": "query"}, headers={"X-API-Key": "wrong"}).status_code == 401
+
+    usage = {entry.name: entry for entry in admission_manager.usage()}
+    assert (usage["sonarr"].admitted, usage["sonarr"].cached, usage["sonarr"].rejected) == (1, 1, 1)
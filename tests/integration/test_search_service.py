@@ -1,8 +1,17 @@
+from datetime import timedelta
+
+import pytest
+
 from mircrewapi.client.mircrew_client import MircrewClient
+from mircrewapi.manager.cache_manager import CacheManager
+from mircrewapi.manager.circuit_breaker import UpstreamUnavailableError
+from mircrewapi.manager.index_manager import IndexManager
+from mircrewapi.manager.refresh_manager import RefreshManager
 from mircrewapi.mapper.service.magnet_mapper import MagnetMapper
 from mircrewapi.mapper.service.post_mapper import PostMapper
 from mircrewapi.model.client.post_result import PostResult
 from mircrewapi.model.client.search_result import SearchResult
+from mircrewapi.parser.magnet_parser import MagnetParser
 from mircrewapi.service.search_service import SearchService
 
 
@@ -33,3 +42,293 @@ def test_search_service_maps_magnets_to_domain():
     assert len(items) == 1
     assert items[0].title == "Magnet"
     assert items[0].url.startswith("magnet:")
+
+
+class BlockedMircrewClient(MircrewClient):
+    def __init__(self):
+        super().__init__(username="user", password="pass")
+
+    def search_posts(self, query: str):
+        raise UpstreamUnavailableError("blocked", retry_after=30)
+
+
+def test_search_service_serves_stale_cache_when_upstream_blocked(tmp_path):
+    cache_manager = CacheManager(cache_dir=str(tmp_path))
+    cache_manager.set(
+        "search_query",
+        '[{"id": "123", "title": "Title 1080p", "url": "https://example.com/viewtopic.php?t=123"}]',
+        ttl=timedelta(seconds=-1),
+    )
+    service = SearchService(BlockedMircrewClient(), PostMapper(), MagnetMapper(), cache_manager)
+
+    items = service.search_posts("query")
+
+    assert [item.id for item in items] == ["123"]
+    with pytest.raises(UpstreamUnavailableError):
+        service.search_posts("other")
+
+
+class SharedMagnetMircrewClient(MircrewClient):
+    def __init__(self):
+        super().__init__(username="user", password="pass")
+
+    def search_posts(self, query: str):
+        return [
+            PostResult(id="1", title="Show 1080p", url="https://example.com/viewtopic.php?t=1"),
+            PostResult(id="2", title="Show Repack 1080p", url="https://example.com/viewtopic.php?t=2"),
+        ]
+
+    def get_magnets(self, post_id: str):
+        parser = MagnetParser()
+        shared = "magnet:?xt=urn:btih:" + "a" * 40 + "&dn=Shared"
+        return [
+            parser.parse(shared, "Shared"),
+            parser.parse(shared + "&tr=udp%3A%2F%2Ftracker", "Shared again"),
+            parser.parse(f"magnet:?xt=urn:btih:{post_id * 40}", "Own"),
+        ]
+
+
+def test_search_service_indexes_magnets_by_infohash(tmp_path):
+    index_manager = IndexManager(db_path=str(tmp_path / "index.sqlite3"))
+    service = SearchService(
+        SharedMagnetMircrewClient(),
+        PostMapper(),
+        MagnetMapper(),
+        index_manager=index_manager,
+    )
+    service.search_posts("show")
+
+    assert len(service.get_magnets("1")) == 2
+    service.get_magnets("2")
+
+    magnet, posts = service.find_magnet("A" * 40)
+    assert magnet.display_name == "Shared"
+    assert [(post.id, post.title) for post in posts] == [("1", "Show 1080p"), ("2", "Show Repack 1080p")]
+    assert service.find_magnet("b" * 40) is None
+
+
+def test_new_posts_feed_watchlists_once(tmp_path):
+    from mircrewapi.manager.watchlist_manager import WatchlistManager
+    from mircrewapi.model.record.watchlist_record import WatchlistRecord
+    from mircrewapi.parser.release_filter_parser import ReleaseFilterParser
+    from mircrewapi.parser.release_title_parser import ReleaseTitleParser
+    from mircrewapi.service.watchlist_service import WatchlistService
+
+    db_path = str(tmp_path / "index.sqlite3")
+    watchlist_service = WatchlistService(
+        WatchlistManager(db_path),
+        ReleaseTitleParser(),
+        ReleaseFilterParser(),
+    )
+    wanted = watchlist_service.save_watchlist(
+        WatchlistRecord(id=None, name="hd", query="title", filters=["resolution>=1080p"])
+    )
+    watchlist_service.save_watchlist(
+        WatchlistRecord(id=None, name="sd", query="title", filters=["resolution<=720p"])
+    )
+    service = SearchService(
+        FakeMircrewClient(),
+        PostMapper(),
+        MagnetMapper(),
+        index_manager=IndexManager(db_path),
+        watchlist_service=watchlist_service,
+    )
+
+    service.search_posts("first")
+    service.search_posts("second")
+
+    matches = watchlist_service.matches_since(0)
+    assert [(match.watchlist_id, match.post_id) for match in matches] == [(wanted.id, "123")]
+    assert watchlist_service.matches_since(matches[-1].cursor) == []
+
+
+def test_watchlist_webhooks_are_restricted_to_local_hosts(tmp_path):
+    from mircrewapi.manager.watchlist_manager import WatchlistManager
+    from mircrewapi.model.record.watchlist_record import WatchlistRecord
+    from mircrewapi.parser.release_filter_parser import ReleaseFilterParser
+    from mircrewapi.parser.release_title_parser import ReleaseTitleParser
+    from mircrewapi.service.watchlist_service import WatchlistService
+
+    watchlist_service = WatchlistService(
+        WatchlistManager(str(tmp_path / "index.sqlite3")),
+        ReleaseTitleParser(),
+        ReleaseFilterParser(),
+        webhook_allowed_hosts=frozenset(("sonarr.lan",)),
+    )
+
+    for url in ("http://127.0.0.1:8989/hook", "http://localhost/hook", "https://[::1]/hook", "http://Sonarr.lan/x"):
+        watchlist_service.save_watchlist(WatchlistRecord(id=None, name="ok", query="title", webhook_url=url))
+    for url in ("http://169.254.169.254/latest", "https://example.com/hook", "file:///etc/passwd", "http://10.0.0.5/"):
+        with pytest.raises(ValueError):
+            watchlist_service.save_watchlist(WatchlistRecord(id=None, name="bad", query="title", webhook_url=url))
+
+
+def test_watchlist_with_a_filter_that_no_longer_parses_is_skipped(tmp_path):
+    from mircrewapi.manager.watchlist_manager import WatchlistManager
+    from mircrewapi.model.record.post_record import PostRecord
+    from mircrewapi.model.record.watchlist_record import WatchlistRecord
+    from mircrewapi.parser.release_filter_parser import ReleaseFilterParser
+    from mircrewapi.parser.release_title_parser import ReleaseTitleParser
+    from mircrewapi.service.watchlist_service import WatchlistService
+
+    watchlist_manager = WatchlistManager(str(tmp_path / "index.sqlite3"))
+    # Saved directly, as if the filter was valid under an older parser.
+    watchlist_manager.save(WatchlistRecord(id=None, name="old", query="title", filters=["language=klingon"]))
+    valid = watchlist_manager.save(WatchlistRecord(id=None, name="ok", query="title"))
+
+    watchlist_service = WatchlistService(watchlist_manager, ReleaseTitleParser(), ReleaseFilterParser())
+    matches = watchlist_service.process_posts([PostRecord(id="1", title="Title 1080p", url="https://x/?t=1")])
+
+    assert [match.watchlist_id for match in matches] == [valid.id]
+
+
+def test_top_search_results_are_prefetched_into_the_magnet_cache(tmp_path):
+    from mircrewapi.manager.metrics_manager import MetricsManager
+    from mircrewapi.manager.prefetch_manager import PrefetchManager
+    from mircrewapi.manager.upstream_budget import UpstreamBudget
+
+    class ListingMircrewClient(FakeMircrewClient):
+        def __init__(self):
+            super().__init__()
+            self.magnet_calls: list[str] = []
+
+        def search_posts(self, query: str):
+            return [
+                PostResult(id=str(post_id), title=f"Title {post_id} 1080p", url=f"https://example.com/?t={post_id}")
+                for post_id in (1, 2, 3)
+            ]
+
+        def get_magnets(self, post_id: str):
+            self.magnet_calls.append(post_id)
+            return [SearchResult(title="Magnet", url=f"magnet:?xt=urn:btih:{post_id}")]
+
+    class CountingCacheManager(CacheManager):
+        magnet_lookups = 0
+
+        def get(self, key, allow_stale=False):
+            if key.startswith("magnets_"):
+                self.magnet_lookups += 1
+            return super().get(key, allow_stale=allow_stale)
+
+    client = ListingMircrewClient()
+    metrics_manager = MetricsManager()
+    cache_manager = CountingCacheManager(cache_dir=str(tmp_path))
+    prefetch_manager = PrefetchManager(
+        top_k=2,
+        upstream_budget=UpstreamBudget(rate_per_minute=0, max_concurrency=2),
+        metrics_manager=metrics_manager,
+    )
+    service = SearchService(
+        client,
+        PostMapper(),
+        MagnetMapper(),
+        cache_manager=cache_manager,
+        metrics_manager=metrics_manager,
+        prefetch_manager=prefetch_manager,
+    )
+
+    service.search_posts("title")
+    prefetch_manager.join()
+    assert sorted(client.magnet_calls) == ["1", "2"]
+
+    lookups = cache_manager.magnet_lookups
+    service.search_posts("title")
+    prefetch_manager.join()
+    assert metrics_manager.counter("prefetch_total", result="queued") == 2
+    # A cached search does not rescan the magnet cache for its top posts.
+    assert cache_manager.magnet_lookups == lookups
+
+    service.get_magnets("1")
+    service.get_magnets("3")
+    assert sorted(client.magnet_calls) == ["1", "2", "3"]
+    assert metrics_manager.counter("magnet_requests_total") == 2
+    assert metrics_manager.counter("magnet_prefetch_hits_total") == 1
+
+
+def test_prefetch_is_skipped_without_budget_headroom():
+    from mircrewapi.manager.prefetch_manager import PrefetchManager
+    from mircrewapi.manager.upstream_budget import UpstreamBudget
+
+    prefetch_manager = PrefetchManager(top_k=3, upstream_budget=UpstreamBudget(rate_per_minute=0, max_concurrency=1))
+
+    assert prefetch_manager.submit("magnets_1", lambda: None) is False
+
+
+def test_claim_waits_only_briefly_for_a_running_prefetch():
+    import threading
+    import time
+
+    from mircrewapi.manager.prefetch_manager import PrefetchManager
+
+    started, release = threading.Event(), threading.Event()
+    prefetch_manager = PrefetchManager(top_k=1, claim_timeout=0.05)
+
+    def slow_fetch():
+        started.set()
+        release.wait(5)
+
+    assert prefetch_manager.submit("magnets_1", slow_fetch) is True
+    started.wait(5)
+    begun = time.monotonic()
+    prefetch_manager.claim("magnets_1")
+    assert time.monotonic() - begun < 1
+    release.set()
+    prefetch_manager.join()
+
+
+class ChangingMircrewClient(FakeMircrewClient):
+    def __init__(self):
+        super().__init__()
+        self.magnets = ["magnet:?xt=urn:btih:" + "a" * 40]
+
+    def get_magnets(self, post_id: str):
+        return [SearchResult(title="Magnet", url=url) for url in self.magnets]
+
+
+def test_magnet_ttl_grows_while_unchanged_and_resets_on_change(tmp_path):
+    client = ChangingMircrewClient()
+    cache_manager = CacheManager(cache_dir=str(tmp_path / "cache"))
+    refresh_manager = RefreshManager(
+        db_path=str(tmp_path / "index.sqlite3"),
+        bounds={"magnets": (timedelta(hours=1), timedelta(days=1))},
+        age_factor=0.0,
+    )
+    service = SearchService(
+        client,
+        PostMapper(),
+        MagnetMapper(),
+        cache_manager,
+        magnet_parser=MagnetParser(),
+        refresh_manager=refresh_manager,
+    )
+
+    def fetch_ttl() -> timedelta:
+        cache_manager.delete("magnets_123")
+        result = service.get_magnets_result("123")
+        return result.expires_at - result.created_at
+
+    assert fetch_ttl() == timedelta(hours=1)
+    assert fetch_ttl() == timedelta(hours=2)
+    client.magnets.append("magnet:?xt=urn:btih:" + "b" * 40)
+    assert fetch_ttl() == timedelta(hours=1)
+
+
+def test_equivalent_queries_share_a_cache_entry_but_search_what_was_typed(tmp_path):
+    class RecordingMircrewClient(FakeMircrewClient):
+        def __init__(self):
+            super().__init__()
+            self.queries: list[str] = []
+
+        def search_posts(self, query: str):
+            self.queries.append(query)
+            return super().search_posts(query)
+
+    client = RecordingMircrewClient()
+    service = SearchService(
+        client, PostMapper(), MagnetMapper(), CacheManager(cache_dir=str(tmp_path))
+    )
+
+    service.search_posts_result("  Il  Trono di Spade ")
+    service.search_posts_result("trono spade")
+
+    assert client.queries == ["Il Trono di Spade"]
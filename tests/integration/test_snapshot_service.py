@@ -0,0 +1,44 @@
+from datetime import timedelta
+
+from mircrewapi.manager.cache_manager import CacheManager
+from mircrewapi.manager.index_manager import IndexManager
+from mircrewapi.manager.snapshot_manager import SnapshotManager
+from mircrewapi.model.record.magnet_record import MagnetRecord
+from mircrewapi.model.record.post_record import PostRecord
+from mircrewapi.service.snapshot_service import SnapshotService
+
+
+def _node(root) -> SnapshotService:
+    return SnapshotService(
+        CacheManager(cache_dir=str(root / "cache")),
+        IndexManager(db_path=str(root / "index.sqlite3")),
+        SnapshotManager(),
+    )
+
+
+def test_snapshot_bootstraps_a_new_node(tmp_path):
+    source = _node(tmp_path / "source")
+    source.cache_manager.set("search_dune", '[{"id": "1"}]', timedelta(hours=1))
+    source.cache_manager.set("mircrew_cookie", "phpbb3_sid=secret", timedelta(hours=1))
+    source.index_manager.record_posts([PostRecord(id="1", title="Dune 2021 2160p", url="u1")])
+    source.index_manager.record_magnets(
+        "1",
+        [MagnetRecord(title="Dune", url="magnet:?xt=urn:btih:" + "a" * 40, infohash="a" * 40, trackers=("udp://t",))],
+    )
+    report = source.export_snapshot(str(tmp_path / "node.snap"))
+    assert report.records == {"cache": 1, "posts": 1, "magnets": 1, "post_magnets": 1}
+
+    target = _node(tmp_path / "target")
+    target.cache_manager.set("magnets_9", "[]", timedelta(hours=1))
+    imported = target.import_snapshot(str(tmp_path / "node.snap"))
+
+    assert imported.imported == {"cache": 1, "posts": 1, "magnets": 1, "post_magnets": 1}
+    assert target.cache_manager.get("search_dune").value == '[{"id": "1"}]'
+    assert target.cache_manager.get("mircrew_cookie") is None
+    assert target.cache_manager.get("magnets_9") is not None
+    assert target.index_manager.get_magnet("a" * 40).trackers == ("udp://t",)
+    assert [post.id for post in target.index_manager.posts_for_magnet("a" * 40)] == ["1"]
+    assert target.index_manager.cursors_for(["1"]) == {"1": 1}
+
+    again = target.import_snapshot(str(tmp_path / "node.snap"))
+    assert again.imported == {"cache": 0, "posts": 0, "magnets": 0, "post_magnets": 0}
@@ -0,0 +1,134 @@
+from xml.etree import ElementTree
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from mircrewapi.client.mircrew_client import MircrewClient
+from mircrewapi.controller.torznab_controller import TorznabController
+from mircrewapi.manager.admission_manager import AdmissionManager
+from mircrewapi.manager.cache_manager import CacheManager
+from mircrewapi.manager.index_manager import IndexManager
+from mircrewapi.mapper.controller.torznab_mapper import TorznabMapper
+from mircrewapi.mapper.service.magnet_mapper import MagnetMapper
+from mircrewapi.mapper.service.post_mapper import PostMapper
+from mircrewapi.model.client.post_result import PostResult
+from mircrewapi.parser.magnet_parser import MagnetParser
+from mircrewapi.parser.release_title_parser import ReleaseTitleParser
+from mircrewapi.service.search_service import SearchService
+from mircrewapi.service.torznab_service import TorznabService
+
+_NS = {"torznab": "http://torznab.com/schemas/2015/feed"}
+_TITLES = {
+    "1": "Show S01E01 1080p WEB-DL x264 ITA",
+    "2": "Show S01E02 720p HDTV x264 ITA",
+    "3": "Show (2020) 2160p UHD BluRay x265 ITA",
+}
+
+
+class IndexerMircrewClient(MircrewClient):
+    def __init__(self):
+        super().__init__(username="user", password="pass")
+        self.magnet_calls: list[str] = []
+
+    def search_posts(self, query: str):
+        return [
+            PostResult(id=post_id, title=title, url=f"https://example.com/viewtopic.php?t={post_id}")
+            for post_id, title in _TITLES.items()
+        ]
+
+    def get_magnets(self, post_id: str):
+        self.magnet_calls.append(post_id)
+        return [MagnetParser().parse(f"magnet:?xt=urn:btih:{post_id * 40}&xl=1048576", _TITLES[post_id])]
+
+
+def _client(
+    tmp_path,
+    max_fetches: int = 10,
+    api_key: str = "",
+    admission_manager: AdmissionManager | None = None,
+) -> tuple[TestClient, IndexerMircrewClient]:
+    upstream = IndexerMircrewClient()
+    search_service = SearchService(
+        upstream,
+        PostMapper(),
+        MagnetMapper(),
+        CacheManager(cache_dir=str(tmp_path / "cache")),
+        index_manager=IndexManager(db_path=str(tmp_path / "index.sqlite3")),
+        magnet_parser=MagnetParser(),
+    )
+    service = TorznabService(search_service, ReleaseTitleParser(), api_key=api_key, max_fetches=max_fetches)
+    app = FastAPI()
+    app.include_router(TorznabController(service, TorznabMapper(), admission_manager).router)
+    return TestClient(app), upstream
+
+
+def _items(response) -> list[ElementTree.Element]:
+    assert response.headers["content-type"].startswith("application/rss+xml")
+    return ElementTree.fromstring(response.content).findall("./channel/item")
+
+
+def _attr(item: ElementTree.Element, name: str) -> str:
+    return item.find(f"torznab:attr[@name='{name}']", _NS).get("value")
+
+
+def test_caps_lists_search_modes_and_categories(tmp_path):
+    client, _ = _client(tmp_path)
+    caps = ElementTree.fromstring(client.get("/torznab/api", params={"t": "caps"}).content)
+
+    assert caps.find("./searching/tv-search").get("supportedParams") == "q,season,ep"
+    assert {category.get("id") for category in caps.iter("category")} == {"2000", "5000"}
+
+
+def test_search_returns_magnets_and_answers_repeat_polls_locally(tmp_path):
+    client, upstream = _client(tmp_path)
+
+    items = _items(client.get("/torznab/api", params={"t": "search", "q": "show"}))
+    assert [item.findtext("title") for item in items] == list(_TITLES.values())
+    assert _attr(items[0], "infohash") == "1" * 40
+    assert _attr(items[0], "size") == "1048576"
+    assert [category.text for category in items[2].findall("category")] == ["2000", "2045"]
+    assert sorted(upstream.magnet_calls) == ["1", "2", "3"]
+
+    client.get("/torznab/api", params={"t": "search", "q": "show"})
+    rss = _items(client.get("/torznab/api", params={"t": "search"}))
+    assert sorted(upstream.magnet_calls) == ["1", "2", "3"]
+    assert len(rss) == 3
+
+
+def test_tvsearch_filters_episodes_and_bounds_upstream_fetches(tmp_path):
+    client, upstream = _client(tmp_path, max_fetches=1)
+
+    items = _items(client.get("/torznab/api", params={"t": "tvsearch", "q": "show", "season": 1, "ep": 2}))
+    assert [item.findtext("title") for item in items] == [_TITLES["2"]]
+
+    items = _items(client.get("/torznab/api", params={"t": "tvsearch", "q": "show"}))
+    assert len(upstream.magnet_calls) == 2
+    assert len(items) == 2
+
+
+def test_errors_are_torznab_xml(tmp_path):
+    client, _ = _client(tmp_path, api_key="key")
+
+    error = ElementTree.fromstring(client.get("/torznab/api", params={"t": "caps"}).content)
+    assert error.tag == "error" and error.get("code") == "100"
+    error = ElementTree.fromstring(client.get("/torznab/api", params={"t": "caps", "apikey": "kéy"}).content)
+    assert error.get("code") == "100"
+
+    error = ElementTree.fromstring(client.get("/torznab/api", params={"t": "music", "apikey": "key"}).content)
+    assert error.get("code") == "202"
+
+
+def test_upstream_searches_are_admitted_per_client(tmp_path):
+    admission_manager = AdmissionManager(rate_per_minute=1, burst=1)
+    client, _ = _client(tmp_path, admission_manager=admission_manager)
+    headers = {"X-Client-Id": "prowlarr"}
+
+    assert len(_items(client.get("/torznab/api", params={"t": "search", "q": "show"}, headers=headers))) == 3
+    assert len(_items(client.get("/torznab/api", params={"t": "search", "q": "show"}, headers=headers))) == 3
+    limited = client.get("/torznab/api", params={"t": "search", "q": "other"}, headers=headers)
+    assert limited.status_code == 429
+    assert limited.headers["retry-after"] == "60"
+    assert ElementTree.fromstring(limited.content).get("code") == "500"
+
+    usage = {entry.name: entry for entry in admission_manager.usage()}["client:prowlarr"]
+    assert (usage.admitted, usage.cached, usage.rejected) == (1, 1, 1)
@@ -0,0 +1,45 @@
+from mircrewapi.client.mircrew_client import MircrewClient
+from mircrewapi.manager.cache_manager import CacheManager
+from mircrewapi.mapper.service.magnet_mapper import MagnetMapper
+from mircrewapi.mapper.service.post_mapper import PostMapper
+from mircrewapi.model.client.post_result import PostResult
+from mircrewapi.model.client.search_result import SearchResult
+from mircrewapi.service.search_service import SearchService
+from mircrewapi.service.warm_service import WarmService
+
+
+class FlakyMircrewClient(MircrewClient):
+    def __init__(self):
+        super().__init__(username="user", password="pass")
+        self.calls: list[str] = []
+
+    def search_posts(self, query: str):
+        self.calls.append(query)
+        if query == "broken":
+            raise RuntimeError("upstream exploded")
+        return [PostResult(id="1", title=f"{query} 1080p", url="https://example.com/viewtopic.php?t=1")]
+
+    def get_magnets(self, post_id: str):
+        self.calls.append(f"post:{post_id}")
+        return [SearchResult(title="Magnet", url="magnet:?xt=urn:btih:1")]
+
+
+def test_warm_fills_cache_and_resumes_from_progress(tmp_path):
+    client = FlakyMircrewClient()
+    cache_manager = CacheManager(cache_dir=str(tmp_path / "cache"))
+    service = WarmService(SearchService(client, PostMapper(), MagnetMapper(), cache_manager))
+    progress = str(tmp_path / "progress.jsonl")
+    entries = ["show", "post:42", "broken", "show", ""]
+
+    report = service.run(entries, workers=3, progress_path=progress)
+
+    assert (report.total, report.succeeded, report.failed, report.skipped) == (3, 2, 1, 0)
+    assert report.failures == {"broken": "upstream exploded"}
+    assert cache_manager.get("search_show") is not None
+    assert cache_manager.get("magnets_42") is not None
+
+    client.calls.clear()
+    resumed = service.run(entries, workers=3, progress_path=progress)
+
+    assert client.calls == ["broken"]
+    assert (resumed.skipped, resumed.failed) == (2, 1)
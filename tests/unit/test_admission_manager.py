@@ -0,0 +1,126 @@
+import asyncio
+
+import pytest
+
+from mircrewapi.manager.admission_manager import AdmissionManager, AdmissionRejectedError
+from mircrewapi.manager.metrics_manager import MetricsManager
+from mircrewapi.model.record.client_identity_record import ClientIdentityRecord
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_identify_by_key_client_id_then_address():
+    manager = AdmissionManager(clients=AdmissionManager.parse_clients("sonarr:k1:3, radarr:k2"))
+
+    assert manager.identify("k1", "ignored", "10.0.0.1") == ClientIdentityRecord("sonarr", 3.0, keyed=True)
+    assert manager.identify(None, "abc", "10.0.0.1").name == "client:abc"
+    assert manager.identify(None, None, "10.0.0.1").name == "ip:10.0.0.1"
+    with pytest.raises(PermissionError):
+        manager.identify("nope", None, None)
+    with pytest.raises(ValueError):
+        AdmissionManager.parse_clients("broken")
+
+
+def test_busy_clients_share_slots_by_weight():
+    heavy = ClientIdentityRecord("heavy", weight=2.0, keyed=True)
+    light = ClientIdentityRecord("light", weight=1.0, keyed=True)
+    manager = AdmissionManager(slots=1, client_concurrency=1, rate_per_minute=0, max_queue=100)
+    order: list[str] = []
+
+    async def request(identity: ClientIdentityRecord) -> None:
+        async with manager.admit(identity):
+            order.append(identity.name)
+            await asyncio.sleep(0)
+
+    async def run() -> None:
+        await asyncio.gather(*(request(identity) for identity in [light] * 4 + [heavy] * 8))
+
+    asyncio.run(run())
+
+    assert order[:9].count("heavy") == 6
+    assert order[:9].count("light") == 3
+
+
+def test_rate_limit_and_full_queue_reject_with_retry_after():
+    clock = FakeClock()
+    metrics = MetricsManager()
+    client = ClientIdentityRecord("ip:1")
+    manager = AdmissionManager(
+        slots=1, rate_per_minute=6, burst=1, max_queue=1, clock=clock, metrics_manager=metrics
+    )
+
+    async def hold(identity: ClientIdentityRecord) -> None:
+        async with manager.admit(identity):
+            pass
+
+    async def run() -> None:
+        await hold(client)
+        with pytest.raises(AdmissionRejectedError) as rejected:
+            async with manager.admit(client):
+                pass
+        assert rejected.value.retry_after == 10
+
+        clock.now += 20
+        other = ClientIdentityRecord("ip:2")
+        async with manager.admit(other):
+            queued = asyncio.ensure_future(hold(client))
+            await asyncio.sleep(0)
+            clock.now += 20
+            with pytest.raises(AdmissionRejectedError, match="queued"):
+                async with manager.admit(client):
+                    pass
+        await queued
+
+    asyncio.run(run())
+
+    assert metrics.counter("client_requests_total", client="anonymous", result="rate_limited") == 1
+    assert metrics.counter("client_requests_total", client="anonymous", result="queue_full") == 1
+
+
+def test_waiting_past_max_wait_is_rejected_and_frees_the_queue():
+    client = ClientIdentityRecord("ip:1")
+    manager = AdmissionManager(slots=1, rate_per_minute=0, max_wait=0.01)
+
+    async def run() -> None:
+        async with manager.admit(ClientIdentityRecord("ip:2")):
+            with pytest.raises(AdmissionRejectedError, match="Timed out"):
+                async with manager.admit(client):
+                    pass
+        async with manager.admit(client) as waited:
+            assert waited >= 0
+
+    asyncio.run(run())
+
+    usage = {entry.name: entry for entry in manager.usage()}
+    assert usage["ip:1"].queued == 0
+    assert usage["ip:1"].rejected == 1
+    assert usage["ip:1"].admitted == 1
+
+
+def test_full_queue_rejection_does_not_spend_a_rate_token():
+    clock = FakeClock()
+    client = ClientIdentityRecord("ip:1")
+    manager = AdmissionManager(slots=1, rate_per_minute=6, burst=2, max_queue=1, clock=clock)
+
+    async def hold(identity: ClientIdentityRecord) -> None:
+        async with manager.admit(identity):
+            pass
+
+    async def run() -> None:
+        async with manager.admit(ClientIdentityRecord("ip:2")):
+            queued = asyncio.ensure_future(hold(client))
+            await asyncio.sleep(0)
+            with pytest.raises(AdmissionRejectedError, match="queued"):
+                async with manager.admit(client):
+                    pass
+        await queued
+        # The second burst token is still there for the next request.
+        await hold(client)
+
+    asyncio.run(run())
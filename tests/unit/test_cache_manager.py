@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
 
 from mircrewapi.manager.cache_manager import CacheManager
+from mircrewapi.model.service.cache_item import CacheItem
 
 
 def test_cache_manager_set_get(tmp_path, monkeypatch):
@@ -49,3 +50,42 @@ def test_cache_manager_expired(tmp_path, monkeypatch):
     monkeypatch.setattr(cache_module, "datetime", LaterDateTime)
 
     assert manager.get("token") is None
+
+
+def test_cache_manager_keys_do_not_collide(tmp_path):
+    manager = CacheManager(cache_dir=str(tmp_path))
+    manager.set("search_a/b", "slash", ttl=timedelta(hours=1))
+    manager.set("search_ab", "plain", ttl=timedelta(hours=1))
+
+    assert manager.get("search_a/b").value == "slash"
+    assert manager.get("search_ab").value == "plain"
+    assert len(list(tmp_path.glob("search_a*.json"))) == 2
+
+
+def test_legacy_entries_are_migrated_to_hashed_paths(tmp_path):
+    now = datetime.utcnow()
+    legacy = CacheItem(key="search_foo", value="[]", created_at=now, expires_at=now + timedelta(hours=1))
+    (tmp_path / "search_foo.json").write_text(legacy.model_dump_json())
+    (tmp_path / "mircrew_state.json").write_text("{}")
+
+    cache_manager = CacheManager(cache_dir=str(tmp_path))
+
+    assert cache_manager.get("search_foo").value == "[]"
+    assert not (tmp_path / "search_foo.json").exists()
+    assert (tmp_path / "mircrew_state.json").exists()
+    cache_manager.delete("search_foo")
+    assert [item.key for item, _ in cache_manager.iter_items()] == []
+
+
+def test_entries_past_stale_retention_are_pruned(tmp_path):
+    cache_manager = CacheManager(cache_dir=str(tmp_path), stale_retention=timedelta(hours=1))
+    cache_manager.set("search_stale", "[]", timedelta(minutes=-30))
+    cache_manager.set("search_dead", "[]", timedelta(hours=-2))
+    cache_manager.set("magnets_dead", "[]", timedelta(hours=-3))
+    cache_manager.set("search_fresh", "[]", timedelta(hours=1))
+
+    assert cache_manager.get("search_stale", allow_stale=True) is not None
+    assert cache_manager.get("search_dead", allow_stale=True) is None
+    assert sorted(item.key for item, _ in cache_manager.iter_items()) == ["search_fresh", "search_stale"]
+    assert cache_manager.prune() == 1
+    assert len(list(tmp_path.glob("*.json"))) == 2
@@ -0,0 +1,59 @@
+import pytest
+
+from mircrewapi.manager.circuit_breaker import CircuitBreaker, UpstreamUnavailableError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_circuit_breaker_opens_after_threshold():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, base_backoff=10, max_backoff=100, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(UpstreamUnavailableError) as exc_info:
+        breaker.before_request()
+    assert exc_info.value.retry_after == 10
+
+
+def test_circuit_breaker_half_open_allows_single_probe():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, base_backoff=10, max_backoff=100, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 10
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.before_request()
+    with pytest.raises(UpstreamUnavailableError):
+        breaker.before_request()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.before_request()
+
+
+def test_circuit_breaker_backoff_grows_exponentially():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, base_backoff=10, max_backoff=25, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.retry_after() == 10
+
+    clock.now = 10
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.retry_after() == 20
+
+    clock.now = 30
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.retry_after() == 25
@@ -0,0 +1,27 @@
+import base64
+
+from mircrewapi.parser.magnet_parser import MagnetParser
+
+_HEX = "c12fe1c06bba254a9dc9f519b335aa7c1367a88a"
+
+
+def test_parse_magnet_fields():
+    url = (
+        f"magnet:?xt=urn:btih:{_HEX.upper()}&dn=Show+S01E01+1080p&xl=734003200"
+        "&tr=udp%3A%2F%2Ftracker.one%3A1337&tr=udp%3A%2F%2Ftracker.two%3A80&tr=udp%3A%2F%2Ftracker.one%3A1337"
+    )
+    record = MagnetParser().parse(url, "Show")
+
+    assert record.infohash == _HEX
+    assert record.display_name == "Show S01E01 1080p"
+    assert record.size == 734003200
+    assert record.trackers == ("udp://tracker.one:1337", "udp://tracker.two:80")
+
+
+def test_base32_infohash_is_normalized_to_hex():
+    base32 = base64.b32encode(bytes.fromhex(_HEX)).decode()
+    parser = MagnetParser()
+
+    assert parser.parse(f"magnet:?xt=urn:btih:{base32}", "Show").infohash == _HEX
+    assert parser.normalize_infohash(base32.lower()) == _HEX
+    assert parser.normalize_infohash("not-a-hash") is None
@@ -0,0 +1,127 @@
+import asyncio
+import signal
+import sys
+from types import ModuleType, SimpleNamespace
+
+from mircrewapi.client.mircrew_client import MircrewClient
+from mircrewapi.manager.memory_watchdog import MemoryWatchdog
+
+MB = 1024 * 1024
+
+
+def _process(proc, pid: int, ppid: int, name: str, rss_kb: int, started: int = 1000) -> None:
+    directory = proc / str(pid)
+    directory.mkdir(exist_ok=True)
+    fields = [ppid, 1, 1, 0, -1] + [0] * 13 + [started]
+    directory.joinpath("stat").write_text(f"{pid} ({name}) S {' '.join(map(str, fields))}\n")
+    directory.joinpath("status").write_text(f"Name:\t{name}\nVmRSS:\t{rss_kb} kB\n")
+
+
+def _proc_tree(tmp_path):
+    proc = tmp_path / "proc"
+    proc.mkdir()
+    _process(proc, 100, 1, "python", 200 * 1024)
+    _process(proc, 200, 100, "camoufox-bin", 300 * 1024)
+    _process(proc, 201, 200, "Web Content (x)", 150 * 1024)
+    _process(proc, 300, 1, "unrelated", 999 * 1024)
+    return proc
+
+
+def test_sample_sums_rss_of_all_descendants(tmp_path):
+    watchdog = MemoryWatchdog(budget_bytes=400 * MB, proc_root=str(_proc_tree(tmp_path)), pid=100)
+
+    sample = watchdog.sample()
+
+    assert sample.process_rss == 200 * MB
+    assert sample.children == {200: 300 * MB, 201: 150 * MB}
+    assert sample.over_budget is True
+
+
+def test_check_terminates_leaked_browsers_only_when_none_are_open(tmp_path):
+    killed = []
+    watchdog = MemoryWatchdog(
+        budget_bytes=400 * MB,
+        proc_root=str(_proc_tree(tmp_path)),
+        pid=100,
+        kill=lambda pid, sig: killed.append((pid, sig)),
+    )
+
+    watchdog.check(browsers_open=lambda: 1)
+    assert killed == []
+
+    watchdog.check(browsers_open=lambda: 0)
+    assert killed == [(200, signal.SIGTERM)]
+
+
+def test_gate_gives_up_after_timeout_and_is_free_when_disabled(tmp_path):
+    proc = _proc_tree(tmp_path)
+    assert MemoryWatchdog(budget_bytes=0, proc_root=str(proc), pid=100).wait_for_headroom() == 0.0
+
+    gated = MemoryWatchdog(budget_bytes=MB, gate_timeout=0.05, proc_root=str(proc), pid=100)
+    assert gated.wait_for_headroom(poll=0.01) >= 0.05
+
+
+def test_leaked_browsers_under_the_driver_or_reparented_to_init_are_terminated(tmp_path):
+    proc = tmp_path / "proc"
+    proc.mkdir()
+    _process(proc, 100, 1, "python", 200 * 1024)
+    _process(proc, 150, 100, "node", 50 * 1024)
+    _process(proc, 200, 150, "camoufox-bin", 300 * 1024)
+    _process(proc, 201, 200, "camoufox-bin", 100 * 1024)
+    _process(proc, 250, 150, "camoufox-bin", 300 * 1024)
+    _process(proc, 300, 1, "camoufox-bin", 999 * 1024)
+    killed = []
+    watchdog = MemoryWatchdog(
+        budget_bytes=400 * MB,
+        proc_root=str(proc),
+        pid=100,
+        kill=lambda pid, sig: killed.append(pid),
+    )
+
+    watchdog.sample()
+    # The driver exits: its browser is reparented to init, the other one's pid is reused.
+    _process(proc, 200, 1, "camoufox-bin", 300 * 1024)
+    _process(proc, 250, 1, "camoufox-bin", 300 * 1024, started=5000)
+    (proc / "150" / "stat").unlink()
+
+    assert watchdog.terminate_leaked_browsers() == [200]
+    assert killed == [200]
+
+
+def test_browser_being_launched_is_not_taken_for_a_leak(tmp_path, monkeypatch):
+    proc = _proc_tree(tmp_path)
+    killed = []
+    watchdog = MemoryWatchdog(
+        budget_bytes=400 * MB,
+        proc_root=str(proc),
+        pid=100,
+        kill=lambda pid, sig: killed.append(pid),
+    )
+    client = MircrewClient(username="user", password="pass")
+    seen_during_launch = []
+
+    class _LaunchingCamoufox:
+        def __init__(self, **kwargs):
+            pass
+
+        async def __aenter__(self):
+            # The browser process (pid 200) already exists while the launch is awaited.
+            seen_during_launch.append(client.browsers_active())
+            watchdog.check(browsers_open=client.browsers_active)
+            return SimpleNamespace(contexts=[])
+
+        async def __aexit__(self, *exc_info):
+            return False
+
+    monkeypatch.setitem(sys.modules, "camoufox", ModuleType("camoufox"))
+    monkeypatch.setitem(sys.modules, "camoufox.async_api", SimpleNamespace(AsyncCamoufox=_LaunchingCamoufox))
+
+    async def _launch():
+        async with client._browser():
+            assert client.browsers_active() == 1
+
+    asyncio.run(_launch())
+
+    assert seen_during_launch == [1]
+    assert killed == []
+    assert client.browsers_active() == 0
@@ -0,0 +1,33 @@
+from mircrewapi.manager.metrics_manager import MetricsManager
+
+
+def test_metrics_manager_records_spans_and_counters():
+    manager = MetricsManager()
+    token = manager.begin_request()
+    with manager.span("page_goto"):
+        pass
+    manager.observe("page_goto", 0.2)
+    manager.increment("browser_launches_total")
+    spans = manager.end_request(token)
+
+    assert [name for name, _ in spans] == ["page_goto", "page_goto"]
+    assert manager.counter("browser_launches_total") == 1
+    assert "page_goto;dur=" in manager.server_timing(spans)
+
+    text = manager.render_prometheus()
+    assert 'mircrew_stage_duration_seconds_count{stage="page_goto"} 2' in text
+    assert 'mircrew_stage_duration_seconds_bucket{stage="page_goto",le="0.25"} 2' in text
+    assert "mircrew_browser_launches_total 1" in text
+
+
+def test_metrics_manager_disabled_is_noop():
+    manager = MetricsManager(enabled=False)
+    token = manager.begin_request()
+    with manager.span("page_goto"):
+        pass
+    manager.increment("browser_launches_total")
+
+    assert token is None
+    assert manager.end_request(token) == []
+    assert manager.counter("browser_launches_total") == 0
+    assert "stage=" not in manager.render_prometheus()
@@ -11,3 +11,16 @@ def test_is_logged_in_html_true():
 def test_is_logged_in_html_false():
     html = Path("tests/fixtures/index_logged_out.html").read_text()
     assert MircrewClient._is_logged_in_html(html) is False
+
+
+def test_is_challenge_response_detects_cloudflare_block():
+    html = "<html><title>Just a moment...</title><script src='/cdn-cgi/challenge-platform/x.js'></script></html>"
+    assert MircrewClient._is_challenge_response(403, html) is True
+    assert MircrewClient._is_challenge_response(None, html) is True
+
+
+def test_is_challenge_response_ignores_auth_failures():
+    html = Path("tests/fixtures/index_logged_out.html").read_text()
+    assert MircrewClient._is_challenge_response(403, html) is False
+    assert MircrewClient._is_challenge_response(200, html) is False
+    assert MircrewClient._is_challenge_response(None, "<title>Just a moment...</title>") is False
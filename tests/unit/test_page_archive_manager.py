@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta
+
+from mircrewapi.manager.page_archive_manager import PageArchiveManager
+
+
+def test_pages_are_content_addressed_and_round_trip(tmp_path):
+    archive = PageArchiveManager(str(tmp_path), codec="gzip")
+    html = "<html><body>Città 1080p</body></html>"
+
+    first = archive.store("https://x/viewtopic.php?t=1", html, "topic", "1", etag='"v1"')
+    second = archive.store("https://x/viewtopic.php?t=2", html, "topic", "2")
+
+    assert first.digest == second.digest
+    assert len(list((tmp_path / "blobs").rglob("*.gz"))) == 1
+    stored = archive.get("https://x/viewtopic.php?t=1")
+    assert stored.etag == '"v1"'
+    assert archive.read(stored) == html
+    assert [record.ref for record in archive.iter_pages("topic")] == ["1", "2"]
+    assert archive.get("https://x/missing") is None
+
+
+def test_replaced_pages_release_their_old_blob(tmp_path):
+    archive = PageArchiveManager(str(tmp_path), codec="gzip")
+    archive.store("https://x/search.php?keywords=a", "<html>v1</html>", "search", "a")
+    archive.store("https://x/search.php?keywords=b", "<html>shared</html>", "search", "b")
+    archive.store("https://x/search.php?keywords=c", "<html>shared</html>", "search", "c")
+
+    archive.store("https://x/search.php?keywords=a", "<html>v2</html>", "search", "a")
+    archive.store("https://x/search.php?keywords=b", "<html>v3</html>", "search", "b")
+
+    assert len(list((tmp_path / "blobs").rglob("*.gz"))) == 3
+    assert all(archive.read(record) is not None for record in archive.iter_pages())
+
+
+def test_prune_applies_age_and_byte_retention(tmp_path):
+    archive = PageArchiveManager(str(tmp_path), codec="gzip", max_age=timedelta(days=1))
+    archive.store("https://x/viewtopic.php?t=1", "<html>old</html>", "topic", "1")
+    archive.store("https://x/viewtopic.php?t=2", "<html>new</html>", "topic", "2")
+
+    assert archive.prune(now=datetime.utcnow() + timedelta(days=2)) == 2
+    assert list(archive.iter_pages()) == []
+    assert list((tmp_path / "blobs").rglob("*.gz")) == []
+
+    archive = PageArchiveManager(str(tmp_path / "budget"), codec="gzip")
+    for topic in range(4):
+        archive.store(f"https://x/viewtopic.php?t={topic}", f"<html>{'x' * 50}{topic}</html>", "topic", str(topic))
+    blob_size = next((tmp_path / "budget" / "blobs").rglob("*.gz")).stat().st_size
+    archive.close()
+    budgeted = PageArchiveManager(str(tmp_path / "budget"), codec="gzip", max_bytes=blob_size * 2)
+
+    assert budgeted.prune() == 2
+    assert [record.ref for record in budgeted.iter_pages()] == ["2", "3"]
@@ -0,0 +1,91 @@
+import threading
+import time
+
+import pytest
+
+from mircrewapi.manager.profile_manager import ProfileManager
+
+
+def _spin(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(100))
+
+
+def test_only_requests_past_the_threshold_are_kept(tmp_path):
+    manager = ProfileManager(store_dir=str(tmp_path), threshold=0.05, interval=0.001)
+
+    fast = manager.begin("GET", "/fast")
+    assert manager.end(fast, 200, []) is None
+
+    slow = manager.begin("GET", "/search")
+    _spin(0.15)
+    info = manager.end(slow, 200, [("search_fetch", 0.12)])
+
+    assert info.trigger == "threshold"
+    assert info.samples > 0
+    assert [entry.path for entry in manager.profiles()] == ["/search"]
+    profile = manager.profile(info.id)
+    assert profile.spans[0].name == "search_fetch"
+    assert any("_spin" in stack.stack for stack in profile.top_stacks)
+
+
+def test_samples_only_the_request_threads_including_waits(tmp_path):
+    manager = ProfileManager(store_dir=str(tmp_path), interval=0.001)
+    stop = threading.Event()
+    other_request = threading.Thread(target=lambda: [_spin(0.01) for _ in iter(stop.is_set, True)], name="other")
+    other_request.start()
+    browser_done = threading.Event()
+
+    def wait_for_browser():
+        browser_done.wait(0.1)
+
+    capture = manager.begin("GET", "/post/1/magnets", forced=True)
+    worker = threading.Thread(target=ProfileManager.bind(_spin), args=(0.1,), name="worker")
+    waiter = threading.Thread(target=ProfileManager.bind(wait_for_browser), name="waiter")
+    worker.start()
+    waiter.start()
+    worker.join()
+    waiter.join()
+    info = manager.end(capture, 200, [])
+    stop.set()
+    other_request.join()
+
+    lines = manager.folded(info.id).splitlines()
+    assert any(line.startswith("worker;") and "_spin" in line for line in lines)
+    assert any(line.startswith("waiter;") and "wait_for_browser" in line for line in lines)
+    assert not any(line.startswith("other;") for line in lines)
+    assert ProfileManager.bind(_spin) is _spin
+
+
+def test_store_keeps_the_newest_profiles(tmp_path):
+    manager = ProfileManager(store_dir=str(tmp_path), max_profiles=2)
+
+    ids = []
+    for index in range(3):
+        ids.append(manager.end(manager.begin("GET", f"/{index}", forced=True), 200, []).id)
+        time.sleep(0.01)
+
+    assert [entry.id for entry in manager.profiles()] == ids[:0:-1]
+    with pytest.raises(KeyError):
+        manager.profile(ids[0])
+    with pytest.raises(KeyError):
+        manager.folded("../etc/passwd")
+    assert manager.clear() == 2
+
+
+def test_profiles_are_written_off_the_ending_thread(tmp_path):
+    manager = ProfileManager(store_dir=str(tmp_path))
+    writers = []
+    write = manager._write
+
+    def recording_write(profile, stacks):
+        writers.append(threading.current_thread().name)
+        write(profile, stacks)
+
+    manager._write = recording_write
+    info = manager.end(manager.begin("GET", "/slow", forced=True), 200, [])
+
+    assert manager.flush(timeout=5) is True
+    assert writers == ["request-profiler"]
+    assert manager.profile(info.id).path == "/slow"
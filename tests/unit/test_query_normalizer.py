@@ -0,0 +1,15 @@
+from mircrewapi.parser.query_normalizer import QueryNormalizer
+
+
+def test_equivalent_spellings_share_one_canonical_form():
+    normalizer = QueryNormalizer()
+
+    variants = ["The Office", "the  office ", "THE OFFICE", "The Office!", "office"]
+    assert {normalizer.normalize(variant) for variant in variants} == {"office"}
+    assert normalizer.normalize("Città di Dio") == "citta dio"
+    assert normalizer.normalize("L'ora legale") == "ora legale"
+
+
+def test_stopword_only_queries_are_kept():
+    assert QueryNormalizer().normalize("The The") == "the the"
+    assert QueryNormalizer().normalize("  ?! ") == ""
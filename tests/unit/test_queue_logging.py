@@ -0,0 +1,42 @@
+import json
+import logging
+
+from mircrewapi.logger.bounded_queue_handler import BoundedQueueHandler
+from mircrewapi.logger.json_log_formatter import JsonLogFormatter
+from mircrewapi.logger.request_context import RequestContextFilter, request_id_var
+from mircrewapi.manager.metrics_manager import MetricsManager
+
+
+def _record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+
+def test_full_queue_drops_records_and_reports_them_later():
+    handler = BoundedQueueHandler(maxsize=2)
+    for index in range(5):
+        handler.handle(_record(f"line {index}"))
+
+    assert handler.dropped == 3
+    assert [handler.queue.get_nowait().getMessage() for _ in range(2)] == ["line 0", "line 1"]
+
+    handler.handle(_record("after"))
+    messages = [handler.queue.get_nowait().getMessage() for _ in range(2)]
+    assert messages == ["after", "Dropped 3 log records: logging queue was full"]
+
+
+def test_json_records_carry_request_id_and_stage_timings():
+    metrics_manager = MetricsManager()
+    token = request_id_var.set("req-1")
+    spans = metrics_manager.begin_request()
+    try:
+        metrics_manager.observe("page_goto", 0.25)
+        record = _record("searched")
+        RequestContextFilter().filter(record)
+    finally:
+        metrics_manager.end_request(spans)
+        request_id_var.reset(token)
+
+    payload = json.loads(JsonLogFormatter().format(record))
+    assert payload["message"] == "searched"
+    assert payload["request_id"] == "req-1"
+    assert payload["stages_ms"] == {"page_goto": 250.0}
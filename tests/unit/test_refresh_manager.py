@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from mircrewapi.manager.refresh_manager import RefreshManager
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = datetime(2024, 1, 1)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def _manager(tmp_path, clock) -> RefreshManager:
+    return RefreshManager(
+        db_path=str(tmp_path / "index.sqlite3"),
+        bounds={"magnets": (timedelta(hours=1), timedelta(hours=8))},
+        age_factor=0.0,
+        clock=clock,
+    )
+
+
+def test_interval_grows_while_unchanged_and_is_capped(tmp_path):
+    clock = FakeClock()
+    manager = _manager(tmp_path, clock)
+
+    ttls = [manager.next_ttl("magnets_1", "abc").total_seconds() / 3600 for _ in range(6)]
+
+    assert ttls == [1, 2, 4, 8, 8, 8]
+
+
+def test_change_resets_to_floor(tmp_path):
+    clock = FakeClock()
+    manager = _manager(tmp_path, clock)
+    for _ in range(3):
+        manager.next_ttl("magnets_1", "abc")
+
+    assert manager.next_ttl("magnets_1", "def") == timedelta(hours=1)
+    assert manager.next_ttl("magnets_1", "def") == timedelta(hours=2)
+
+
+def test_long_unchanged_posts_jump_towards_the_ceiling(tmp_path):
+    clock = FakeClock()
+    manager = RefreshManager(
+        db_path=str(tmp_path / "index.sqlite3"),
+        bounds={"magnets": (timedelta(hours=1), timedelta(days=7))},
+        clock=clock,
+    )
+    manager.next_ttl("magnets_1", "abc")
+    clock.now += timedelta(days=8)
+
+    assert manager.next_ttl("magnets_1", "abc") == timedelta(days=2)
+
+
+def test_unknown_kind_is_rejected(tmp_path):
+    with pytest.raises(KeyError):
+        _manager(tmp_path, FakeClock()).next_ttl("search_foo", "abc")
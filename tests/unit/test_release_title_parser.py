@@ -0,0 +1,95 @@
+import pytest
+
+from mircrewapi.parser.release_filter_parser import ReleaseFilterParser
+from mircrewapi.parser.release_title_parser import ReleaseTitleParser
+
+
+def test_parse_series_release():
+    info = ReleaseTitleParser().parse("Stranger Things S04E09 1080p NF WEB-DL H.264 ITA ENG")
+
+    assert info.resolution == "1080p"
+    assert info.codec == "x264"
+    assert info.source == "web-dl"
+    assert info.languages == ("ita", "eng")
+    assert (info.season, info.episode) == (4, 9)
+    assert info.year is None
+
+
+def test_parse_movie_release():
+    info = ReleaseTitleParser().parse("Dune (2021) 4K UHD BluRay HEVC HDR ITA")
+
+    assert info.resolution == "2160p"
+    assert info.codec == "x265"
+    assert info.source == "bluray"
+    assert info.year == 2021
+    assert info.season is None
+
+
+def test_parse_season_pack_and_quality():
+    parser = ReleaseTitleParser()
+    info = parser.parse("The Office Stagione 2 720p HDTV ITA")
+
+    assert info.season == 2
+    assert info.episode is None
+    assert parser.is_quality(info) is True
+    assert parser.is_quality(parser.parse("The Office DVDRip XviD")) is False
+
+
+def test_parse_underscore_and_glued_tokens():
+    parser = ReleaseTitleParser()
+
+    underscored = parser.parse("Film_1080p_x264")
+    assert (underscored.resolution, underscored.codec) == ("1080p", "x264")
+    glued = parser.parse("Serie.S01E02.DLMux1080p.ITA")
+    assert (glued.resolution, glued.source, glued.languages) == ("1080p", "web-dl", ("ita",))
+    assert (glued.season, glued.episode) == (1, 2)
+    assert parser.parse("Film iTALiAN AC3").languages == ("ita",)
+
+
+def test_quality_check_keeps_everything_the_keyword_scan_accepted():
+    parser = ReleaseTitleParser()
+
+    for title in ("Film_1080p_x264", "Serie.S01E02.DLMux1080p.ITA", "Film.x264AAC", "Remaster4K"):
+        assert parser.is_quality(parser.parse(title), title) is True
+    assert parser.is_quality(parser.parse("Film DVDRip"), "Film DVDRip") is False
+
+
+def test_release_filters_and_sort():
+    title_parser = ReleaseTitleParser()
+    filter_parser = ReleaseFilterParser()
+    predicate = filter_parser.parse_filters(["resolution>=1080p", "season=4", "language=ita"])
+
+    assert predicate(title_parser.parse("Show S04E01 2160p x265 ITA")) is True
+    assert predicate(title_parser.parse("Show S04E01 720p x264 ITA")) is False
+    assert predicate(title_parser.parse("Show S03E01 1080p x264 ITA")) is False
+    assert filter_parser.parse_sort("-resolution,year") == [("resolution", True), ("year", False)]
+
+    with pytest.raises(ValueError):
+        filter_parser.parse_filters(["codec>=x264"])
+    with pytest.raises(ValueError):
+        filter_parser.parse_sort("title")
+
+
+def test_text_filters_use_aliases_and_missing_resolution_sorts_last():
+    title_parser = ReleaseTitleParser()
+    filter_parser = ReleaseFilterParser()
+    hevc = filter_parser.parse_filters(["codec=hevc", "source=webdl"])
+
+    assert hevc(title_parser.parse("Show 1080p WEB-DL x265")) is True
+    assert hevc(title_parser.parse("Show 1080p WEB-DL x264")) is False
+    assert ReleaseFilterParser.sort_value(title_parser.parse("Show DVDRip"), "resolution") is None
+    with pytest.raises(ValueError):
+        filter_parser.parse_filters(["codec=mpeg"])
+
+
+def test_language_filter_uses_aliases():
+    title_parser = ReleaseTitleParser()
+    filter_parser = ReleaseFilterParser()
+    release = title_parser.parse("Film 2019 1080p BluRay x264 ITA GER")
+
+    assert filter_parser.parse_filters(["language=italian"])(release) is True
+    assert filter_parser.parse_filters(["language=deu"])(release) is True
+    assert filter_parser.parse_filters(["language=english"])(release) is False
+    assert filter_parser.parse_filters(["language!=fra"])(release) is True
+    with pytest.raises(ValueError, match="Unknown language"):
+        filter_parser.parse_filters(["language=klingon"])
@@ -0,0 +1,43 @@
+import pytest
+
+from mircrewapi.manager.snapshot_manager import SnapshotManager
+
+
+@pytest.mark.parametrize("codec", ["zstd", "gzip"])
+def test_snapshot_round_trips_sections(tmp_path, codec):
+    if codec == "zstd":
+        pytest.importorskip("zstandard")
+    manager = SnapshotManager(codec=codec)
+    path = tmp_path / "node.snap"
+
+    footer = manager.write(path, [("posts", ({"id": str(i)} for i in range(2500))), ("empty", [])])
+
+    assert [section["records"] for section in footer["sections"]] == [2500, 0]
+    with manager.read(path) as reader:
+        assert reader.footer["codec"] == codec
+        assert [record["id"] for record in reader.records("posts")] == [str(i) for i in range(2500)]
+        assert list(reader.records("empty")) == []
+        assert list(reader.records("missing")) == []
+
+
+def test_corrupt_or_foreign_files_are_rejected(tmp_path):
+    manager = SnapshotManager(codec="gzip")
+    path = tmp_path / "node.snap"
+    manager.write(path, [("posts", [{"id": "1"}, {"id": "2"}])])
+    data = bytearray(path.read_bytes())
+
+    data[12] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="corrupt"):
+        with manager.read(path):
+            pass
+
+    path.write_bytes(bytes(data[: len(data) // 2]))
+    with pytest.raises(ValueError, match="Not a snapshot"):
+        with manager.read(path):
+            pass
+
+    path.write_bytes(b"")
+    with pytest.raises(ValueError, match="Not a snapshot"):
+        with manager.read(path):
+            pass
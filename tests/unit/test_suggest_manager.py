@@ -0,0 +1,51 @@
+import gzip
+import json
+
+from mircrewapi.manager.suggest_manager import SuggestManager
+
+
+def test_suggest_matches_title_and_word_prefixes():
+    manager = SuggestManager()
+    manager.add_titles(["The Office S01E01 1080p", "Officer Down 720p", "Breaking Bad S05 2160p"])
+
+    assert manager.suggest("the off") == ["The Office S01E01 1080p"]
+    assert manager.suggest("offic") == ["The Office S01E01 1080p", "Officer Down 720p"]
+    assert manager.suggest("bad s05", limit=1) == ["Breaking Bad S05 2160p"]
+    assert manager.suggest("  ") == []
+
+
+def test_least_recently_seen_titles_are_evicted():
+    manager = SuggestManager(max_titles=2)
+    manager.add_titles(["Alpha", "Beta"])
+    manager.add_titles(["Alpha", "Gamma"])
+
+    assert len(manager) == 2
+    assert manager.suggest("beta") == []
+    assert manager.suggest("alpha") == ["Alpha"]
+
+
+def test_snapshot_survives_restart(tmp_path):
+    snapshot = tmp_path / "suggest.json.gz"
+    manager = SuggestManager(snapshot_path=str(snapshot))
+    manager.add_titles(["Città di Dio 1080p"])
+    manager.save()
+
+    restored = SuggestManager(snapshot_path=str(snapshot))
+    assert restored.suggest("citta") == ["Città di Dio 1080p"]
+
+
+def test_malformed_snapshot_is_ignored(tmp_path):
+    snapshot = tmp_path / "suggest.json.gz"
+    with gzip.open(snapshot, "wt", encoding="utf-8") as handle:
+        json.dump(["not", "a", "snapshot"], handle)
+
+    assert len(SuggestManager(snapshot_path=str(snapshot))) == 0
+
+
+def test_due_snapshot_is_written_in_the_background(tmp_path):
+    snapshot = tmp_path / "suggest.json.gz"
+    manager = SuggestManager(snapshot_path=str(snapshot), save_interval=0)
+    manager.add_titles(["Alpha 1080p"])
+    manager._save_thread.join(timeout=5)
+
+    assert SuggestManager(snapshot_path=str(snapshot)).suggest("alpha") == ["Alpha 1080p"]
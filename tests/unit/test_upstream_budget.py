@@ -0,0 +1,36 @@
+from mircrewapi.manager.upstream_budget import UpstreamBudget
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def test_bucket_allows_burst_then_paces_to_the_rate():
+    clock = FakeClock()
+    budget = UpstreamBudget(rate_per_minute=60, burst=2, clock=clock, sleep=clock.sleep)
+
+    for _ in range(2):
+        with budget.acquire() as waited:
+            assert waited == 0
+    with budget.acquire() as waited:
+        assert waited == 1.0
+    assert clock.slept == [1.0]
+
+
+def test_zero_rate_only_caps_concurrency():
+    clock = FakeClock()
+    budget = UpstreamBudget(rate_per_minute=0, clock=clock, sleep=clock.sleep)
+
+    for _ in range(10):
+        with budget.acquire():
+            pass
+    assert clock.slept == []
@@ -0,0 +1,16 @@
+from mircrewapi.matcher.watchlist_matcher import WatchlistMatcher
+
+
+def test_matches_every_watchlist_whose_terms_all_occur():
+    matcher = WatchlistMatcher({1: "The Office", 2: "office 1080p", 3: "Città"})
+
+    assert matcher.match("The.Office.US.S01E01.1080p.WEB-DL") == {1, 2}
+    assert matcher.match("Office Space 720p") == set()
+    assert matcher.match("La Citta Incantata 1080p") == {3}
+
+
+def test_terms_match_whole_words_only():
+    matcher = WatchlistMatcher({1: "she"})
+
+    assert matcher.match("Ushers Live") == set()
+    assert matcher.match("She-Hulk S01E02") == {1}